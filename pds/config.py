@@ -15,7 +15,23 @@ SERVER_CONFIG = {
     'encoding': 'utf-8',
     'delimiter': '\n',
     'independent_mode': True,     # Main Server와 완전 독립
-    'auto_connect_redwing': True  # RedWing에 자동 연결
+    'auto_connect_redwing': True, # RedWing에 자동 연결
+    'binary_protocol': False,     # RedWing으로 보내는 제스처 이벤트를 고정 길이 바이너리 프레임으로 전송 (RedWing 서버는 JSON/바이너리 모두 수신)
+    'debug_display': True,        # GUI 창/오버레이 표시 (헤드리스 운영 시 False)
+    'display_every_n_frames': 1,  # N프레임마다 한 번만 오버레이 그리기 + imshow
+    'skeleton_draw_every_n_frames': 2,  # 스켈레톤은 N프레임마다 다시 그리고 사이 프레임은 캐시된 패치를 복사
+    'gesture_loop_cpu': None,     # 제스처 인식 루프를 고정할 CPU 코어 (None: 고정 안 함)
+    'gesture_loop_nice': 0,       # 제스처 인식 루프 nice 값 (음수는 root 권한 필요)
+    'standby_redraw_interval': 5.0,  # 대기 화면 재표시 주기 (초)
+    'pose_input_short_side': 256, # MediaPipe 입력 축소 목표 (짧은 변 px, 320px 이하 프레임은 그대로, None: 축소 안 함)
+    'pose_worker': True,          # 실시간 카메라는 MediaPipe를 전용 워커 스레드에서 실행 (데모 영상은 프레임 단위 정답 비교를 위해 인라인)
+    'gpu_pose_normalize': True,   # CUDA PyTorch 백엔드: 원시 자세만 GPU로 올리고 정규화/윈도우 구성은 GPU에서 수행
+    'cpu_int8_onnx': False,       # CUDA가 없으면 'torch' 백엔드 대신 INT8 동적 양자화 ONNX 모델을 onnxruntime CPU로 실행 (evaluate_model.py의 INT8 ONNX 정확도 비교 통과 후 켜기)
+    'cpu_int8_torch': False,      # CPU PyTorch 백엔드(INT8 ONNX 미사용 시) 분류 헤드 Linear를 INT8 동적 양자화 (evaluate_model.py의 INT8 정확도 비교 통과 후 켜기)
+    'torchscript': True,          # PyTorch 백엔드 TorchScript trace/최적화 사용
+    'predict_stride': 3,          # TCN 추론 간격 (프레임, 사이 프레임은 직전 예측 재사용)
+    'detector_backend': 'torch',  # TCN 추론 백엔드: 'torch' | 'openvino' (x86 CPU 가속) | 'onnx' (onnxruntime) | 'tensorrt' (CUDA FP16)
+    'onnx_providers': ['TensorrtExecutionProvider', 'CUDAExecutionProvider', 'CPUExecutionProvider']  # 설치된 것만 우선순위대로 사용
 }
 
 # TCN 모델 설정
@@ -31,12 +47,23 @@ TCN_CONFIG = {
 # 데이터 처리 설정
 DATA_CONFIG = {
     'fps': 30,                   # 프레임 레이트
+    'target_fps': 30,            # 전처리 리샘플링 목표 FPS (실시간 추론 FPS와 맞춰야 함)
     'normalize': True,           # 데이터 정규화 여부
     'window_size': 30,           # 슬라이딩 윈도우 크기
     'stride': 5,                 # 윈도우 이동 간격
     'filter_confidence': 0.5,    # 관절 신뢰도 임계값
     'min_detection_confidence': 0.5,
-    'min_tracking_confidence': 0.5
+    'min_tracking_confidence': 0.5,
+    'model_complexity': 0,       # 전처리용 MediaPipe 모델 (0: lite, 실시간 서버와 동일하게 유지)
+    'smooth_landmarks': False,   # 전처리에서는 랜드마크 스무딩 비활성화
+    'decode_queue_size': 8,      # 디코딩 스레드 → 자세 추론 프레임 큐 크기 (전처리)
+    'num_workers': None,         # 전처리 프로세스 수 (None이면 CPU 코어 수)
+    'worker_threads': 1,         # 전처리 워커당 OpenCV/OpenMP 스레드 수
+    'dataset_store': {           # 통합 데이터 저장소 (processed_data 루트 기준, memmap으로 로드)
+        'windows': 'windows.npy',
+        'labels': 'labels.npy',
+        'manifest': 'dataset_manifest.json'
+    }
 }
 
 # MediaPipe 관절 설정 (33개 → 17개 주요 관절)
@@ -59,7 +86,14 @@ MEDIAPIPE_CONFIG = {
         28,  # right_ankle
         29,  # left_heel
         32   # right_heel
-    ]
+    ],
+    # 실시간 검출용 MediaPipe Pose 설정
+    # 0 (Lite): complexity 1 대비 약 2배 빠르고 정확도 손실은 작음 (17개 주요 관절만 사용)
+    # 기존 체크포인트는 complexity 1 자세로 학습되었으므로, 실시간 입력과 맞추려면
+    # complexity 0으로 다시 전처리(preprocessor.py)한 데이터로 모델을 재학습해야 함
+    'model_complexity': 0,
+    'min_detection_confidence': 0.5,
+    'min_tracking_confidence': 0.5  # 낮추면 (예: 0.3) 추적 실패 시 재검출 빈도 감소
 }
 
 # 제스처 클래스 정의
@@ -161,7 +195,12 @@ NETWORK_CONFIG = {
     'redwing_connect_delay': 3.0,
     'heartbeat_interval': 30.0,
     'reconnect_on_failure': True,
-    'connection_timeout': 10.0
+    'connection_timeout': 10.0,
+    'tcp_nodelay': True,       # 작은 JSON 이벤트를 Nagle 지연 없이 즉시 전송
+    'tcp_keepalive': True,     # 응답 없는 상대를 커널이 감지
+    'tcp_keepidle': 30,        # 유휴 후 첫 keepalive 전송까지 (초, Linux)
+    'tcp_keepintvl': 10,       # keepalive 재전송 간격 (초, Linux)
+    'tcp_keepcnt': 3           # 연결 끊김 판정까지 재전송 횟수 (Linux)
 }
 
 def get_port_info():
@@ -179,6 +218,9 @@ def get_port_info():
 # 모델 및 데이터 경로
 PATHS = {
     'model_file': 'models/tcn_gesture_model.pth',
+    'onnx_model_file': 'models/tcn_gesture_model.onnx',  # 서버 추론용 고정 입력 크기 ONNX
+    'onnx_int8_model_file': 'models/tcn_gesture_model.int8.onnx',  # CPU 추론용 INT8 동적 양자화 ONNX
+    'tensorrt_engine_file': 'models/tcn_gesture_model.trt',  # ONNX로부터 빌드한 TensorRT FP16 엔진 (GPU별로 다시 빌드)
     'raw_data': '../pose_data_rotated',  # 회전된 데이터 사용
     'processed_data': '../processed_pose_data_rotated',  # 회전된 데이터용 새 처리 폴더
     'logs': 'logs'  # pds 폴더 기준 상대경로 (일관된 로그 위치 보장)
@@ -192,7 +234,10 @@ TRAINING_CONFIG = {
     'train_test_split': 0.8,
     'early_stopping_patience': 15,
     'device': 'cuda',  # 'cuda' or 'cpu'
-    'num_workers': 4
+    'num_workers': None,      # None이면 CPU 코어 수의 절반
+    'prefetch_factor': 4,     # 워커당 선행 로딩 배치 수
+    'mixed_precision': True,  # bf16 autocast (bf16 지원 GPU에서만)
+    'compile_model': True     # torch.compile (CUDA에서만)
 }
 
 # 🎬 데모 영상 모드 설정
@@ -204,6 +249,10 @@ DEMO_VIDEO_CONFIG = {
     'video_selection': 'random',        # 'random' 또는 'sequential'
     'loop_demo': True,                  # 데모 반복 여부
     'gesture_change_delay': 0.5,        # 제스처 변경시 대기 시간(초)
+    'preload_frames': False,            # 디코딩한 프레임을 백그라운드에서 영상 옆 .npy에 저장하고, 완성 후부터 memmap으로 재생
+    'preload_max_bytes': 1024 ** 3,     # 디코딩된 프레임 캐시 최대 크기 (초과 시 VideoCapture로 직접 재생)
+    'reader_thread': True,              # 읽기 스레드가 프레임을 미리 디코딩해 큐에 채움 (추론과 겹쳐 실행)
+    'reader_queue_size': 2,             # 읽기 큐 최대 길이 (가득 차면 읽기 스레드가 대기)
 }
 
 # 로깅 설정
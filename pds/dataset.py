@@ -10,9 +10,9 @@ import numpy as np
 import os
 import json
 from pathlib import Path
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
 from sklearn.model_selection import train_test_split
-from config import GESTURE_CLASSES, PATHS, TRAINING_CONFIG
+from config import GESTURE_CLASSES, PATHS, TRAINING_CONFIG, DATA_CONFIG
 
 class GestureDataset(Dataset):
     """제스처 데이터셋"""
@@ -34,19 +34,37 @@ class GestureDataset(Dataset):
         self.split = split
         self.transform = transform
         
-        # 데이터 로드
-        self.data_paths, self.labels = self._load_data_paths()
+        # 데이터 로드 (통합 memmap 저장소 우선, 없으면 영상별 .npz 연결)
+        self.windows, self.labels = self._load_store() or self._load_windows()
+        self.indices = np.arange(len(self.labels))
         
         # Train/Test 분할
         if split in ['train', 'test']:
             self._split_data(test_size, random_state)
     
-    def _load_data_paths(self) -> Tuple[List[str], List[int]]:
-        """데이터 파일 경로와 라벨 로드"""
-        data_paths = []
+    def _load_store(self) -> Optional[Tuple[np.ndarray, List[int]]]:
+        """통합 저장소를 memmap으로 열기 (파일 한 번만 열고 샘플은 페이지 캐시에서 바로 인덱싱)"""
+        store = DATA_CONFIG['dataset_store']
+        windows_path = self.data_root / store['windows']
+        labels_path = self.data_root / store['labels']
+        
+        if not (windows_path.exists() and labels_path.exists()):
+            return None
+        
+        windows = np.load(windows_path, mmap_mode='r')  # shape: (N, 30, 17, 2), FP16
+        labels = np.load(labels_path).tolist()
+        
+        for gesture_id, gesture_name in GESTURE_CLASSES.items():
+            print(f"{gesture_name}: {labels.count(gesture_id)}개 샘플")
+        print(f"총 {len(labels)}개 샘플 로드 완료 (memmap: {windows_path})")
+        return windows, labels
+    
+    def _load_windows(self) -> Tuple[np.ndarray, List[int]]:
+        """영상별 .npz 파일을 읽어 윈도우 배열과 라벨 로드"""
+        window_chunks = []
         labels = []
         
-        # 각 제스처 폴더에서 .npy 파일 수집
+        # 각 제스처 폴더에서 .npz 파일 수집 (파일당 영상 하나의 모든 윈도우)
         for gesture_id, gesture_name in GESTURE_CLASSES.items():
             gesture_folder = self.data_root / gesture_name.lower()
             
@@ -54,54 +72,59 @@ class GestureDataset(Dataset):
                 print(f"경고: 폴더를 찾을 수 없습니다 - {gesture_folder}")
                 continue
                 
-            npy_files = list(gesture_folder.glob("*.npy"))
-            
-            for npy_file in npy_files:
-                data_paths.append(str(npy_file))
-                labels.append(gesture_id)
+            gesture_samples = 0
+            for npz_file in sorted(gesture_folder.glob("*.npz")):
+                with np.load(npz_file) as npz:
+                    windows = npz['w']  # shape: (N, 30, 17, 2)
                 
-            print(f"{gesture_name}: {len(npy_files)}개 샘플")
+                window_chunks.append(windows)
+                labels.extend([gesture_id] * len(windows))
+                gesture_samples += len(windows)
+                
+            print(f"{gesture_name}: {gesture_samples}개 샘플")
+        
+        windows = np.concatenate(window_chunks) if window_chunks else np.empty((0, 0, 0, 2), dtype=np.float16)
         
-        print(f"총 {len(data_paths)}개 샘플 로드 완료")
-        return data_paths, labels
+        print(f"총 {len(labels)}개 샘플 로드 완료")
+        return windows, labels
     
     def _split_data(self, test_size: float, random_state: int):
         """데이터 분할"""
-        if len(self.data_paths) == 0:
+        if len(self.labels) == 0:
             return
             
-        # Stratified split (클래스별 비율 유지)
-        train_paths, test_paths, train_labels, test_labels = train_test_split(
-            self.data_paths, self.labels, 
+        # Stratified split (클래스별 비율 유지) - 인덱스만 분할
+        train_idx, test_idx = train_test_split(
+            np.arange(len(self.labels)),
             test_size=test_size, 
             random_state=random_state,
             stratify=self.labels
         )
         
         if self.split == 'train':
-            self.data_paths = train_paths
-            self.labels = train_labels
+            indices = train_idx
         elif self.split == 'test':
-            self.data_paths = test_paths
-            self.labels = test_labels
+            indices = test_idx
+        
+        # memmap은 복사하지 않고 인덱스만 보관
+        self.indices = indices
+        self.labels = [self.labels[i] for i in indices]
             
-        print(f"{self.split.upper()} 데이터: {len(self.data_paths)}개")
+        print(f"{self.split.upper()} 데이터: {len(self.labels)}개")
     
     def __len__(self) -> int:
-        return len(self.data_paths)
+        return len(self.labels)
     
     def __getitem__(self, idx: int) -> Tuple[torch.Tensor, torch.Tensor]:
         """데이터 샘플 반환"""
-        # .npy 파일 로드
-        data_path = self.data_paths[idx]
-        pose_data = np.load(data_path)  # shape: (30, 17, 2)
+        pose_data = self.windows[self.indices[idx]]  # shape: (30, 17, 2), FP16
         
         # (30, 17, 2) -> (30, 34) 변환
         pose_data = pose_data.reshape(pose_data.shape[0], -1)
         
-        # 텐서 변환
-        pose_tensor = torch.FloatTensor(pose_data)
-        label_tensor = torch.LongTensor([self.labels[idx]])[0]
+        # 텐서 변환 (FP16 저장 → FP32 연산)
+        pose_tensor = torch.from_numpy(pose_data.astype(np.float32))
+        label_tensor = torch.tensor(self.labels[idx], dtype=torch.long)
         
         # 변환 적용
         if self.transform:
@@ -122,7 +145,7 @@ class GestureDataset(Dataset):
     def get_dataset_stats(self) -> Dict:
         """데이터셋 통계 정보"""
         stats = {
-            'total_samples': len(self.data_paths),
+            'total_samples': len(self.labels),
             'classes': {},
             'class_distribution': {}
         }
@@ -190,6 +213,8 @@ def create_dataloaders(data_root: str = None, batch_size: int = None,
         batch_size = TRAINING_CONFIG['batch_size']
     if num_workers is None:
         num_workers = TRAINING_CONFIG['num_workers']
+    if num_workers is None:
+        num_workers = (os.cpu_count() or 2) // 2
     
     # 데이터 증강
     transform = DataAugmentation() if augment_train else None
@@ -208,22 +233,18 @@ def create_dataloaders(data_root: str = None, batch_size: int = None,
         test_size=1 - TRAINING_CONFIG['train_test_split']
     )
     
-    # 데이터 로더 생성
-    train_loader = DataLoader(
-        train_dataset,
-        batch_size=batch_size,
-        shuffle=True,
-        num_workers=num_workers,
-        pin_memory=True
-    )
+    # 데이터 로더 생성 (고정 메모리 + 에포크 간 워커 유지 + 선행 로딩)
+    loader_kwargs = {
+        'batch_size': batch_size,
+        'num_workers': num_workers,
+        'pin_memory': torch.cuda.is_available(),
+    }
+    if num_workers > 0:
+        loader_kwargs['persistent_workers'] = True
+        loader_kwargs['prefetch_factor'] = TRAINING_CONFIG.get('prefetch_factor', 4)
     
-    test_loader = DataLoader(
-        test_dataset,
-        batch_size=batch_size,
-        shuffle=False,
-        num_workers=num_workers,
-        pin_memory=True
-    )
+    train_loader = DataLoader(train_dataset, shuffle=True, **loader_kwargs)
+    test_loader = DataLoader(test_dataset, shuffle=False, **loader_kwargs)
     
     return train_loader, test_loader
 
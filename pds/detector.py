@@ -6,16 +6,24 @@ Improved Adaptive Window Gesture Detection
 
 import cv2
 import mediapipe as mp
+import math
 import numpy as np
 import torch
 import os
 from collections import deque
+from operator import attrgetter
 from typing import Optional, Tuple, List, Dict
 import time
 
-from config import DATA_CONFIG, MEDIAPIPE_CONFIG, GESTURE_CLASSES, TCN_CONFIG, IMPROVED_GESTURE_CONFIG
+from config import MEDIAPIPE_CONFIG, GESTURE_CLASSES, TCN_CONFIG, IMPROVED_GESTURE_CONFIG
 from model import GestureModelManager
 
+# 랜드마크 → (x, y, visibility) 튜플 (map과 함께 관절 좌표를 한 번에 추출)
+LANDMARK_XYV = attrgetter('x', 'y', 'visibility')
+
+# 제스처명 → 클래스 인덱스 (일관성 분석용 정수 링 버퍼 저장)
+GESTURE_INDEX = {name: idx for idx, name in GESTURE_CLASSES.items()}
+
 class GestureTransitionDetector:
     """제스처 전환 패턴 감지"""
     
@@ -61,12 +69,12 @@ class ImprovedAdaptiveWindowPoseDetector:
         self.mp_pose = mp.solutions.pose
         self.pose = self.mp_pose.Pose(
             static_image_mode=False,
-            model_complexity=1,
+            model_complexity=MEDIAPIPE_CONFIG['model_complexity'],
             enable_segmentation=False,
             smooth_landmarks=True,
             smooth_segmentation=True,
-            min_detection_confidence=DATA_CONFIG['min_detection_confidence'],
-            min_tracking_confidence=DATA_CONFIG['min_tracking_confidence']
+            min_detection_confidence=MEDIAPIPE_CONFIG['min_detection_confidence'],
+            min_tracking_confidence=MEDIAPIPE_CONFIG['min_tracking_confidence']
         )
         
         self.mp_drawing = mp.solutions.drawing_utils
@@ -74,17 +82,25 @@ class ImprovedAdaptiveWindowPoseDetector:
         # 관절 인덱스
         self.key_landmarks = MEDIAPIPE_CONFIG['key_landmarks']
         
-        # 다중 윈도우 버퍼
+        # 다중 윈도우 링 버퍼 - 모든 윈도우는 같은 프레임열의 최근 구간이므로 가장 긴 윈도우 하나만 유지
+        # 각 프레임을 slot과 slot+90에 두 번 기록해 어떤 윈도우든 연속 구간 뷰로 읽음 (윈도우별 deque/리스트 변환 없음)
         self.window_sizes = [30, 45, 60, 90]  # 1초, 1.5초, 2초, 3초
-        self.pose_buffers = {
-            size: deque(maxlen=size) for size in self.window_sizes
-        }
+        self.max_window = max(self.window_sizes)
+        self.pose_ring = np.zeros((2 * self.max_window, len(self.key_landmarks) * 2), dtype=np.float32)
+        self.pose_count = 0
         
         # 모델 로드
         self.model_manager = GestureModelManager(model_path)
         self.model = self.model_manager.load_model()
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         
+        # 윈도우별 30프레임 리샘플링 인덱스는 한 번만 계산
+        self.feature_size = len(self.key_landmarks) * 2
+        self.resample_indices = {
+            size: np.linspace(0, size - 1, 30, dtype=int) for size in self.window_sizes
+        }
+        self._warmup_model()
+        
         # 예측 결과 추적
         self.prediction_results = {}
         self.confidence_weights = {
@@ -108,6 +124,12 @@ class ImprovedAdaptiveWindowPoseDetector:
         self.prediction_history = deque(maxlen=90)  # 3초 이력
         self.confidence_history = deque(maxlen=30)  # 1초 신뢰도 이력
         
+        # 일관성 분석 윈도우 링 버퍼 (SoA - 매 프레임 리스트 복사/딕셔너리 집계 대신 bincount)
+        self.consistency_window = IMPROVED_GESTURE_CONFIG['consistency_window_frames']
+        self.recent_gesture_idx = np.zeros(self.consistency_window, dtype=np.int64)
+        self.recent_confidence = np.zeros(self.consistency_window, dtype=np.float32)
+        self.recent_count = 0
+        
         # 개선된 기능들
         self.transition_detector = GestureTransitionDetector()
         self.improved_config = IMPROVED_GESTURE_CONFIG
@@ -127,12 +149,11 @@ class ImprovedAdaptiveWindowPoseDetector:
         
         if results.pose_landmarks:
             # 17개 주요 관절 좌표 추출
-            pose_data = []
-            for idx in self.key_landmarks:
-                landmark = results.pose_landmarks.landmark[idx]
-                pose_data.append([landmark.x, landmark.y, landmark.visibility])
+            landmarks = results.pose_landmarks.landmark
+            pose_data = np.array(list(map(LANDMARK_XYV, map(landmarks.__getitem__, self.key_landmarks))),
+                                 dtype=np.float32)
             
-            return np.array(pose_data, dtype=np.float32), results
+            return pose_data, results
         
         return None, results
     
@@ -150,29 +171,42 @@ class ImprovedAdaptiveWindowPoseDetector:
         if left_hip[2] > 0.5 and right_hip[2] > 0.5:
             center = (left_hip[:2] + right_hip[:2]) / 2
             
-            # 상대 좌표로 변환
-            for joint_idx in range(len(self.key_landmarks)):
-                if pose_data[joint_idx][2] > 0.5:
-                    normalized_pose[joint_idx][:2] -= center
+            # 상대 좌표로 변환 (visibility > 0.5인 관절만, 마스크 한 번으로 처리)
+            visible = pose_data[:, 2] > 0.5
+            normalized_pose[visible, :2] -= center
             
             # 스케일 정규화 (어깨 너비 기준)
             left_shoulder = pose_data[3]   # left_shoulder
             right_shoulder = pose_data[4]  # right_shoulder
             
             if left_shoulder[2] > 0.5 and right_shoulder[2] > 0.5:
-                shoulder_width = np.linalg.norm(left_shoulder[:2] - right_shoulder[:2])
+                # 2차원 벡터 길이는 math.hypot으로 (np.linalg.norm 디스패치 오버헤드 회피)
+                shoulder_width = math.hypot(left_shoulder[0] - right_shoulder[0], left_shoulder[1] - right_shoulder[1])
                 if shoulder_width > 0:
                     normalized_pose[:, :2] /= shoulder_width
         
         return normalized_pose
     
+    def _push_pose(self, pose_xy: np.ndarray):
+        """(17, 2) 좌표를 펼쳐 링 버퍼의 두 위치에 기록"""
+        slot = self.pose_count % self.max_window
+        pose_flat = pose_xy.reshape(-1)
+        self.pose_ring[slot] = pose_flat
+        self.pose_ring[slot + self.max_window] = pose_flat
+        self.pose_count += 1
+    
+    def _recent_poses(self, num_frames: int) -> np.ndarray:
+        """최근 num_frames 프레임의 (num_frames, 34) 연속 구간 뷰 (복사 없음)"""
+        end = self.pose_count % self.max_window + self.max_window
+        return self.pose_ring[end - num_frames:end]
+    
     def calculate_motion_intensity(self, pose_data: np.ndarray) -> float:
         """동작 강도 계산"""
-        if len(self.pose_buffers[30]) < 2:
+        if self.pose_count < 2:
             return 0.0
         
         # 최근 두 프레임 비교
-        prev_pose = list(self.pose_buffers[30])[-2]
+        prev_pose = self._recent_poses(2)[0].reshape(-1, 2)
         curr_pose = pose_data[:, :2]  # x, y만 사용
         
         # 관절별 움직임 계산
@@ -226,36 +260,33 @@ class ImprovedAdaptiveWindowPoseDetector:
             motion_duration > self.improved_config['min_motion_duration']
         )
     
-    def analyze_prediction_consistency(self, recent_predictions: List[Tuple[str, float]]) -> Tuple[Optional[str], float]:
-        """최근 예측들의 일관성 분석"""
-        window_frames = self.improved_config['consistency_window_frames']
+    def _push_recent_prediction(self, gesture: str, confidence: float):
+        """일관성 분석 링 버퍼에 예측 기록 (가장 오래된 항목 덮어쓰기)"""
+        slot = self.recent_count % self.consistency_window
+        self.recent_gesture_idx[slot] = GESTURE_INDEX[gesture]
+        self.recent_confidence[slot] = confidence
+        self.recent_count += 1
+    
+    def analyze_prediction_consistency(self) -> Tuple[Optional[str], float]:
+        """최근 예측들의 일관성 분석 (링 버퍼 전체가 마지막 N프레임)"""
+        window_frames = self.consistency_window
         
-        if len(recent_predictions) < window_frames:
+        if self.recent_count < window_frames:
             return None, 0.0
         
-        # 마지막 N프레임 분석
-        last_frames = recent_predictions[-window_frames:]
-        
-        # 각 제스처별 빈도 계산
-        gesture_counts = {}
-        for gesture, conf in last_frames:
-            if gesture not in gesture_counts:
-                gesture_counts[gesture] = []
-            gesture_counts[gesture].append(conf)
-        
-        # 가장 일관된 제스처 찾기
-        best_gesture = None
-        best_consistency = 0.0
-        
-        for gesture, confidences in gesture_counts.items():
-            required_frames = int(window_frames * 0.7)  # 70% 이상
-            if len(confidences) >= required_frames:
-                consistency = len(confidences) / window_frames * np.mean(confidences)
-                if consistency > best_consistency:
-                    best_gesture = gesture
-                    best_consistency = consistency
-        
-        return best_gesture, best_consistency
+        # 각 제스처별 빈도와 신뢰도 합계 (윈도우 내 순서는 결과에 영향 없음)
+        num_classes = len(GESTURE_CLASSES)
+        counts = np.bincount(self.recent_gesture_idx, minlength=num_classes)
+        confidence_sums = np.bincount(self.recent_gesture_idx, weights=self.recent_confidence, minlength=num_classes)
+        
+        # 70% 이상 등장한 제스처 중 (빈도 비율 x 평균 신뢰도) = 신뢰도 합 / 윈도우 크기가 최대인 것
+        required_frames = int(window_frames * 0.7)
+        consistency = np.where(counts >= required_frames, confidence_sums / window_frames, 0.0)
+        best_idx = int(consistency.argmax())
+        
+        if consistency[best_idx] <= 0.0:
+            return None, 0.0
+        return GESTURE_CLASSES[best_idx], float(consistency[best_idx])
     
     def analyze_confidence_trend(self, recent_confidences: List[float]) -> Tuple[bool, float]:
         """신뢰도 변화 추세 분석"""
@@ -300,29 +331,39 @@ class ImprovedAdaptiveWindowPoseDetector:
     
     def predict_with_window(self, window_size: int) -> Tuple[Optional[str], float]:
         """특정 윈도우 크기로 제스처 예측"""
-        if len(self.pose_buffers[window_size]) < window_size or self.model is None:
-            return None, 0.0
-        
-        # 버퍼를 텐서로 변환
-        pose_sequence = np.array(list(self.pose_buffers[window_size]))  # (window_size, 17, 2)
-        pose_sequence = pose_sequence.reshape(pose_sequence.shape[0], -1)  # (window_size, 34)
+        return self.predict_windows([window_size])[window_size]
+    
+    def predict_windows(self, window_sizes: List[int]) -> Dict[int, Tuple[Optional[str], float]]:
+        """준비된 윈도우들을 한 배치로 묶어 한 번의 forward로 예측 (커널 실행 오버헤드를 윈도우 간 분산)"""
+        window_results = {window_size: (None, 0.0) for window_size in window_sizes}
         
-        # 30프레임으로 리샘플링 (모델은 30프레임으로 학습됨)
-        if window_size != 30:
-            indices = np.linspace(0, len(pose_sequence) - 1, 30, dtype=int)
-            pose_sequence = pose_sequence[indices]
+        ready_windows = [w for w in window_sizes if self.pose_count >= w]
+        if not ready_windows or self.model is None:
+            return window_results
         
-        # 배치 차원 추가
-        input_tensor = torch.FloatTensor(pose_sequence).unsqueeze(0).to(self.device)  # (1, 30, 34)
+        # (윈도우 수, 30, 34) 배치 구성 - 30프레임으로 리샘플링 (모델은 30프레임으로 학습됨)
+        batch = np.empty((len(ready_windows), 30, self.feature_size), dtype=np.float32)
+        for row, window_size in enumerate(ready_windows):
+            # 링 버퍼 구간 뷰에서 리샘플링할 30프레임만 바로 모음
+            np.take(self._recent_poses(window_size), self.resample_indices[window_size], axis=0, out=batch[row])
         
         # 예측
+        input_tensor = torch.from_numpy(batch).to(self.device)
         predictions, confidences, probabilities = self.model.predict(input_tensor)
         
-        predicted_class = predictions[0].item()
-        confidence = confidences[0].item()
+        # 클래스와 신뢰도를 한 번의 device→host 전송으로 가져옴
+        for window_size, (predicted_class, confidence) in zip(
+                ready_windows, torch.stack((predictions.float(), confidences), dim=1).tolist()):
+            window_results[window_size] = (GESTURE_CLASSES[int(predicted_class)], confidence)
         
-        gesture_name = GESTURE_CLASSES[predicted_class]
-        return gesture_name, confidence
+        return window_results
+    
+    def _warmup_model(self):
+        """시작 시 전체 윈도우 배치로 한 번 추론해 첫 프레임 지연 제거"""
+        if self.model is None:
+            return
+        dummy = torch.zeros(len(self.window_sizes), 30, self.feature_size, device=self.device)
+        self.model.predict(dummy)
     
     def improved_adaptive_prediction(self, motion_duration: float) -> Tuple[Optional[str], float, Dict]:
         """개선된 적응형 예측"""
@@ -335,7 +376,7 @@ class ImprovedAdaptiveWindowPoseDetector:
         }
         
         # 스마트 윈도우 선택
-        selected_windows = self.smart_window_selection(motion_duration, list(self.prediction_history))
+        selected_windows = self.smart_window_selection(motion_duration, self.prediction_history)
         debug_info['selected_windows'] = selected_windows
         
         # 동적 임계값 계산
@@ -344,9 +385,10 @@ class ImprovedAdaptiveWindowPoseDetector:
         predictions = {}
         total_weight = 0
         
-        # 선택된 윈도우들로 예측
+        # 선택된 윈도우들을 한 번의 배치 추론으로 예측
+        window_results = self.predict_windows(selected_windows)
         for window_size in selected_windows:
-            gesture, confidence = self.predict_with_window(window_size)
+            gesture, confidence = window_results[window_size]
             debug_info['window_predictions'][f'{window_size}f'] = f'{gesture}({confidence:.2f})' if gesture else 'None'
             
             if gesture and confidence > dynamic_threshold:
@@ -366,7 +408,7 @@ class ImprovedAdaptiveWindowPoseDetector:
         
         # 예측 일관성 분석
         if len(self.prediction_history) >= 30:
-            consistent_gesture, consistency = self.analyze_prediction_consistency(list(self.prediction_history))
+            consistent_gesture, consistency = self.analyze_prediction_consistency()
             debug_info['consistency_info'] = {
                 'consistent_gesture': consistent_gesture,
                 'consistency_score': consistency
@@ -424,10 +466,8 @@ class ImprovedAdaptiveWindowPoseDetector:
             # 정규화
             normalized_pose = self.normalize_pose_data(pose_data)
             
-            # 모든 윈도우 버퍼에 추가 (x, y 좌표만)
-            pose_xy = normalized_pose[:, :2]
-            for window_size in self.window_sizes:
-                self.pose_buffers[window_size].append(pose_xy)
+            # 윈도우 링 버퍼에 추가 (x, y 좌표만, 모든 윈도우가 공유)
+            self._push_pose(normalized_pose[:, :2])
             
             # 동작 강도 계산 및 상태 업데이트
             motion_intensity = self.calculate_motion_intensity(normalized_pose)
@@ -465,6 +505,7 @@ class ImprovedAdaptiveWindowPoseDetector:
             if gesture and confidence > 0.6:
                 self.prediction_history.append((gesture, confidence))
                 self.confidence_history.append(confidence)
+                self._push_recent_prediction(gesture, confidence)
                 
                 # 최종 예측 업데이트 (완료된 동작만)
                 if gesture_completed or motion_duration > 2.0:
@@ -5,6 +5,7 @@ TCN 모델 평가 스크립트
 학습된 모델의 성능을 종합적으로 평가
 """
 
+import copy
 import torch
 import numpy as np
 import matplotlib.pyplot as plt
@@ -17,10 +18,17 @@ import json
 from datetime import datetime
 
 from config import TCN_CONFIG, GESTURE_CLASSES, GESTURE_CLASSES_KR, PATHS, TRAINING_CONFIG
-from model import TCNGestureClassifier
+from model import TCNGestureClassifier, quantize_dynamic_int8
+from utils import evaluate_model as evaluate_accuracy
 from dataset import GestureDataset
 from torch.utils.data import DataLoader
 
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'DejaVu Sans'
 sns.set_style("whitegrid")
@@ -267,6 +275,10 @@ class ModelEvaluator:
             'confidence_stats': metrics['confidence_stats'],
             'class_report': metrics['class_report']
         }
+        if 'int8' in metrics:
+            report['int8_comparison'] = metrics['int8']
+        if 'onnx_int8' in metrics:
+            report['onnx_int8_comparison'] = metrics['onnx_int8']
         
         with open(save_path, 'w', encoding='utf-8') as f:
             json.dump(report, f, ensure_ascii=False, indent=2)
@@ -274,6 +286,55 @@ class ModelEvaluator:
         logger.info(f"평가 보고서 저장: {save_path}")
         return save_path
     
+    def compare_int8_accuracy(self, max_drop: float = 0.005):
+        """서버 CPU 추론용 INT8 동적 양자화 모델과 FP32 모델의 정확도 비교 (하락폭이 max_drop 미만이면 사용 가능)"""
+        fp32_accuracy = evaluate_accuracy(self.model, self.test_loader, self.device)['accuracy']
+        int8_model = quantize_dynamic_int8(copy.deepcopy(self.model))
+        int8_accuracy = evaluate_accuracy(int8_model, self.test_loader, torch.device('cpu'))['accuracy']
+        
+        drop = fp32_accuracy - int8_accuracy
+        accepted = drop < max_drop
+        if accepted:
+            logger.info(f"INT8 정확도 확인: FP32 {fp32_accuracy:.4f} → INT8 {int8_accuracy:.4f} (하락 {drop * 100:.2f}%p)")
+        else:
+            logger.warning(f"INT8 정확도 하락이 큼: FP32 {fp32_accuracy:.4f} → INT8 {int8_accuracy:.4f} "
+                           f"(하락 {drop * 100:.2f}%p) - SERVER_CONFIG['cpu_int8_torch']를 켜지 마세요")
+        
+        return {'fp32_accuracy': fp32_accuracy, 'int8_accuracy': int8_accuracy, 'accepted': accepted}
+    
+    def compare_onnx_int8_accuracy(self, fp32_accuracy: float, max_drop: float = 0.005):
+        """서버 CPU 추론용 INT8 ONNX 모델(cpu_int8_onnx)과 FP32 모델의 정확도 비교 (하락폭이 max_drop 미만이면 사용 가능)"""
+        int8_path = Path(PATHS['onnx_int8_model_file'])
+        if not ONNXRUNTIME_AVAILABLE:
+            logger.info("onnxruntime이 없어 INT8 ONNX 비교 생략")
+            return None
+        if not int8_path.exists() or int8_path.stat().st_mtime < Path(self.model_path).stat().st_mtime:
+            logger.info(f"INT8 ONNX 모델이 없거나 체크포인트보다 오래되어 비교 생략 (서버가 다시 생성): {int8_path}")
+            return None
+        
+        session = ort.InferenceSession(str(int8_path), providers=['CPUExecutionProvider'])
+        input_name = session.get_inputs()[0].name
+        
+        # 서버와 같은 고정 입력 크기 (1, 30, 34)로 한 샘플씩 실행
+        correct = 0
+        total = 0
+        for batch_data, batch_targets in self.test_loader:
+            for sample, target in zip(batch_data.numpy().astype(np.float32), batch_targets.tolist()):
+                logits = session.run(None, {input_name: sample[None]})[0]
+                correct += int(logits.argmax() == target)
+                total += 1
+        int8_accuracy = correct / total
+        
+        drop = fp32_accuracy - int8_accuracy
+        accepted = drop < max_drop
+        if accepted:
+            logger.info(f"INT8 ONNX 정확도 확인: FP32 {fp32_accuracy:.4f} → INT8 {int8_accuracy:.4f} (하락 {drop * 100:.2f}%p)")
+        else:
+            logger.warning(f"INT8 ONNX 정확도 하락이 큼: FP32 {fp32_accuracy:.4f} → INT8 {int8_accuracy:.4f} "
+                           f"(하락 {drop * 100:.2f}%p) - SERVER_CONFIG['cpu_int8_onnx']를 켜지 마세요")
+        
+        return {'fp32_accuracy': fp32_accuracy, 'int8_accuracy': int8_accuracy, 'accepted': accepted}
+    
     def run_full_evaluation(self):
         """전체 평가 실행"""
         logger.info("=== TCN 모델 종합 평가 시작 ===")
@@ -295,6 +356,19 @@ class ModelEvaluator:
         logger.info("성능 지표 계산 중...")
         metrics = self.calculate_metrics(results)
         
+        # INT8 동적 양자화 정확도 비교 (서버 CPU 추론용)
+        try:
+            metrics['int8'] = self.compare_int8_accuracy()
+        except Exception as e:
+            logger.warning(f"INT8 정확도 비교 실패: {e}")
+        
+        try:
+            onnx_int8 = self.compare_onnx_int8_accuracy(float(metrics['accuracy']))
+            if onnx_int8 is not None:
+                metrics['onnx_int8'] = onnx_int8
+        except Exception as e:
+            logger.warning(f"INT8 ONNX 정확도 비교 실패: {e}")
+        
         # 4. 결과 출력
         print("\n" + "="*50)
         print("📊 TCN 모델 평가 결과")
@@ -8,7 +8,7 @@ import torch
 import torch.nn as nn
 import torch.nn.functional as F
 import os
-from typing import List
+from typing import List, Optional
 from config import TCN_CONFIG
 
 class TemporalBlock(nn.Module):
@@ -143,6 +143,11 @@ class TCNGestureClassifier(nn.Module):
             
         return predictions, confidences, probabilities
 
+def quantize_dynamic_int8(model: nn.Module) -> nn.Module:
+    """CPU 추론용 INT8 동적 양자화 (Linear 가중치만 INT8, Conv1d는 동적 양자화를 지원하지 않아 FP32 유지)"""
+    model = model.cpu().eval()
+    return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+
 class GestureModelManager:
     """모델 관리자"""
     
@@ -205,6 +210,29 @@ class GestureModelManager:
         
         return self.model
     
+    def export_onnx(self, onnx_path: str = None) -> Optional[str]:
+        """저장된 최고 성능 체크포인트를 고정 입력 크기 (1, 30, 34) ONNX로 내보내기 (서버 추론용)"""
+        from config import PATHS
+        onnx_path = onnx_path or PATHS['onnx_model_file']
+        
+        model = self.load_model()
+        if model is None:
+            return None
+        
+        model = model.cpu().eval()
+        dummy_input = torch.zeros(1, TCN_CONFIG['sequence_length'], TCN_CONFIG['input_size'])
+        
+        os.makedirs(os.path.dirname(onnx_path), exist_ok=True)
+        torch.onnx.export(
+            model, dummy_input, onnx_path,
+            input_names=['pose_sequence'],
+            output_names=['logits'],
+            opset_version=17
+        )
+        print(f"ONNX 모델 내보내기 완료: {onnx_path}")
+        
+        return onnx_path
+    
     def get_model_info(self):
         """모델 정보 반환"""
         if self.model is None:
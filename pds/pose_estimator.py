@@ -6,16 +6,21 @@ Real-time Pose Detection and Gesture Recognition
 
 import cv2
 import mediapipe as mp
+import math
 import numpy as np
 import torch
 import os
 from collections import deque
+from operator import attrgetter
 from typing import Optional, Tuple, List
 import time
 
-from config import DATA_CONFIG, MEDIAPIPE_CONFIG, GESTURE_CLASSES, TCN_CONFIG
+from config import MEDIAPIPE_CONFIG, GESTURE_CLASSES, TCN_CONFIG
 from model import GestureModelManager
 
+# 랜드마크 → (x, y, visibility) 튜플 (map과 함께 관절 좌표를 한 번에 추출)
+LANDMARK_XYV = attrgetter('x', 'y', 'visibility')
+
 class RealTimePoseDetector:
     """실시간 자세 검출 및 제스처 인식"""
     
@@ -24,12 +29,12 @@ class RealTimePoseDetector:
         self.mp_pose = mp.solutions.pose
         self.pose = self.mp_pose.Pose(
             static_image_mode=False,
-            model_complexity=1,
+            model_complexity=MEDIAPIPE_CONFIG['model_complexity'],
             enable_segmentation=False,
             smooth_landmarks=True,
             smooth_segmentation=True,
-            min_detection_confidence=DATA_CONFIG['min_detection_confidence'],
-            min_tracking_confidence=DATA_CONFIG['min_tracking_confidence']
+            min_detection_confidence=MEDIAPIPE_CONFIG['min_detection_confidence'],
+            min_tracking_confidence=MEDIAPIPE_CONFIG['min_tracking_confidence']
         )
         
         self.mp_drawing = mp.solutions.drawing_utils
@@ -37,8 +42,14 @@ class RealTimePoseDetector:
         # 관절 인덱스
         self.key_landmarks = MEDIAPIPE_CONFIG['key_landmarks']
         
-        # 시계열 버퍼 (30프레임)
-        self.pose_buffer = deque(maxlen=TCN_CONFIG['sequence_length'])
+        # BGR→RGB 변환 결과를 받을 재사용 버퍼 (해상도가 바뀔 때만 재할당)
+        self._rgb_buf = None
+        
+        # 시계열 링 버퍼 (30프레임 × 34) - 각 프레임을 slot과 slot+30에 두 번 기록해
+        # 최근 30프레임이 항상 연속 구간이 되도록 유지 (예측마다 리스트 → 배열 재구성 없음)
+        self.sequence_length = TCN_CONFIG['sequence_length']
+        self.pose_ring = np.zeros((2 * self.sequence_length, TCN_CONFIG['input_size']), dtype=np.float32)
+        self.pose_count = 0
         
         # 모델 로드
         self.model_manager = GestureModelManager(model_path)
@@ -56,21 +67,21 @@ class RealTimePoseDetector:
         
     def extract_pose_landmarks(self, frame: np.ndarray) -> Optional[np.ndarray]:
         """프레임에서 자세 랜드마크 추출"""
-        # 이미지 크기 정보 설정 (MediaPipe 경고 해결)
-        height, width = frame.shape[:2]
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        self._rgb_buf.flags.writeable = True  # 직전 process()에서 읽기 전용으로 표시됨
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         rgb_frame.flags.writeable = False
         
         results = self.pose.process(rgb_frame)
         
         if results.pose_landmarks:
             # 17개 주요 관절 좌표 추출
-            pose_data = []
-            for idx in self.key_landmarks:
-                landmark = results.pose_landmarks.landmark[idx]
-                pose_data.append([landmark.x, landmark.y, landmark.visibility])
+            landmarks = results.pose_landmarks.landmark
+            pose_data = np.array(list(map(LANDMARK_XYV, map(landmarks.__getitem__, self.key_landmarks))),
+                                 dtype=np.float32)
             
-            return np.array(pose_data, dtype=np.float32), results
+            return pose_data, results
         
         return None, results
     
@@ -88,39 +99,48 @@ class RealTimePoseDetector:
         if left_hip[2] > 0.5 and right_hip[2] > 0.5:
             center = (left_hip[:2] + right_hip[:2]) / 2
             
-            # 상대 좌표로 변환
-            for joint_idx in range(len(self.key_landmarks)):
-                if pose_data[joint_idx][2] > 0.5:
-                    normalized_pose[joint_idx][:2] -= center
+            # 상대 좌표로 변환 (visibility > 0.5인 관절만, 마스크 한 번으로 처리)
+            visible = pose_data[:, 2] > 0.5
+            normalized_pose[visible, :2] -= center
             
             # 스케일 정규화 (어깨 너비 기준)
             left_shoulder = pose_data[3]   # left_shoulder
             right_shoulder = pose_data[4]  # right_shoulder
             
             if left_shoulder[2] > 0.5 and right_shoulder[2] > 0.5:
-                shoulder_width = np.linalg.norm(left_shoulder[:2] - right_shoulder[:2])
+                # 2차원 벡터 길이는 math.hypot으로 (np.linalg.norm 디스패치 오버헤드 회피)
+                shoulder_width = math.hypot(left_shoulder[0] - right_shoulder[0], left_shoulder[1] - right_shoulder[1])
                 if shoulder_width > 0:
                     normalized_pose[:, :2] /= shoulder_width
         
         return normalized_pose
     
+    def _push_pose(self, pose_xy: np.ndarray):
+        """(17, 2) 좌표를 펼쳐 링 버퍼의 두 위치에 기록"""
+        slot = self.pose_count % self.sequence_length
+        pose_flat = pose_xy.reshape(-1)
+        self.pose_ring[slot] = pose_flat
+        self.pose_ring[slot + self.sequence_length] = pose_flat
+        self.pose_count += 1
+    
     def predict_gesture(self) -> Tuple[Optional[str], float]:
         """현재 버퍼 상태로 제스처 예측"""
-        if len(self.pose_buffer) < TCN_CONFIG['sequence_length'] or self.model is None:
+        if self.pose_count < self.sequence_length or self.model is None:
             return None, 0.0
         
-        # 버퍼를 텐서로 변환
-        pose_sequence = np.array(list(self.pose_buffer))  # (30, 17, 2)
-        pose_sequence = pose_sequence.reshape(pose_sequence.shape[0], -1)  # (30, 34)
+        # 최근 30프레임 (링 버퍼의 연속 구간 뷰) - (30, 34)
+        start = self.pose_count % self.sequence_length
+        pose_sequence = self.pose_ring[start:start + self.sequence_length]
         
         # 배치 차원 추가
-        input_tensor = torch.FloatTensor(pose_sequence).unsqueeze(0).to(self.device)  # (1, 30, 34)
+        input_tensor = torch.from_numpy(pose_sequence).unsqueeze(0).to(self.device)  # (1, 30, 34)
         
         # 예측
         predictions, confidences, probabilities = self.model.predict(input_tensor)
         
-        predicted_class = predictions[0].item()
-        confidence = confidences[0].item()
+        # 클래스와 신뢰도를 한 번의 device→host 전송으로 가져옴 (.item() 두 번은 동기화도 두 번)
+        predicted_class, confidence = torch.stack((predictions.float(), confidences), dim=1)[0].tolist()
+        predicted_class = int(predicted_class)
         
         # 예측 이력에 추가 (스무딩)
         self.prediction_history.append((predicted_class, confidence))
@@ -153,7 +173,7 @@ class RealTimePoseDetector:
             normalized_pose = self.normalize_pose_data(pose_data)
             
             # 버퍼에 추가 (x, y 좌표만)
-            self.pose_buffer.append(normalized_pose[:, :2])
+            self._push_pose(normalized_pose[:, :2])
             
             # 스켈레톤 그리기
             annotated_frame = frame.copy()
@@ -187,7 +207,7 @@ class RealTimePoseDetector:
         # 정보 텍스트
         info_text = [
             f"FPS: {getattr(self, 'current_fps', 0):.1f}",
-            f"Buffer: {len(self.pose_buffer)}/{TCN_CONFIG['sequence_length']}",
+            f"Buffer: {min(self.pose_count, self.sequence_length)}/{self.sequence_length}",
         ]
         
         if gesture:
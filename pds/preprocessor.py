@@ -9,11 +9,19 @@ import mediapipe as mp
 import numpy as np
 import os
 import json
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import logging
 from config import DATA_CONFIG, MEDIAPIPE_CONFIG, GESTURE_CLASSES, PATHS
 
+# 랜드마크 → (x, y, visibility) 튜플 (map과 함께 관절 좌표를 한 번에 추출)
+LANDMARK_XYV = attrgetter('x', 'y', 'visibility')
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,14 +30,14 @@ class PoseDataPreprocessor:
     """MP4 영상에서 자세 데이터 추출 및 전처리"""
     
     def __init__(self):
-        # MediaPipe 설정 (경고 해결을 위한 개선된 설정)
+        # MediaPipe 설정 (오프라인 전처리: 경량 모델 + 스무딩 없음, 슬라이딩 윈도우가 시간축을 처리)
         self.mp_pose = mp.solutions.pose
         self.pose = self.mp_pose.Pose(
             static_image_mode=False,
-            model_complexity=1,
+            model_complexity=DATA_CONFIG.get('model_complexity', 0),
             enable_segmentation=False,
-            smooth_landmarks=True,
-            smooth_segmentation=True,
+            smooth_landmarks=DATA_CONFIG.get('smooth_landmarks', False),
+            smooth_segmentation=False,
             min_detection_confidence=DATA_CONFIG['min_detection_confidence'],
             min_tracking_confidence=DATA_CONFIG['min_tracking_confidence']
         )
@@ -121,11 +129,12 @@ class PoseDataPreprocessor:
         logger.info(f"📁 대상 폴더: {output_path.absolute()}")
         
         try:
-            # 기존 .npy 파일들 삭제
+            # 기존 .npy/.npz 파일들 삭제
             npy_files = list(output_path.rglob("*.npy"))
+            npz_files = list(output_path.rglob("*.npz"))
             json_files = list(output_path.rglob("*.json"))
             
-            total_files = len(npy_files) + len(json_files)
+            total_files = len(npy_files) + len(npz_files) + len(json_files)
             
             if total_files == 0:
                 logger.info("✅ 정리할 파일이 없습니다.")
@@ -133,11 +142,12 @@ class PoseDataPreprocessor:
             
             logger.info(f"🗑️ 삭제할 파일들:")
             logger.info(f"   - .npy 파일: {len(npy_files)}개")
+            logger.info(f"   - .npz 파일: {len(npz_files)}개")
             logger.info(f"   - .json 파일: {len(json_files)}개")
             logger.info(f"   - 총 {total_files}개 파일")
             
-            # .npy 파일들 삭제
-            for npy_file in npy_files:
+            # .npy/.npz 파일들 삭제
+            for npy_file in npy_files + npz_files:
                 npy_file.unlink()
                 
             # .json 파일들 삭제  
@@ -158,6 +168,57 @@ class PoseDataPreprocessor:
             logger.error(f"❌ 파일 정리 중 오류 발생: {e}")
             return False
     
+    @staticmethod
+    def _decode_frames(cap: cv2.VideoCapture, frame_queue: queue.Queue, stop_event: threading.Event,
+                       stride_frames: int = 1):
+        """디코딩 스레드: stride_frames마다 프레임을 읽어 RGB로 변환 후 큐에 넣음 (끝나면 None)"""
+        def put(item) -> bool:
+            # 소비자가 먼저 끝나면 막히지 않도록 주기적으로 중단 신호 확인
+            while not stop_event.is_set():
+                try:
+                    frame_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        # RGB 변환 결과 버퍼 링 재사용 (큐 용량 + 소비자가 처리 중인 1개 + 작성 중인 1개)
+        rgb_buffers = []
+        buffer_count = frame_queue.maxsize + 2
+        frame_idx = 0
+        emitted = 0
+        while not stop_event.is_set():
+            # 건너뛸 프레임은 grab()만 하고 retrieve()(디코딩 결과 변환)는 생략
+            if not cap.grab():
+                break
+            frame_idx += 1
+            if (frame_idx - 1) % stride_frames:
+                continue
+            
+            ret, frame = cap.retrieve()
+            if not ret:
+                break
+            
+            if not rgb_buffers or rgb_buffers[0].shape != frame.shape:
+                rgb_buffers = [np.empty_like(frame) for _ in range(buffer_count)]
+            rgb_buf = rgb_buffers[emitted % buffer_count]
+            emitted += 1
+            
+            # BGR -> RGB 변환은 디코딩 스레드에서 수행해 자세 추론과 겹침
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+            if not put(rgb_buf):
+                return
+        
+        put(None)
+    
+    @staticmethod
+    def _frame_stride(src_fps: float) -> int:
+        """원본 FPS → 목표 FPS 리샘플링 간격 (FPS를 알 수 없으면 1)"""
+        target_fps = DATA_CONFIG.get('target_fps', DATA_CONFIG['fps'])
+        if not src_fps or src_fps <= 0:
+            return 1
+        return max(1, round(src_fps / target_fps))
+    
     def extract_pose_from_video(self, video_path: str) -> Optional[np.ndarray]:
         """
         MP4 영상에서 자세 좌표 추출
@@ -175,53 +236,63 @@ class PoseDataPreprocessor:
                 logger.error(f"영상 파일을 열 수 없습니다: {video_path}")
                 return None
                 
-            poses = []
-            frame_count = 0
             max_frames = 600  # 최대 20초 (30fps * 20초) 제한
             
-            while frame_count < max_frames:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                    
-                # BGR -> RGB 변환 (MediaPipe 경고 해결을 위한 이미지 크기 정보 설정)
-                height, width = frame.shape[:2]
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                rgb_frame.flags.writeable = False
-                
-                # 자세 검출
-                results = self.pose.process(rgb_frame)
-                
-                if results.pose_landmarks:
-                    # 17개 주요 관절 좌표 추출
-                    pose_data = []
-                    for idx in self.key_landmarks:
-                        landmark = results.pose_landmarks.landmark[idx]
-                        pose_data.append([landmark.x, landmark.y, landmark.visibility])
-                    
-                    poses.append(pose_data)
-                else:
-                    # 자세 검출 실패 시 해당 프레임 건너뛰기 (누적 방지)
-                    logger.debug(f"자세 검출 실패 - 프레임 {frame_count} 건너뛰기")
-                    continue
-                
-                frame_count += 1
-                
-            cap.release()
+            # 원본 FPS를 목표 FPS로 리샘플링 (seek 없이 grab/retrieve로 건너뜀)
+            stride_frames = self._frame_stride(cap.get(cv2.CAP_PROP_FPS))
             
-            if not poses:
+            # 디코딩 스레드와 자세 추론을 제한된 큐로 연결 (지연 누적 방지)
+            frame_queue = queue.Queue(maxsize=DATA_CONFIG.get('decode_queue_size', 8))
+            stop_event = threading.Event()
+            decoder = threading.Thread(target=self._decode_frames, args=(cap, frame_queue, stop_event, stride_frames), daemon=True)
+            decoder.start()
+            
+            try:
+                poses = self._collect_poses(frame_queue, max_frames)
+            finally:
+                stop_event.set()
+                decoder.join()
+                cap.release()
+            
+            if len(poses) == 0:
                 logger.warning(f"자세를 검출할 수 없습니다: {video_path}")
                 return None
                 
-            poses_array = np.array(poses, dtype=np.float32)
-            logger.info(f"자세 추출 완료: {video_path} -> {poses_array.shape}")
+            logger.info(f"자세 추출 완료: {video_path} -> {poses.shape}")
             
-            return poses_array
+            return poses
             
         except Exception as e:
             logger.error(f"자세 추출 오류 ({video_path}): {e}")
             return None
     
+    def _collect_poses(self, frame_queue: queue.Queue, max_frames: int) -> np.ndarray:
+        """큐에서 RGB 프레임을 꺼내 자세 검출 (자세가 검출된 프레임만 max_frames까지)"""
+        # 결과 버퍼를 미리 할당해 프레임/관절 단위 리스트 생성과 최종 복사를 없앰
+        poses = np.empty((max_frames, len(self.key_landmarks), 3), dtype=np.float32)
+        frame_count = 0
+        
+        while frame_count < max_frames:
+            rgb_frame = frame_queue.get()
+            if rgb_frame is None:
+                break
+            
+            # 자세 검출
+            results = self.pose.process(rgb_frame)
+            
+            if results.pose_landmarks:
+                # 17개 주요 관절 좌표 추출
+                landmarks = results.pose_landmarks.landmark
+                poses[frame_count] = list(map(LANDMARK_XYV, map(landmarks.__getitem__, self.key_landmarks)))
+            else:
+                # 자세 검출 실패 시 해당 프레임 건너뛰기 (누적 방지)
+                logger.debug(f"자세 검출 실패 - 프레임 {frame_count} 건너뛰기")
+                continue
+            
+            frame_count += 1
+        
+        return poses[:frame_count]
+    
     def normalize_pose_data(self, pose_data: np.ndarray) -> np.ndarray:
         """
         자세 데이터 정규화
@@ -233,29 +304,22 @@ class PoseDataPreprocessor:
             
         normalized_poses = pose_data.copy()
         
-        for frame_idx in range(pose_data.shape[0]):
-            frame_pose = pose_data[frame_idx]
-            
-            # Hip 중심점 계산 (left_hip + right_hip) / 2
-            left_hip = frame_pose[9]   # left_hip
-            right_hip = frame_pose[10] # right_hip
-            
-            if left_hip[2] > 0.5 and right_hip[2] > 0.5:  # visibility 체크
-                center = (left_hip[:2] + right_hip[:2]) / 2
-                
-                # 상대 좌표로 변환
-                for joint_idx in range(len(self.key_landmarks)):
-                    if frame_pose[joint_idx][2] > 0.5:  # visibility > 0.5
-                        normalized_poses[frame_idx][joint_idx][:2] -= center
-                
-                # 스케일 정규화 (어깨 너비 기준)
-                left_shoulder = frame_pose[3]   # left_shoulder
-                right_shoulder = frame_pose[4]  # right_shoulder
-                
-                if left_shoulder[2] > 0.5 and right_shoulder[2] > 0.5:
-                    shoulder_width = np.linalg.norm(left_shoulder[:2] - right_shoulder[:2])
-                    if shoulder_width > 0:
-                        normalized_poses[frame_idx][:, :2] /= shoulder_width
+        # 모든 프레임을 한 번에 처리 (프레임/관절 단위 Python 루프 없음)
+        visible = pose_data[:, :, 2] > 0.5  # (frames, 17)
+        
+        # Hip 중심점 계산 (left_hip + right_hip) / 2 - 양쪽 hip이 보이는 프레임만
+        hip_ok = visible[:, 9] & visible[:, 10]
+        centers = (pose_data[:, 9, :2] + pose_data[:, 10, :2]) / 2  # (frames, 2)
+        
+        # 상대 좌표로 변환 (visibility > 0.5인 관절만)
+        shift_mask = visible & hip_ok[:, None]
+        normalized_poses[:, :, :2] -= np.where(shift_mask[:, :, None], centers[:, None, :], 0)
+        
+        # 스케일 정규화 (어깨 너비 기준, 프레임 전체 관절)
+        shoulder_delta = pose_data[:, 3, :2] - pose_data[:, 4, :2]
+        shoulder_width = np.sqrt(np.einsum('fi,fi->f', shoulder_delta, shoulder_delta))
+        scale_ok = hip_ok & visible[:, 3] & visible[:, 4] & (shoulder_width > 0)
+        normalized_poses[scale_ok, :, :2] /= shoulder_width[scale_ok, None, None]
         
         return normalized_poses
     
@@ -279,6 +343,39 @@ class PoseDataPreprocessor:
             
         return windows
     
+    def process_video_file(self, mp4_file: Path, output_path: Path, gesture_name: str) -> Optional[int]:
+        """
+        단일 MP4 파일 처리 (자세 추출 → 정규화 → 슬라이딩 윈도우 저장)
+        
+        Returns:
+            저장된 윈도우 수 (자세 추출 실패 시 None)
+        """
+        # 자세 추출
+        pose_data = self.extract_pose_from_video(str(mp4_file))
+        if pose_data is None:
+            return None
+            
+        # 정규화
+        normalized_pose = self.normalize_pose_data(pose_data)
+        
+        # 슬라이딩 윈도우
+        windows = self.create_sliding_windows(normalized_pose)
+        
+        # 영상 하나의 모든 윈도우를 한 파일로 저장 (x, y 좌표만, 어깨 너비 정규화 값이라 FP16으로 충분)
+        if windows:
+            stacked = np.stack([window_data[:, :, :2] for window_data in windows])  # shape: (N, 30, 17, 2)
+            
+            # 어깨 너비가 비정상적으로 작은 프레임은 FP16 범위를 넘을 수 있으므로 저장 전에 확인
+            fp16_max = np.finfo(np.float16).max
+            if np.abs(stacked).max() >= fp16_max:
+                logger.warning(f"⚠️ FP16 범위 초과 좌표 클리핑: {mp4_file.name}")
+                np.clip(stacked, -fp16_max, fp16_max, out=stacked)
+            
+            stacked = stacked.astype(np.float16)
+            np.savez_compressed(output_path / f"{gesture_name}_{mp4_file.stem}.npz", w=stacked)
+        
+        return len(windows)
+    
     def process_video_folder(self, input_folder: str, output_folder: str, gesture_name: str):
         """
         폴더 내 모든 MP4 파일 처리
@@ -299,28 +396,12 @@ class PoseDataPreprocessor:
         for mp4_file in mp4_files:
             logger.info(f"처리 중: {mp4_file.name}")
             
-            # 자세 추출
-            pose_data = self.extract_pose_from_video(str(mp4_file))
-            if pose_data is None:
+            window_count = self.process_video_file(mp4_file, output_path, gesture_name)
+            if window_count is None:
                 continue
                 
-            # 정규화
-            normalized_pose = self.normalize_pose_data(pose_data)
-            
-            # 슬라이딩 윈도우
-            windows = self.create_sliding_windows(normalized_pose)
-            
-            # 각 윈도우를 별도 파일로 저장
-            for window_idx, window_data in enumerate(windows):
-                output_filename = f"{gesture_name}_{mp4_file.stem}_w{window_idx:03d}.npy"
-                output_file_path = output_path / output_filename
-                
-                # 데이터 저장 (x, y 좌표만 사용)
-                window_xy = window_data[:, :, :2]  # shape: (30, 17, 2)
-                np.save(output_file_path, window_xy)
-                
             processed_count += 1
-            logger.info(f"완료: {mp4_file.name} -> {len(windows)}개 윈도우")
+            logger.info(f"완료: {mp4_file.name} -> {window_count}개 윈도우")
         
         logger.info(f"{gesture_name} 제스처 처리 완료: {processed_count}/{len(mp4_files)}")
     
@@ -346,18 +427,126 @@ class PoseDataPreprocessor:
         data_path = Path(data_root)
         logger.info(f"🎯 회전된 영상 데이터 처리 시작: {data_path.absolute()}")
         
+        # 모든 제스처의 (영상, 제스처) 작업 목록 수집
+        jobs = []
         for gesture_name in GESTURE_CLASSES.values():
             gesture_folder = data_path / gesture_name
             
             if gesture_folder.exists():
-                logger.info(f"=== {gesture_name.upper()} 제스처 처리 ===")
-                self.process_video_folder(
-                    str(gesture_folder),
-                    f"{output_root}/{gesture_name}",
-                    gesture_name
-                )
+                output_folder = Path(output_root) / gesture_name
+                output_folder.mkdir(parents=True, exist_ok=True)
+                
+                mp4_files = list(gesture_folder.glob("*.mp4"))
+                logger.info(f"=== {gesture_name.upper()} 제스처: {len(mp4_files)}개 파일 ===")
+                jobs.extend((str(mp4_file), gesture_name, str(output_folder)) for mp4_file in mp4_files)
             else:
                 logger.warning(f"폴더를 찾을 수 없습니다: {gesture_folder}")
+        
+        if not jobs:
+            return
+        
+        # 영상 단위로 독립적이므로 프로세스 풀로 병렬 처리 (결과 배열은 워커에서 바로 저장)
+        max_workers = min(DATA_CONFIG.get('num_workers') or os.cpu_count() or 1, len(jobs))
+        logger.info(f"⚡ {len(jobs)}개 영상을 {max_workers}개 프로세스로 처리")
+        
+        processed_count = {gesture_name: 0 for gesture_name in GESTURE_CLASSES.values()}
+        
+        # BLAS/OpenMP 스레드 풀은 numpy/cv2 import 시점에 정해지므로 부모에서 환경 변수를 설정하고
+        # spawn으로 워커를 띄워 새로 import하게 함 (fork는 이미 만들어진 스레드 풀을 물려받음)
+        worker_threads = DATA_CONFIG.get('worker_threads', 1)
+        saved_env = {name: os.environ.get(name) for name in WORKER_THREAD_ENV_VARS}
+        os.environ.update({name: str(worker_threads) for name in WORKER_THREAD_ENV_VARS})
+        try:
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                           initargs=(worker_threads,),
+                                           mp_context=multiprocessing.get_context('spawn'))
+        finally:
+            # 워커는 생성 시점의 환경을 물려받으므로 부모 프로세스 환경은 바로 복원
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+        
+        with executor:
+            futures = {executor.submit(_process_one_video, *job): job for job in jobs}
+            
+            for future in as_completed(futures):
+                video_path, gesture_name, _ = futures[future]
+                try:
+                    window_count = future.result()
+                except Exception as e:
+                    logger.error(f"❌ 처리 실패 ({video_path}): {e}")
+                    continue
+                
+                if window_count is None:
+                    continue
+                    
+                processed_count[gesture_name] += 1
+                logger.info(f"완료: {Path(video_path).name} -> {window_count}개 윈도우")
+        
+        for gesture_name, count in processed_count.items():
+            logger.info(f"{gesture_name} 제스처 처리 완료: {count}개 영상")
+    
+    def consolidate_dataset(self, output_root: str = None) -> Optional[Dict]:
+        """
+        영상별 .npz 파일을 하나의 통합 저장소로 변환
+        - windows.npy: (N, 30, 17, 2) FP16, 학습 시 memmap으로 로드
+        - labels.npy: (N,) 제스처 ID
+        - dataset_manifest.json: 제스처별 구간 정보
+        """
+        if output_root is None:
+            output_root = PATHS['processed_data']
+            
+        output_path = Path(output_root)
+        store = DATA_CONFIG['dataset_store']
+        
+        # 영상별 윈도우 수집 (윈도우당 수 KB라 한 번에 읽어도 부담 없음)
+        chunks = []
+        manifest = {"total_samples": 0, "gestures": {}}
+        for gesture_id, gesture_name in GESTURE_CLASSES.items():
+            gesture_folder = output_path / gesture_name
+            start = manifest["total_samples"]
+            
+            for npz_file in sorted(gesture_folder.glob("*.npz")):
+                with np.load(npz_file) as npz:
+                    windows = npz['w']
+                chunks.append((gesture_id, windows))
+                manifest["total_samples"] += len(windows)
+            
+            manifest["gestures"][gesture_name] = {
+                "id": gesture_id,
+                "start": start,
+                "count": manifest["total_samples"] - start
+            }
+        
+        total = manifest["total_samples"]
+        if total == 0:
+            logger.warning("⚠️ 통합할 윈도우가 없습니다.")
+            return None
+        
+        window_shape = chunks[0][1].shape[1:]
+        windows_store = np.lib.format.open_memmap(
+            output_path / store['windows'], mode='w+', dtype=np.float16, shape=(total,) + window_shape)
+        labels = np.empty(total, dtype=np.int64)
+        
+        offset = 0
+        for gesture_id, windows in chunks:
+            windows_store[offset:offset + len(windows)] = windows
+            labels[offset:offset + len(windows)] = gesture_id
+            offset += len(windows)
+        
+        windows_store.flush()
+        del windows_store
+        np.save(output_path / store['labels'], labels)
+        
+        manifest["window_shape"] = list(window_shape)
+        manifest["dtype"] = "float16"
+        with open(output_path / store['manifest'], 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        
+        logger.info(f"📦 통합 저장소 생성: {output_path / store['windows']} ({total}개 윈도우)")
+        return manifest
     
     def create_dataset_summary(self, output_root: str = None):
         """
@@ -369,14 +558,18 @@ class PoseDataPreprocessor:
         output_path = Path(output_root)
         summary = {
             "total_samples": 0,
+            "target_fps": DATA_CONFIG.get('target_fps', DATA_CONFIG['fps']),
             "gestures": {}
         }
         
         for gesture_id, gesture_name in GESTURE_CLASSES.items():
             gesture_folder = output_path / gesture_name
             if gesture_folder.exists():
-                npy_files = list(gesture_folder.glob("*.npy"))
-                sample_count = len(npy_files)
+                # 영상별 .npz 파일에 담긴 윈도우 수 합산
+                sample_count = 0
+                for npz_file in gesture_folder.glob("*.npz"):
+                    with np.load(npz_file) as npz:
+                        sample_count += npz['w'].shape[0]
                 
                 summary["gestures"][gesture_name] = {
                     "id": gesture_id,
@@ -418,6 +611,24 @@ class PoseDataPreprocessor:
         else:
             logger.error("❌ 정리 실패!")
 
+# 워커 프로세스별 전처리기 (MediaPipe 객체는 fork-safe하지 않으므로 워커 안에서 생성)
+_worker_preprocessor = None
+
+# 워커 프로세스의 BLAS/OpenMP 스레드 수 (import 전에 설정되어야 적용됨)
+WORKER_THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS')
+
+def _init_worker(num_threads: int):
+    """프로세스 풀 워커 초기화: OpenCV 내부 스레드 수 제한 (BLAS/OpenMP는 부모가 설정한 환경 변수로 제한)"""
+    cv2.setNumThreads(num_threads)
+
+def _process_one_video(path: str, gesture_name: str, output_dir: str) -> Optional[int]:
+    """프로세스 풀 워커: 영상 하나를 처리하고 윈도우를 저장한 뒤 윈도우 수만 반환"""
+    global _worker_preprocessor
+    if _worker_preprocessor is None:
+        _worker_preprocessor = PoseDataPreprocessor()
+    
+    return _worker_preprocessor.process_video_file(Path(path), Path(output_dir), gesture_name)
+
 if __name__ == "__main__":
     import sys
     
@@ -438,6 +649,10 @@ if __name__ == "__main__":
         logger.info("📹 회전된 영상에서 자세 데이터 추출 중...")
         preprocessor.process_all_gestures()
         
+        # 학습용 통합 저장소 생성
+        logger.info("📦 학습용 통합 저장소 생성 중...")
+        preprocessor.consolidate_dataset()
+        
         # 데이터셋 요약
         logger.info("📊 처리된 데이터셋 요약 생성 중...")
         summary = preprocessor.create_dataset_summary()
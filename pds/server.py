@@ -6,22 +6,257 @@ Main Server와 완전 독립적인 PDS TCP 서버
 
 import socket
 import threading
+import asyncio
 import json
+import queue
+import selectors
 import time
 import logging
-from typing import Dict, Optional, Callable
+import os
+import gc
+import signal
+import struct
+from typing import Dict, Optional, Callable, Tuple
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import cv2
+import math
 import numpy as np
 import torch
 import mediapipe as mp
-from collections import deque
+from operator import attrgetter
 from pathlib import Path
 
-from config import SERVER_CONFIG, GESTURE_CLASSES, TTS_MESSAGES, TCP_GESTURE_NAMES, IMPROVED_GESTURE_CONFIG, NETWORK_CONFIG, DEMO_VIDEO_CONFIG, MEDIAPIPE_CONFIG
-from model import GestureModelManager
+from config import SERVER_CONFIG, PATHS, TCN_CONFIG, GESTURE_CLASSES, TTS_MESSAGES, TCP_GESTURE_NAMES, IMPROVED_GESTURE_CONFIG, NETWORK_CONFIG, DEMO_VIDEO_CONFIG, MEDIAPIPE_CONFIG
+from model import GestureModelManager, quantize_dynamic_int8
 from utils import setup_logging
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import openvino as ov
+    OPENVINO_AVAILABLE = True
+except ImportError:
+    OPENVINO_AVAILABLE = False
+
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+try:
+    # 양자화 도구는 onnx 패키지가 추가로 필요
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+    ORT_QUANTIZATION_AVAILABLE = True
+except ImportError:
+    ORT_QUANTIZATION_AVAILABLE = False
+
+try:
+    import tensorrt as trt
+    TENSORRT_AVAILABLE = True
+except ImportError:
+    TENSORRT_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# cv2.pollKey()는 OpenCV 4.5+에만 있음 (없으면 waitKey(1)로 대체)
+POLL_KEY_AVAILABLE = hasattr(cv2, 'pollKey')
+
+# 랜드마크 → (x, y, visibility) 튜플 (map과 함께 관절 좌표를 한 번에 추출)
+LANDMARK_XYV = attrgetter('x', 'y', 'visibility')
+
+def _normalize_pose_kernel(pose_data, normalized_pose):
+    """(17, 3) 자세를 Hip 중심/어깨 너비 기준으로 정규화해 normalized_pose에 기록
+    
+    numba가 있으면 njit으로 컴파일해 작은 배열에서의 NumPy 호출 오버헤드 없이 스칼라 루프로 실행한다.
+    """
+    normalized_pose[:] = pose_data
+    
+    # Hip 중심점 (양쪽 Hip이 보일 때만 정규화)
+    if pose_data[9, 2] > 0.5 and pose_data[10, 2] > 0.5:
+        center_x = (pose_data[9, 0] + pose_data[10, 0]) * 0.5
+        center_y = (pose_data[9, 1] + pose_data[10, 1]) * 0.5
+        
+        # 상대 좌표로 변환 (visibility > 0.5인 관절만)
+        for joint in range(pose_data.shape[0]):
+            if pose_data[joint, 2] > 0.5:
+                normalized_pose[joint, 0] -= center_x
+                normalized_pose[joint, 1] -= center_y
+        
+        # 스케일 정규화 (어깨 너비 기준)
+        if pose_data[3, 2] > 0.5 and pose_data[4, 2] > 0.5:
+            dx = pose_data[3, 0] - pose_data[4, 0]
+            dy = pose_data[3, 1] - pose_data[4, 1]
+            shoulder_width = math.sqrt(dx * dx + dy * dy)
+            if shoulder_width > 0:
+                for joint in range(pose_data.shape[0]):
+                    normalized_pose[joint, 0] /= shoulder_width
+                    normalized_pose[joint, 1] /= shoulder_width
+
+if NUMBA_AVAILABLE:
+    _normalize_pose_kernel = njit(cache=True, fastmath=True)(_normalize_pose_kernel)
+
+def normalize_pose_window(window):
+    """(T, 17, 3) 원시 자세 윈도우를 프레임별로 정규화해 (T, 34) 텐서로 반환 (_normalize_pose_kernel과 동일한 규칙)"""
+    pose_xy = window[..., :2]
+    visible = window[..., 2] > 0.5
+    
+    # Hip 중심점 (양쪽 Hip이 보이는 프레임에서 보이는 관절만 이동)
+    hips_visible = visible[:, 9] & visible[:, 10]
+    center = (pose_xy[:, 9] + pose_xy[:, 10]) * 0.5
+    shift_mask = (visible & hips_visible.unsqueeze(1)).unsqueeze(-1)
+    normalized = pose_xy - center.unsqueeze(1) * shift_mask
+    
+    # 스케일 정규화 (Hip 정규화된 프레임 중 양쪽 어깨가 보이고 너비가 0이 아닐 때만)
+    shoulder_width = (pose_xy[:, 3] - pose_xy[:, 4]).norm(dim=-1)
+    scale_valid = hips_visible & visible[:, 3] & visible[:, 4] & (shoulder_width > 0)
+    scale = torch.where(scale_valid, shoulder_width, torch.ones_like(shoulder_width))
+    normalized = normalized / scale[:, None, None]
+    
+    return normalized.reshape(window.shape[0], -1)
+
+# 제스처명 → 클래스 인덱스 (미리 인코딩된 이벤트 조회용)
+GESTURE_INDEX = {name: idx for idx, name in GESTURE_CLASSES.items()}
+
+# JSON-lines 메시지 구분자 (공백 제거로 페이로드 축소, 수신측 파싱과 호환)
+JSON_SEPARATORS = (',', ':')
+
+# 바이너리 이벤트 프레임: 매직(0x01) | 본문 길이(1바이트) | 본문
+# JSON 줄은 '{'로 시작하므로 수신측은 첫 바이트로 구분 (뒤의 개행은 JSON 줄과 같은 송신 경로를 쓰기 위해 유지)
+BINARY_FRAME_MAGIC = 0x01
+BINARY_EVENT_GESTURE = 1
+GESTURE_EVENT_STRUCT = struct.Struct('!BBf')  # (이벤트 종류, 제스처 클래스 인덱스, 신뢰도)
+
+def encode_binary_gesture_event(gesture_idx: int, confidence: float) -> bytes:
+    """제스처 이벤트를 바이너리 프레임으로 직렬화 (JSON 인코딩/파싱 없음)"""
+    body = GESTURE_EVENT_STRUCT.pack(BINARY_EVENT_GESTURE, gesture_idx, confidence)
+    return bytes((BINARY_FRAME_MAGIC, len(body))) + body
+
+# 클래스 인덱스 → TCP 통신용 제스처 이름 (이벤트마다 dict 조회/upper() 생략)
+TCP_GESTURE_NAME_LIST = [
+    TCP_GESTURE_NAMES.get(GESTURE_CLASSES[idx], GESTURE_CLASSES[idx].upper())
+    for idx in range(len(GESTURE_CLASSES))
+]
+
+# 클래스 인덱스 → 제스처 이벤트 프레임의 고정 부분 ("confidence" 값 앞까지 미리 인코딩)
+GESTURE_EVENT_PREFIXES = [
+    json.dumps({
+        "type": "event",
+        "event": "MARSHALING_GESTURE_DETECTED",
+        "result": tcp_gesture
+    }, ensure_ascii=False, separators=JSON_SEPARATORS)[:-1].encode('utf-8') + b',"confidence":'
+    for tcp_gesture in TCP_GESTURE_NAME_LIST
+]
+
+# sendmsg(벡터 I/O) 지원 여부 (Windows 등 미지원 플랫폼은 연결 후 전송)
+SENDMSG_AVAILABLE = hasattr(socket.socket, 'sendmsg')
+
+# 한 번의 벡터 쓰기로 묶어 보낼 최대 메시지 수 (본문+개행 2개 버퍼씩, IOV_MAX 1024보다 충분히 작게)
+MAX_SEND_BATCH = 64
+
+def send_json_lines(sock, payloads):
+    """여러 JSON 본문을 개행 종결자와 함께 이어붙이지 않고 한 번의 시스템 콜로 전송"""
+    if not SENDMSG_AVAILABLE:
+        sock.sendall(b'\n'.join(payloads) + b'\n')
+        return
+    
+    buffers = []
+    for payload in payloads:
+        buffers.append(payload)
+        buffers.append(b'\n')
+    
+    while buffers:
+        sent = sock.sendmsg(buffers)
+        # 다 보낸 버퍼는 건너뛰고, 부분 전송된 버퍼는 남은 부분만 복사 없이 다시 전송
+        done = 0
+        while done < len(buffers) and sent >= len(buffers[done]):
+            sent -= len(buffers[done])
+            done += 1
+        buffers = buffers[done:]
+        if sent:
+            buffers[0] = memoryview(buffers[0])[sent:]
+
+def configure_tcp_socket(sock):
+    """지연 없는 전송(TCP_NODELAY)과 keepalive 옵션 적용"""
+    if NETWORK_CONFIG.get('tcp_nodelay', True):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if NETWORK_CONFIG.get('tcp_keepalive', True):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Linux 전용 keepalive 세부 설정 (미지원 플랫폼은 OS 기본값 사용)
+        for option, key in (('TCP_KEEPIDLE', 'tcp_keepidle'),
+                            ('TCP_KEEPINTVL', 'tcp_keepintvl'),
+                            ('TCP_KEEPCNT', 'tcp_keepcnt')):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), NETWORK_CONFIG[key])
+
+def dumps_json(obj) -> bytes:
+    """송신 프레임 본문을 compact UTF-8 JSON 바이트로 직렬화 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False, separators=JSON_SEPARATORS).encode('utf-8')
+
+def loads_json(message):
+    """수신 프레임 파싱 (orjson 우선, 오류는 둘 다 json.JSONDecodeError 계열)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(message)
+    return json.loads(message)
+
+@lru_cache(maxsize=32)
+def parse_command(message) -> Tuple[Optional[str], Optional[str]]:
+    """명령 JSON을 (type, command)로 파싱 (반복되는 동일 명령 문자열은 캐시에서 반환)"""
+    command_data = loads_json(message)
+    return command_data.get('type'), command_data.get('command')
+
+@lru_cache(maxsize=16)
+def encode_response_prefix(response_text: str) -> bytes:
+    """응답 프레임의 고정 부분(timestamp 값 앞까지)을 한 번만 인코딩"""
+    head = json.dumps({"type": "response", "response": response_text}, separators=JSON_SEPARATORS)
+    return (head[:-1] + ',"timestamp":"').encode('utf-8')
+
+class GestureConfirmation:
+    """제스처 연속 확신 카운터 (매 프레임 접근하므로 dict 대신 슬롯 속성)"""
+    __slots__ = ('current_gesture', 'confirmation_count', 'required_confirmations', 'confidence_threshold')
+    
+    def __init__(self, required_confirmations: int = 30, confidence_threshold: float = 0.9):
+        self.current_gesture = None
+        self.confirmation_count = 0
+        self.required_confirmations = required_confirmations  # 30프레임 연속 (약 1초, 30fps 기준)
+        self.confidence_threshold = confidence_threshold      # 임계값: 90%
+    
+    def reset(self):
+        """진행 중인 카운트만 초기화 (필요 횟수/임계값 유지)"""
+        self.current_gesture = None
+        self.confirmation_count = 0
+
+class GestureDebugInfo:
+    """프레임별 디버그 정보 (검출기가 하나의 인스턴스를 매 프레임 재사용)"""
+    __slots__ = ('gesture_completed', 'motion_duration', 'consistent_gesture',
+                 'consistency_score', 'is_stable_increasing', 'pose_results')
+    
+    def __init__(self):
+        self.gesture_completed = True  # 간단화
+        self.motion_duration = 2.0
+        self.consistent_gesture = None
+        self.consistency_score = 0.0
+        self.is_stable_increasing = True
+        self.pose_results = None
+
 class SimpleGestureDetector:
     """create_visual_demo.py와 동일한 간단하고 정확한 제스처 검출기"""
     
@@ -32,10 +267,10 @@ class SimpleGestureDetector:
         self.mp_pose = mp.solutions.pose
         self.pose = self.mp_pose.Pose(
             static_image_mode=False,
-            model_complexity=1,
+            model_complexity=MEDIAPIPE_CONFIG['model_complexity'],
             enable_segmentation=False,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
+            min_detection_confidence=MEDIAPIPE_CONFIG['min_detection_confidence'],
+            min_tracking_confidence=MEDIAPIPE_CONFIG['min_tracking_confidence']
         )
         self.mp_drawing = mp.solutions.drawing_utils
         
@@ -46,27 +281,275 @@ class SimpleGestureDetector:
         self.model.to(self.device)
         self.model.eval()
         
-        # 자세 버퍼 (30프레임)
-        self.pose_buffer = deque(maxlen=30)
+        # 컴파일된 추론 함수 (detector_backend가 'openvino', 'onnx', 'tensorrt'일 때만 사용)
+        self.compiled_model = None
+        self.trt_engine = None
+        backend = SERVER_CONFIG.get('detector_backend', 'torch')
+        if backend == 'openvino':
+            self._compile_openvino_model()
+        elif backend == 'onnx':
+            self._load_onnx_session()
+        elif backend == 'tensorrt':
+            self._load_tensorrt_engine()
+        elif (self.device.type == 'cpu' and SERVER_CONFIG.get('cpu_int8_onnx', False)
+                and ORT_QUANTIZATION_AVAILABLE):
+            # CPU 전용 환경: 작은 모델은 PyTorch FP32 디스패치보다 onnxruntime INT8이 빠름
+            self._load_int8_onnx_session()
+        
+        # CPU PyTorch 백엔드 (INT8 ONNX를 못 쓴 경우): trace 전에 INT8 동적 양자화
+        if (self.compiled_model is None and self.device.type == 'cpu'
+                and SERVER_CONFIG.get('cpu_int8_torch', False)):
+            self._quantize_torch_model()
+        
+        # PyTorch 백엔드는 TorchScript로 고정해 Python 디스패치 오버헤드 감소
+        if self.compiled_model is None and SERVER_CONFIG.get('torchscript', True):
+            self._trace_torch_model()
+        
+        # 자세 윈도우 링 버퍼 (30프레임 × 34) - 각 프레임을 slot과 slot+30에 두 번 기록해
+        # 최근 30프레임이 항상 연속 구간이 되도록 유지 (매 프레임 리스트 → 배열 변환/할당 없음)
+        self.sequence_length = TCN_CONFIG['sequence_length']
+        feature_size = TCN_CONFIG['input_size']
+        self.pose_ring = torch.zeros((2 * self.sequence_length, feature_size), dtype=torch.float32,
+                                     pin_memory=self.device.type == 'cuda')
+        self.pose_ring_np = self.pose_ring.numpy()  # 같은 메모리의 numpy 뷰 (쓰기용)
+        self.pose_count = 0
+        self.device_window = torch.empty((1, self.sequence_length, feature_size), device=self.device)
+        
+        # CUDA PyTorch 백엔드: 프레임마다 원시 (x, y, visibility) 한 행만 GPU 링 버퍼에 올리고
+        # 정규화와 윈도우 구성은 예측 시 GPU에서 수행 (예측마다 30×34 윈도우 전송 없음)
+        self.gpu_pose_ring = None
+        if (self.device.type == 'cuda' and self.compiled_model is None
+                and SERVER_CONFIG.get('gpu_pose_normalize', True)):
+            ring_shape = (2 * self.sequence_length, len(MEDIAPIPE_CONFIG['key_landmarks']), 3)
+            self.raw_pose_ring = torch.zeros(ring_shape, dtype=torch.float32, pin_memory=True)
+            self.raw_pose_ring_np = self.raw_pose_ring.numpy()
+            self.gpu_pose_ring = torch.zeros(ring_shape, dtype=torch.float32, device=self.device)
+        
+        # N프레임마다 한 번만 추론하고 사이 프레임은 직전 결과 재사용 (제스처는 100ms 이상 지속)
+        self.predict_stride = max(1, SERVER_CONFIG.get('predict_stride', 3))
+        self.predict_counter = 0
+        self.last_prediction = (None, 0.0)
         self.key_landmarks = MEDIAPIPE_CONFIG['key_landmarks']
         
+        # MediaPipe 입력 축소 (랜드마크는 정규화 좌표라 원본 프레임에 그대로 적용됨)
+        self.pose_input_short_side = SERVER_CONFIG.get('pose_input_short_side', 256)
+        
+        # 축소/RGB 변환 결과를 받을 재사용 버퍼 (해상도가 바뀔 때만 재할당, GUI 스레드 전용)
+        self._resize_buf = None
+        self._rgb_buf = None
+        
+        # 프레임마다 덮어쓰는 디버그 정보 (dict 할당 제거)
+        self.debug_info = GestureDebugInfo()
+        
+        # numba 정규화 커널을 첫 프레임 전에 컴파일 (cache=True라 이후 실행은 캐시에서 로드)
+        if NUMBA_AVAILABLE:
+            self.normalize_pose_data(np.zeros((len(self.key_landmarks), 3), dtype=np.float32))
+        
         self.logger.info("✅ 간단한 제스처 검출기 초기화 완료")
     
+    def _compile_openvino_model(self):
+        """TCN 모델을 OpenVINO로 변환/컴파일 (실패 시 PyTorch 추론 유지)"""
+        if not OPENVINO_AVAILABLE:
+            self.logger.warning("⚠️ openvino가 설치되지 않아 PyTorch 백엔드를 사용합니다")
+            return
+        
+        try:
+            example_input = torch.zeros(1, TCN_CONFIG['sequence_length'], TCN_CONFIG['input_size'])
+            ov_model = ov.convert_model(self.model.cpu(), example_input=example_input)
+            self.compiled_model = ov.Core().compile_model(ov_model, 'CPU', {'PERFORMANCE_HINT': 'LATENCY'})
+            self.logger.info("✅ OpenVINO 백엔드로 TCN 모델 컴파일 완료")
+        except Exception as e:
+            self.logger.warning(f"⚠️ OpenVINO 변환 실패, PyTorch 백엔드 사용: {e}")
+            self.compiled_model = None
+            self.model.to(self.device)
+    
+    def _quantize_torch_model(self):
+        """TCN 모델을 INT8 동적 양자화 (양자화 엔진이 없거나 실패하면 FP32 모델 유지)"""
+        if set(torch.backends.quantized.supported_engines) <= {'none'}:
+            self.logger.warning("⚠️ PyTorch 양자화 엔진이 없어 FP32 모델을 사용합니다")
+            return
+        
+        try:
+            self.model = quantize_dynamic_int8(self.model)
+            self.logger.info("✅ INT8 동적 양자화 모델 준비 완료")
+        except Exception as e:
+            self.logger.warning(f"⚠️ INT8 동적 양자화 실패, FP32 모델 사용: {e}")
+    
+    def _trace_torch_model(self):
+        """TCN 모델을 고정 입력 크기로 trace 후 추론용 최적화 (실패 시 eager 모델 유지)"""
+        try:
+            example_input = torch.zeros(1, TCN_CONFIG['sequence_length'], TCN_CONFIG['input_size'], device=self.device)
+            with torch.no_grad():
+                traced = torch.jit.trace(self.model, example_input)
+            self.model = torch.jit.optimize_for_inference(torch.jit.freeze(traced.eval()))
+            self.logger.info("✅ TorchScript 추론 모델 준비 완료")
+        except Exception as e:
+            self.logger.warning(f"⚠️ TorchScript 변환 실패, eager 모델 사용: {e}")
+    
+    def _load_onnx_session(self, onnx_path: str = None, providers: list = None):
+        """내보낸 ONNX 모델을 onnxruntime 세션으로 로드 (실패 시 PyTorch 추론 유지)"""
+        if not ONNXRUNTIME_AVAILABLE:
+            self.logger.warning("⚠️ onnxruntime이 설치되지 않아 PyTorch 백엔드를 사용합니다")
+            return
+        
+        onnx_path = onnx_path or PATHS['onnx_model_file']
+        if not os.path.exists(onnx_path):
+            self.logger.warning(f"⚠️ ONNX 모델이 없어 PyTorch 백엔드를 사용합니다: {onnx_path}")
+            return
+        
+        try:
+            available = ort.get_available_providers()
+            providers = providers or SERVER_CONFIG.get('onnx_providers', ['CPUExecutionProvider'])
+            providers = [p for p in providers if p in available]
+            session = ort.InferenceSession(onnx_path, providers=providers or None)
+            input_name = session.get_inputs()[0].name
+            
+            # OpenVINO 컴파일 모델과 같은 호출 형태 (입력 배열 → 출력 리스트)
+            self.compiled_model = lambda inputs: session.run(None, {input_name: inputs})
+            self.logger.info(f"✅ ONNX Runtime 백엔드 로드 완료: {session.get_providers()}")
+        except Exception as e:
+            self.logger.warning(f"⚠️ ONNX Runtime 로드 실패, PyTorch 백엔드 사용: {e}")
+            self.compiled_model = None
+    
+    def _ensure_fresh_onnx(self) -> Optional[str]:
+        """ONNX 모델이 없거나 체크포인트(.pth)보다 오래됐으면 다시 내보냄 (실패 시 None)"""
+        onnx_path = PATHS['onnx_model_file']
+        model_path = self.model_manager.model_path
+        if os.path.exists(onnx_path):
+            if not os.path.exists(model_path) or os.path.getmtime(onnx_path) >= os.path.getmtime(model_path):
+                return onnx_path
+            self.logger.info(f"🔧 체크포인트가 ONNX 모델보다 새로워 다시 내보냅니다: {model_path}")
+        return self.model_manager.export_onnx(onnx_path)
+    
+    def _load_int8_onnx_session(self):
+        """INT8 동적 양자화 ONNX 모델을 CPU 세션으로 로드 (없거나 ONNX보다 오래됐으면 양자화, 실패 시 PyTorch 추론 유지)"""
+        int8_path = PATHS['onnx_int8_model_file']
+        
+        try:
+            onnx_path = self._ensure_fresh_onnx()
+            if onnx_path is None:
+                return
+            if not os.path.exists(int8_path) or os.path.getmtime(int8_path) < os.path.getmtime(onnx_path):
+                # 가중치를 INT8로 양자화하고 활성값은 실행 중 동적으로 양자화 (VNNI 지원 CPU에서 int8 GEMM)
+                quantize_dynamic(onnx_path, int8_path, weight_type=QuantType.QInt8)
+                self.logger.info(f"🔧 INT8 동적 양자화 모델 생성: {int8_path}")
+        except Exception as e:
+            self.logger.warning(f"⚠️ INT8 양자화 실패, PyTorch 백엔드 사용: {e}")
+            return
+        
+        self._load_onnx_session(int8_path, providers=['CPUExecutionProvider'])
+    
+    def _load_tensorrt_engine(self):
+        """TensorRT FP16 엔진 로드 (없거나 ONNX/체크포인트보다 오래됐으면 다시 빌드, 실패 시 PyTorch 추론 유지)"""
+        if not TENSORRT_AVAILABLE or self.device.type != 'cuda':
+            self.logger.warning("⚠️ TensorRT/CUDA를 사용할 수 없어 PyTorch 백엔드를 사용합니다")
+            return
+        
+        try:
+            trt_logger = trt.Logger(trt.Logger.WARNING)
+            engine_path = PATHS['tensorrt_engine_file']
+            onnx_path = self._ensure_fresh_onnx()
+            if onnx_path is None:
+                return
+            
+            if os.path.exists(engine_path) and os.path.getmtime(engine_path) >= os.path.getmtime(onnx_path):
+                with open(engine_path, 'rb') as f:
+                    serialized_engine = f.read()
+            else:
+                serialized_engine = self._build_tensorrt_engine(trt_logger, engine_path, onnx_path)
+                if serialized_engine is None:
+                    return
+            
+            engine = trt.Runtime(trt_logger).deserialize_cuda_engine(serialized_engine)
+            context = engine.create_execution_context()
+            
+            # 입출력 버퍼는 한 번만 할당 (CUDA 텐서 주소를 바인딩으로 재사용)
+            input_buffer = torch.empty((1, TCN_CONFIG['sequence_length'], TCN_CONFIG['input_size']),
+                                       dtype=torch.float32, device=self.device)
+            output_buffer = torch.empty((1, TCN_CONFIG['num_classes']), dtype=torch.float32, device=self.device)
+            bindings = [input_buffer.data_ptr(), output_buffer.data_ptr()]
+            
+            def run_engine(inputs):
+                input_buffer.copy_(torch.from_numpy(inputs))
+                context.execute_v2(bindings)
+                return [output_buffer.cpu().numpy()]
+            
+            # 엔진/컨텍스트 수명 유지
+            self.trt_engine = (engine, context)
+            self.compiled_model = run_engine
+            self.logger.info(f"✅ TensorRT 엔진 로드 완료: {engine_path}")
+        except Exception as e:
+            self.logger.warning(f"⚠️ TensorRT 엔진 로드 실패, PyTorch 백엔드 사용: {e}")
+            self.trt_engine = None
+            self.compiled_model = None
+    
+    def _build_tensorrt_engine(self, trt_logger, engine_path: str, onnx_path: str):
+        """고정 입력 크기 ONNX 모델로 FP16 엔진 빌드 후 저장"""
+        self.logger.info(f"🔧 TensorRT 엔진 빌드: {onnx_path} → {engine_path}")
+        
+        builder = trt.Builder(trt_logger)
+        network = builder.create_network(1 << int(trt.NetworkDefinitionCreationFlag.EXPLICIT_BATCH))
+        parser = trt.OnnxParser(network, trt_logger)
+        with open(onnx_path, 'rb') as f:
+            if not parser.parse(f.read()):
+                for idx in range(parser.num_errors):
+                    self.logger.error(f"ONNX 파싱 오류: {parser.get_error(idx)}")
+                return None
+        
+        config = builder.create_builder_config()
+        if builder.platform_has_fast_fp16:
+            config.set_flag(trt.BuilderFlag.FP16)
+        
+        serialized_engine = builder.build_serialized_network(network, config)
+        if serialized_engine is None:
+            self.logger.error("❌ TensorRT 엔진 빌드 실패")
+            return None
+        
+        with open(engine_path, 'wb') as f:
+            f.write(serialized_engine)
+        self.logger.info(f"🔧 TensorRT 엔진 빌드 완료: {engine_path}")
+        return serialized_engine
+    
+    def pose_input_size(self, frame_shape) -> Tuple[int, int]:
+        """MediaPipe 입력 크기 (width, height) - 짧은 변이 320px을 넘으면 목표 크기로 축소"""
+        height, width = frame_shape[:2]
+        short_side = min(height, width)
+        if not self.pose_input_short_side or short_side <= 320:
+            return width, height
+        scale = self.pose_input_short_side / short_side
+        return round(width * scale), round(height * scale)
+    
+    def to_pose_input(self, frame, dst=None):
+        """BGR 프레임을 (필요시 축소 후) MediaPipe 입력용 RGB로 변환"""
+        width, height = self.pose_input_size(frame.shape)
+        if (width, height) != (frame.shape[1], frame.shape[0]):
+            # 자세 추정 비용은 픽셀 수에 비례 (랜드마크 정확도는 256~320px에서 포화)
+            if self._resize_buf is None or self._resize_buf.shape != (height, width, 3):
+                self._resize_buf = np.empty((height, width, 3), dtype=np.uint8)
+            frame = cv2.resize(frame, (width, height), dst=self._resize_buf, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=dst)
+    
     def extract_pose_landmarks(self, frame):
         """자세 추출 (create_visual_demo.py와 동일)"""
-        height, width = frame.shape[:2]
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        width, height = self.pose_input_size(frame.shape)
+        if self._rgb_buf is None or self._rgb_buf.shape != (height, width, 3):
+            self._rgb_buf = np.empty((height, width, 3), dtype=np.uint8)
+        self._rgb_buf.flags.writeable = True  # 직전 process()에서 읽기 전용으로 표시됨
+        rgb_frame = self.to_pose_input(frame, dst=self._rgb_buf)
+        return self.extract_pose_landmarks_rgb(rgb_frame)
+    
+    def extract_pose_landmarks_rgb(self, rgb_frame):
+        """이미 RGB로 변환된 프레임에서 자세 추출 (자세 워커 스레드에서 직접 호출)"""
         rgb_frame.flags.writeable = False
         
         results = self.pose.process(rgb_frame)
         
         if results.pose_landmarks:
-            pose_data = []
-            for idx in self.key_landmarks:
-                landmark = results.pose_landmarks.landmark[idx]
-                pose_data.append([landmark.x, landmark.y, landmark.visibility])
+            landmarks = results.pose_landmarks.landmark
+            pose_data = np.array(list(map(LANDMARK_XYV, map(landmarks.__getitem__, self.key_landmarks))),
+                                 dtype=np.float32)
             
-            return np.array(pose_data, dtype=np.float32), results
+            return pose_data, results
         
         return None, results
     
@@ -74,6 +557,11 @@ class SimpleGestureDetector:
         """정규화 (create_visual_demo.py와 동일)"""
         if pose_data.shape[0] == 0:
             return pose_data
+        
+        if NUMBA_AVAILABLE:
+            normalized_pose = np.empty_like(pose_data)
+            _normalize_pose_kernel(pose_data, normalized_pose)
+            return normalized_pose
             
         normalized_pose = pose_data.copy()
         
@@ -84,75 +572,508 @@ class SimpleGestureDetector:
         if left_hip[2] > 0.5 and right_hip[2] > 0.5:
             center = (left_hip[:2] + right_hip[:2]) / 2
             
-            # 상대 좌표로 변환
-            for joint_idx in range(len(self.key_landmarks)):
-                if pose_data[joint_idx][2] > 0.5:
-                    normalized_pose[joint_idx][:2] -= center
+            # 상대 좌표로 변환 (visibility > 0.5인 관절만, 마스크 한 번으로 처리)
+            visible = pose_data[:, 2] > 0.5
+            normalized_pose[visible, :2] -= center
             
             # 스케일 정규화
             left_shoulder = pose_data[3]
             right_shoulder = pose_data[4]
             
             if left_shoulder[2] > 0.5 and right_shoulder[2] > 0.5:
-                shoulder_width = np.linalg.norm(left_shoulder[:2] - right_shoulder[:2])
+                # 2차원 벡터 길이는 math.hypot으로 (np.linalg.norm 디스패치 오버헤드 회피)
+                shoulder_width = math.hypot(left_shoulder[0] - right_shoulder[0], left_shoulder[1] - right_shoulder[1])
                 if shoulder_width > 0:
                     normalized_pose[:, :2] /= shoulder_width
         
         return normalized_pose
     
-    def predict_gesture(self, pose_sequence):
+    def _push_pose(self, normalized_pose):
+        """정규화된 자세의 x,y 34개 값을 링 버퍼의 두 위치에 기록"""
+        slot = self.pose_count % self.sequence_length
+        pose_xy = normalized_pose[:, :2].reshape(-1)
+        self.pose_ring_np[slot] = pose_xy
+        self.pose_ring_np[slot + self.sequence_length] = pose_xy
+        self.pose_count += 1
+    
+    def _push_raw_pose(self, pose_data):
+        """원시 (17, 3) 자세를 고정 메모리 슬롯에 기록하고 그 한 행만 GPU 링 버퍼의 두 위치로 복사
+        
+        고정 메모리 슬롯은 30프레임 뒤에야 다시 쓰이므로 비동기 복사가 끝나기 전에 덮어쓰지 않는다.
+        """
+        slot = self.pose_count % self.sequence_length
+        self.raw_pose_ring_np[slot] = pose_data
+        self.gpu_pose_ring[slot].copy_(self.raw_pose_ring[slot], non_blocking=True)
+        self.gpu_pose_ring[slot + self.sequence_length].copy_(self.gpu_pose_ring[slot], non_blocking=True)
+        self.pose_count += 1
+    
+    def predict_gesture(self):
         """제스처 예측 (create_visual_demo.py와 동일)"""
-        if len(pose_sequence) < 30:
+        if self.pose_count < self.sequence_length:
             return None, 0.0
         
-        # 최근 30프레임 사용
-        input_sequence = np.array(pose_sequence[-30:])  # (30, 17, 3)
-        input_sequence = input_sequence[:, :, :2]  # (30, 17, 2) - x,y만
-        input_sequence = input_sequence.reshape(input_sequence.shape[0], -1)  # (30, 34)
-        
-        # 예측
-        input_tensor = torch.FloatTensor(input_sequence).unsqueeze(0).to(self.device)
-        
-        with torch.no_grad():
-            output = self.model(input_tensor)
-            probabilities = torch.softmax(output, dim=1)
-            confidence, predicted_class = torch.max(probabilities, 1)
+        # 최근 30프레임 사용 (링 버퍼의 연속 구간, 복사 없는 뷰) - (30, 34)
+        start = self.pose_count % self.sequence_length
+        
+        # OpenVINO/ONNX Runtime/TensorRT 백엔드: numpy 입력으로 바로 추론
+        if self.compiled_model is not None:
+            input_sequence = self.pose_ring_np[start:start + self.sequence_length]
+            logits = self.compiled_model(input_sequence[np.newaxis])[0][0]
+            probabilities = np.exp(logits - logits.max())
+            predicted_class = int(probabilities.argmax())
+            confidence_score = float(probabilities[predicted_class] / probabilities.sum())
+            return GESTURE_CLASSES[predicted_class], confidence_score
+        
+        if self.gpu_pose_ring is None:
+            # 예측 (고정 메모리에서 미리 할당한 디바이스 텐서로 비동기 복사)
+            self.device_window[0].copy_(self.pose_ring[start:start + self.sequence_length], non_blocking=True)
+        
+        with torch.inference_mode():
+            if self.gpu_pose_ring is not None:
+                # GPU에 있는 원시 자세 윈도우를 그 자리에서 정규화 (host→device 전송 없음)
+                input_window = normalize_pose_window(
+                    self.gpu_pose_ring[start:start + self.sequence_length]).unsqueeze(0)
+            else:
+                input_window = self.device_window
+            logits = self.model(input_window)
+            
+            # 전체 softmax 대신 최대 logit과 logsumexp로 승리 클래스 확률만 계산
+            max_logit, predicted_class = logits.max(dim=1)
+            confidence = (max_logit - torch.logsumexp(logits, dim=1)).exp()
             
-            predicted_gesture = GESTURE_CLASSES[predicted_class.item()]
-            confidence_score = confidence.item()
+            # 클래스와 신뢰도를 한 번의 device→host 전송으로 가져옴
+            class_value, confidence_score = torch.stack((predicted_class.float(), confidence), dim=1)[0].tolist()
         
-        return predicted_gesture, confidence_score
+        return GESTURE_CLASSES[int(class_value)], confidence_score
     
     def process_frame(self, frame):
         """프레임 처리 (create_visual_demo.py 방식)"""
         # 자세 추정
         pose_data, pose_results = self.extract_pose_landmarks(frame)
-        
+        return self.process_pose(frame, pose_data, pose_results)
+    
+    def process_pose(self, frame, pose_data, pose_results):
+        """추출된 자세로 정규화/링 버퍼 기록/제스처 예측 (자세 워커 결과도 이 경로로 처리)"""
         prediction = None
         confidence = 0.0
         
         if pose_data is not None:
-            normalized_pose = self.normalize_pose_data(pose_data)
-            self.pose_buffer.append(normalized_pose)
+            if self.gpu_pose_ring is not None:
+                self._push_raw_pose(pose_data)
+            else:
+                normalized_pose = self.normalize_pose_data(pose_data)
+                self._push_pose(normalized_pose)
             
-            if len(self.pose_buffer) == 30:
-                prediction, confidence = self.predict_gesture(list(self.pose_buffer))
-        
-        debug_info = {
-            'gesture_completed': True,  # 간단화
-            'motion_duration': 2.0,
-            'consistency_info': {
-                'consistent_gesture': prediction,
-                'consistency_score': confidence if prediction else 0
-            },
-            'confidence_trend': {
-                'is_stable_increasing': True
-            },
-            'pose_results': pose_results
-        }
+            if self.pose_count >= self.sequence_length:
+                if self.predict_counter % self.predict_stride == 0:
+                    self.last_prediction = self.predict_gesture()
+                self.predict_counter += 1
+                prediction, confidence = self.last_prediction
+        else:
+            # 자세를 놓치면 다음 검출 프레임에서 바로 새로 추론
+            self.predict_counter = 0
+        
+        debug_info = self.debug_info
+        debug_info.consistent_gesture = prediction
+        debug_info.consistency_score = confidence if prediction else 0
+        debug_info.pose_results = pose_results
         
         return frame, prediction, confidence, debug_info
 
+class TextSpriteCache:
+    """putText 결과를 스프라이트로 캐시해 복사로 그리는 글리프 아틀라스
+    
+    고정 문자열은 통째로, 숫자처럼 매 프레임 바뀌는 부분은 글자 단위로 캐시해
+    Hershey 획 래스터화를 한 번만 수행한다. 프레임 밖으로 나가는 글자는 putText로 그린다.
+    """
+    
+    def __init__(self, font=cv2.FONT_HERSHEY_SIMPLEX, max_sprites: int = 512):
+        self.font = font
+        self.max_sprites = max_sprites
+        self.sprites = {}  # (text, scale, color, thickness) -> (sprite, mask, origin_x, origin_y, advance)
+    
+    def _get_sprite(self, text: str, scale: float, color: Tuple, thickness: int):
+        key = (text, scale, color, thickness)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            if len(self.sprites) >= self.max_sprites:
+                self.sprites.clear()
+            
+            (width, height), baseline = cv2.getTextSize(text, self.font, scale, thickness)
+            pad = thickness
+            canvas = np.zeros((height + baseline + 2 * pad, width + 2 * pad, 3), dtype=np.uint8)
+            cv2.putText(canvas, text, (pad, height + pad), self.font, scale, color, thickness)
+            
+            # getTextSize 폭에는 획 두께가 더해져 있으므로 다음 글자까지의 진행 폭은 두께를 뺀 값
+            sprite = (canvas, canvas.any(axis=2)[:, :, None], pad, height + pad, width - thickness)
+            self.sprites[key] = sprite
+        return sprite
+    
+    def draw(self, frame, segments, org: Tuple[int, int], scale: float, color: Tuple, thickness: int):
+        """segments: [(텍스트, 고정 여부)] - 고정 텍스트는 통째로, 나머지는 글자 단위 스프라이트로 그림"""
+        x, y = org
+        frame_h, frame_w = frame.shape[:2]
+        
+        for text, static in segments:
+            for piece in ((text,) if static else text):
+                sprite, mask, origin_x, origin_y, advance = self._get_sprite(piece, scale, color, thickness)
+                x0, y0 = x - origin_x, y - origin_y
+                h, w = mask.shape[:2]
+                
+                if x0 < 0 or y0 < 0 or x0 + w > frame_w or y0 + h > frame_h:
+                    cv2.putText(frame, piece, (x, y), self.font, scale, color, thickness)
+                else:
+                    np.copyto(frame[y0:y0 + h, x0:x0 + w], sprite, where=mask)
+                x += advance
+
+class CameraFrameGrabber:
+    """실시간 카메라 전용 캡처 스레드 (캡처와 추론을 겹쳐 실행)
+    
+    미리 할당한 3개의 프레임 슬롯(write/ready/read)을 돌려 쓰므로
+    소비자가 처리 중인 프레임은 캡처 스레드가 덮어쓰지 않는다.
+    """
+    
+    def __init__(self, cap):
+        self.logger = logging.getLogger(__name__)
+        self.cap = cap
+        
+        # 트리플 버퍼 슬롯 (첫 프레임 크기로 할당)
+        self._slots = None
+        self._write_idx, self._ready_idx, self._read_idx = 0, 1, 2
+        self._fresh = False
+        self._failed = False
+        self._cond = threading.Condition()
+        
+        self._running = False
+        self._thread = None
+    
+    def start(self):
+        """캡처 스레드 시작"""
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+        return self
+    
+    def _capture_loop(self):
+        """cap.grab()/retrieve()로 write 슬롯을 채우고 ready 슬롯과 교환"""
+        while self._running:
+            if not self.cap.grab():
+                break
+            
+            if self._slots is None:
+                ret, frame = self.cap.retrieve()
+                if not ret or frame is None:
+                    break
+                self._slots = [np.empty_like(frame) for _ in range(3)]
+                self._slots[self._write_idx][...] = frame
+            else:
+                ret, frame = self.cap.retrieve(self._slots[self._write_idx])
+                if not ret or frame is None:
+                    break
+                if frame is not self._slots[self._write_idx]:
+                    # 해상도가 바뀐 경우 OpenCV가 새 배열을 반환
+                    self._slots[self._write_idx] = frame
+            
+            with self._cond:
+                self._write_idx, self._ready_idx = self._ready_idx, self._write_idx
+                self._fresh = True
+                self._cond.notify()
+        
+        with self._cond:
+            self._failed = True
+            self._cond.notify_all()
+    
+    def read(self, timeout: float = 1.0):
+        """최신 프레임 반환 (cap.read()와 동일한 (ret, frame) 형태)"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._fresh or self._failed, timeout)
+            if not self._fresh:
+                return False, None
+            self._ready_idx, self._read_idx = self._read_idx, self._ready_idx
+            self._fresh = False
+            return True, self._slots[self._read_idx]
+    
+    def release(self):
+        """캡처 스레드 중지 및 카메라 해제"""
+        self._running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self.cap.release()
+
+class DemoFrameReader:
+    """데모 영상 전용 읽기 스레드 (디코딩/회전을 추론과 겹쳐 실행)
+    
+    실시간 카메라와 달리 정답 구간과 프레임 번호를 맞춰야 하므로 프레임을 버리지 않고
+    크기가 제한된 큐로 순서대로 넘긴다 (가득 차면 읽기 스레드가 대기).
+    영상 끝에서는 스레드가 직접 처음으로 되감고 _EOF를 한 번 넣어 알린다.
+    """
+    
+    _EOF = object()  # 영상 끝 표시 (디코딩 지연과 구분)
+    
+    def __init__(self, cap, maxsize: int = 2):
+        self.logger = logging.getLogger(__name__)
+        self.cap = cap
+        self._q = queue.Queue(maxsize=maxsize)
+        
+        # 큐 + 소비자가 들고 있는 프레임 + 기록 중인 프레임만큼 슬롯을 돌려 씀
+        # (캡처 객체가 버퍼를 재사용해도 소비자 프레임이 덮어써지지 않음)
+        self._slots = None
+        self._slot_idx = 0
+        
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """읽기 스레드 시작"""
+        self._thread = threading.Thread(target=self._reader_loop, daemon=True)
+        self._thread.start()
+        return self
+    
+    def _next_slot(self, frame):
+        """프레임을 다음 슬롯에 복사해 반환 (해상도가 바뀌면 슬롯 재할당)"""
+        if self._slots is None or self._slots[0].shape != frame.shape:
+            self._slots = [np.empty(frame.shape, dtype=frame.dtype) for _ in range(self._q.maxsize + 2)]
+        slot = self._slots[self._slot_idx]
+        self._slot_idx = (self._slot_idx + 1) % len(self._slots)
+        np.copyto(slot, frame)
+        return slot
+    
+    def _put(self, item) -> bool:
+        """큐에 여유가 생길 때까지 대기 (중지 요청 시 False)"""
+        while not self._stop.is_set():
+            try:
+                self._q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _reader_loop(self):
+        """cap.read()로 큐를 채우고, 영상 끝이면 되감기"""
+        rewound = False
+        while not self._stop.is_set():
+            ret, frame = self.cap.read()
+            if not ret or frame is None:
+                if rewound:
+                    # 되감은 직후에도 읽을 수 없으면 중지
+                    self.logger.warning("⚠️ 데모 영상 읽기 실패 - 읽기 스레드 중지")
+                    break
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                rewound = True
+                if not self._put(self._EOF):
+                    break
+                continue
+            
+            rewound = False
+            if not self._put((True, self._next_slot(frame))):
+                break
+        
+        self._stop.set()
+    
+    def read(self, timeout: float = 1.0):
+        """다음 프레임 반환 (cap.read()와 같은 (ret, frame) 형태)
+        
+        (False, None)은 영상 끝 또는 읽기 스레드 중지, (None, None)은 timeout 안에
+        디코딩이 끝나지 않은 경우 (영상 위치는 그대로이므로 프레임 번호를 유지해야 함)
+        """
+        while True:
+            try:
+                item = self._q.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return False, None
+                timeout -= 0.1
+                if timeout <= 0:
+                    return None, None
+                continue
+            return (False, None) if item is self._EOF else item
+    
+    def set(self, prop_id, value):
+        """되감기는 읽기 스레드가 직접 수행하므로 스레드가 살아 있는지만 반환"""
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return not self._stop.is_set()
+        return False
+    
+    def get(self, prop_id):
+        # FRAME_COUNT 등 고정 속성만 조회 (POS_FRAMES는 큐에 쌓인 만큼 앞서 있음)
+        return self.cap.get(prop_id)
+    
+    def isOpened(self):
+        return not self._stop.is_set()
+    
+    def release(self):
+        """읽기 스레드 중지 및 캡처 해제"""
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self.cap.release()
+
+class PreloadedVideoCapture:
+    """미리 디코딩한 데모 영상 프레임(.npy memmap)을 cv2.VideoCapture처럼 읽는 캡처 객체
+    
+    영상은 처음 한 번만 (백그라운드에서) 디코딩해 옆에 .npy로 저장하고, 이후 재생은 디코더 없이
+    매핑된 메모리에서 프레임을 꺼낸다. 오버레이가 프레임에 직접 그리므로 기본은 재사용 버퍼로 복사해
+    반환하고, 읽기 스레드처럼 자체 슬롯으로 복사하는 소비자에게는 매핑된 행을 그대로 반환한다.
+    """
+    
+    def __init__(self, frames, copy_frames: bool = True):
+        self.frames = frames
+        self.position = 0
+        self._frame_buf = np.empty(frames.shape[1:], dtype=frames.dtype) if copy_frames else None
+    
+    @staticmethod
+    def cache_path(video_path: str) -> str:
+        return video_path + '.npy'
+    
+    @classmethod
+    def is_cache_fresh(cls, video_path: str) -> bool:
+        """디코딩 캐시가 있고 영상보다 새로운지 여부"""
+        cache_path = cls.cache_path(video_path)
+        return os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(video_path)
+    
+    @classmethod
+    def build_cache(cls, video_path: str, max_bytes: int) -> bool:
+        """영상을 디코딩해 .npy 캐시 생성 (시간이 걸리므로 GUI 스레드 밖에서 호출). 캐시가 너무 크면 False"""
+        logger = logging.getLogger(__name__)
+        cache_path = cls.cache_path(video_path)
+        
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            return False
+        
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        ret, frame = cap.read()
+        if not ret or frame is None or frame_count <= 0:
+            cap.release()
+            return False
+        if frame_count * frame.nbytes > max_bytes:
+            cap.release()
+            logger.info(f"🎬 디코딩 캐시 생략 (예상 {frame_count * frame.nbytes / 1024 ** 3:.1f}GB > 최대 크기)")
+            return False
+        
+        # 프레임을 메모리에 쌓지 않고 memmap 파일에 바로 기록 (완성 후 교체해 중간 상태 노출 방지)
+        logger.info(f"🎬 데모 영상 디코딩 캐시 생성: {cache_path}")
+        tmp_path = cache_path + '.tmp.npy'
+        frames = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.uint8,
+                                           shape=(frame_count,) + frame.shape)
+        decoded = 0
+        while ret and frame is not None and decoded < frame_count:
+            if frame.shape != frames.shape[1:]:
+                break  # 해상도가 바뀌는 영상은 앞부분까지만 캐시
+            frames[decoded] = frame
+            decoded += 1
+            ret, frame = cap.read()
+        cap.release()
+        
+        # 컨테이너가 보고한 프레임 수보다 적게 디코딩되면 실제 길이로 다시 저장
+        if decoded < frame_count:
+            trimmed_path = cache_path + '.trim.npy'
+            np.save(trimmed_path, frames[:decoded])
+            del frames
+            os.replace(trimmed_path, tmp_path)
+        else:
+            frames.flush()
+            del frames
+        os.replace(tmp_path, cache_path)
+        logger.info(f"✅ 데모 영상 디코딩 캐시 완료: {decoded}프레임")
+        return True
+    
+    @classmethod
+    def open(cls, video_path: str, copy_frames: bool = True) -> Optional['PreloadedVideoCapture']:
+        """완성된 최신 디코딩 캐시를 memmap으로 연다 (없거나 오래됐으면 None)"""
+        if not cls.is_cache_fresh(video_path):
+            return None
+        frames = np.load(cls.cache_path(video_path), mmap_mode='r')
+        if len(frames) == 0:
+            return None
+        return cls(frames, copy_frames)
+    
+    def isOpened(self):
+        return len(self.frames) > 0
+    
+    def read(self):
+        """다음 프레임 반환 (cap.read()와 동일한 (ret, frame) 형태)
+        
+        copy_frames면 다음 read()에서 재사용되는 버퍼, 아니면 매핑된 읽기 전용 행
+        """
+        if self.position >= len(self.frames):
+            return False, None
+        frame = self.frames[self.position]
+        self.position += 1
+        if self._frame_buf is None:
+            return True, frame
+        np.copyto(self._frame_buf, frame)
+        return True, self._frame_buf
+    
+    def set(self, prop_id, value):
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            self.position = max(0, min(int(value), len(self.frames)))
+            return True
+        return False
+    
+    def get(self, prop_id):
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.position)
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(self.frames))
+        return 0.0
+    
+    def release(self):
+        """매핑 해제 (이후 read()는 실패)"""
+        self.frames = self.frames[:0]
+        self.position = 0
+
+class CommandClientProtocol(asyncio.BufferedProtocol):
+    """명령 클라이언트 프로토콜 (미리 할당한 버퍼에 직접 수신하고 개행 단위로 제자리 분할)"""
+    
+    def __init__(self, server, buffer_size: int):
+        self.server = server
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.filled = 0  # 버퍼에 쌓인 미처리 바이트 수
+        self.transport = None
+        self.address = None
+    
+    def connection_made(self, transport):
+        self.transport = transport
+        self.address = transport.get_extra_info('peername')
+        configure_tcp_socket(transport.get_extra_info('socket'))
+        self.server.clients.add(transport)
+        self.server.logger.info(f"클라이언트 연결: {self.address}")
+    
+    def get_buffer(self, sizehint):
+        if self.filled == len(self.buffer):
+            # 한 줄이 버퍼보다 길면 두 배 크기의 새 버퍼로 옮김 (이전 view가 남아 있을 수 있어 제자리 확장 불가)
+            buffer = bytearray(len(self.buffer) * 2)
+            buffer[:self.filled] = self.buffer
+            self.buffer = buffer
+            self.view = memoryview(buffer)
+        return self.view[self.filled:]
+    
+    def buffer_updated(self, nbytes):
+        start = 0
+        end = self.filled + nbytes
+        idx = self.buffer.find(b'\n', self.filled, end)
+        
+        while idx >= 0:
+            message = bytes(self.view[start:idx]).strip()
+            if message:
+                self.server._process_command(message, self.transport)
+            start = idx + 1
+            idx = self.buffer.find(b'\n', start, end)
+        
+        # 남은 미완성 메시지를 버퍼 앞으로 이동
+        remaining = end - start
+        if start and remaining:
+            self.buffer[:remaining] = self.buffer[start:end]
+        self.filled = remaining
+    
+    def connection_lost(self, exc):
+        if exc:
+            self.server.logger.error(f"클라이언트 처리 오류 {self.address}: {exc}")
+        self.server.clients.discard(self.transport)
+        self.server.logger.info(f"클라이언트 연결 종료: {self.address}")
+
 class IndependentPDSServer:
     """Main Server와 완전 독립적인 PDS TCP 서버"""
     
@@ -167,15 +1088,25 @@ class IndependentPDSServer:
         
         # 소켓들
         self.server_socket = None
-        self.redwing_socket = None
+        self.redwing_socket = None  # RedWing 명령 수신 + 이벤트 송신 공용 (전이중)
+        self.redwing_queue = queue.Queue(maxsize=1024)  # 송신 프레임 큐 (단일 writer 작업만 소켓에 씀)
+        self.redwing_state_lock = threading.Lock()  # 연결 끊김 정리/재연결 예약을 한 번만 수행
+        self.binary_protocol = SERVER_CONFIG.get('binary_protocol', False)  # 제스처 이벤트 바이너리 프레임 송신
+        
+        # RedWing 연결/송수신 작업용 고정 크기 스레드 풀 (재연결마다 스레드 생성 방지)
+        self.redwing_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pds-redwing")
+        self.stop_event = threading.Event()  # 대기 중인 풀 작업을 즉시 깨우기 위한 종료 신호
+        self.marshaling_cv = threading.Condition()  # 대기 모드 GUI 루프를 마샬링 시작 시 깨우기
         
         # 상태
         self.is_running = False
         self.marshaling_active = False
         self.redwing_connected = False
         
-        # 클라이언트 연결 관리
-        self.clients = []
+        # 클라이언트 연결 관리 (asyncio Transport, 명령 루프 스레드에서만 변경)
+        self.clients = set()
+        self.command_loop = None
+        self.command_server = None
         
         # 🎯 간단하고 정확한 제스처 검출기 사용
         self.pose_detector = SimpleGestureDetector()
@@ -183,34 +1114,51 @@ class IndependentPDSServer:
         
         # 제스처 이벤트 관리
         self.last_gesture = None
-        self.last_gesture_time = 0
+        self.last_gesture_time_ns = 0  # time.monotonic_ns() 기준 (벽시계 보정 영향 없음)
         self.gesture_cooldown = 3.0
+        self.gesture_cooldown_ns = int(self.gesture_cooldown * 1e9)
+        
+        # ISO 타임스탬프 캐시 (time_ns, 문자열) - 1ms 이내 송신은 같은 문자열 재사용
+        self.timestamp_cache = (0, '')
         
         # 간단한 제스처 확신도 관리
-        self.gesture_confirmation = {
-            'current_gesture': None,
-            'confirmation_count': 0,
-            'required_confirmations': 30,  # 30프레임 연속 (약 1초, 30fps 기준)
-            'confidence_threshold': 0.9,   # 임계값: 90%
-        }
+        self.gesture_conf = GestureConfirmation(required_confirmations=30, confidence_threshold=0.9)
         
         # 확신도 이력 추적
         self.confirmation_history = []
         
+        # 상태 응답 골격 (요청마다 변하는 값만 갱신, 스레드가 다른 두 경로는 골격을 따로 사용)
+        self.status_template = self._build_status_template("status")
+        self.redwing_status_template = self._build_status_template("status_response")
+        
         # 카메라 객체 재사용을 위한 멤버 변수
         self.camera_cap = None
         self.camera_index = None
         
+        # GUI 표시 설정 (헤드리스 운영 시 비활성화, N프레임마다 갱신)
+        self.debug_display = SERVER_CONFIG.get('debug_display', True)
+        self.display_every_n_frames = max(1, SERVER_CONFIG.get('display_every_n_frames', 1))
+        
         # 🎬 데모 영상 관련 변수
         self.demo_mode = DEMO_VIDEO_CONFIG['enabled']
         self.demo_videos = []
+        self.demo_cache_thread = None  # 데모 영상 디코딩 캐시 생성 스레드
         self.current_demo_video_index = 0
         self.demo_gesture_index = 0
         self.demo_video_in_gesture = 0
         
         # 🎬 데모 영상 세그먼트 정보
         self.demo_segments = []
+        self.demo_gt_table = np.full(0, -1, dtype=np.int8)  # 프레임 번호 → 정답 제스처 번호 (-1: 구간 없음)
+        self.demo_gt_names = []                             # 정답 제스처 번호 → 제스처명
         self.current_frame_idx = 0
+        self.total_frames = 1  # 데모 영상 총 프레임 수 (영상을 열 때 한 번만 조회)
+        
+        # 자세 워커 (MediaPipe를 GUI 루프 밖에서 실행, 1칸 큐로 항상 최신 프레임만 처리)
+        self.pose_worker_enabled = SERVER_CONFIG.get('pose_worker', True) and not self.demo_mode
+        self._frame_q = queue.Queue(maxsize=1)
+        self._result_q = queue.Queue(maxsize=1)
+        self._free_rgb_q = queue.Queue()  # 재사용할 RGB 프레임 버퍼 (큐 1 + 워커 1 + 작성 1 = 최대 3개)
         
         # 색상 정의 (create_visual_demo.py와 동일)
         self.colors = {
@@ -223,6 +1171,29 @@ class IndependentPDSServer:
             'skeleton': (255, 128, 0)  # Orange
         }
         
+        # 스켈레톤 DrawingSpec은 매 프레임 새로 만들지 않고 재사용
+        mp_drawing = self.pose_detector.mp_drawing
+        self.landmark_drawing_spec = mp_drawing.DrawingSpec(
+            color=self.colors['skeleton'], thickness=4, circle_radius=6)
+        self.connection_drawing_spec = mp_drawing.DrawingSpec(
+            color=self.colors['skeleton'], thickness=3)
+        
+        # 오버레이 좌표는 해상도별로 한 번만 계산
+        self.overlay_layout = None
+        self.overlay_layout_size = None
+        
+        # 화면 표시용 축소 (입력 해상도별로 출력 크기와 버퍼를 한 번만 계산/할당, GUI 스레드 전용)
+        self.display_size = None       # (입력 (w, h), 출력 (w, h) 또는 None)
+        self.display_resize_buf = None
+        
+        # 스켈레톤 패치 캐시 (pose_results, 해상도, 패치) - N프레임마다 또는 해상도가 바뀔 때만 다시 그림
+        self.skeleton_draw_interval = max(1, SERVER_CONFIG.get('skeleton_draw_every_n_frames', 2))
+        self.skeleton_canvas = None
+        self.skeleton_cache = None
+        
+        # 오버레이 글자 스프라이트 캐시 (GUI 스레드 전용)
+        self.text_sprites = TextSpriteCache()
+        
         self.logger.info(f"🎯 독립적 PDS 서버 초기화: {self.host}:{self.port}")
 
     def _initialize_camera(self):
@@ -231,15 +1202,16 @@ class IndependentPDSServer:
             return self._initialize_demo_video()
         else:
             # 실제 카메라 초기화 (필요시)
-            import cv2
             for camera_index in [0, 1, 2]:
                 try:
                     cap = cv2.VideoCapture(camera_index)
-                    if cap.isOpened():
-                        ret, frame = cap.read()
-                        if ret and frame is not None:
-                            self.logger.info(f"✅ 카메라 {camera_index} 초기화 성공")
-                            return cap
+                    # 디코딩 없이 grab()만으로 프레임 수신 가능 여부 확인
+                    if cap.isOpened() and cap.grab():
+                        # 드라이버 큐에는 최신 프레임만 유지
+                        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                        self.logger.info(f"✅ 카메라 {camera_index} 초기화 성공")
+                        # 캡처 전용 스레드로 추론과 겹쳐 실행
+                        return CameraFrameGrabber(cap).start()
                     cap.release()
                 except Exception as e:
                     self.logger.warning(f"카메라 {camera_index} 초기화 실패: {e}")
@@ -253,31 +1225,53 @@ class IndependentPDSServer:
         # pose_data_rotated로 만든 데모는 이미 올바른 방향이므로 추가 회전 불필요
         return frame
 
-    def _send_improved_gesture_event(self, gesture: str, confidence: float, debug_info: Dict):
+    def _send_improved_gesture_event(self, gesture: str, confidence: float, debug_info: GestureDebugInfo,
+                                     gesture_idx: int = -1):
         """제스처 이벤트 송신"""
-        # 내부 제스처명을 TCP 통신용 대문자로 변환
-        tcp_gesture = TCP_GESTURE_NAMES.get(gesture, gesture.upper())
-        
-        event = {
-            "type": "event",
-            "event": "MARSHALING_GESTURE_DETECTED",
-            "result": tcp_gesture,
-            "confidence": confidence
-        }
+        # RedWing과 클라이언트가 같은 프레임을 받으므로 한 번만 직렬화
+        if gesture_idx >= 0:
+            # 고정 부분은 미리 인코딩된 바이트, 신뢰도만 json과 같은 float repr로 채움
+            tcp_gesture = TCP_GESTURE_NAME_LIST[gesture_idx]
+            payload = GESTURE_EVENT_PREFIXES[gesture_idx] + repr(float(confidence)).encode('ascii') + b'}'
+        else:
+            # 내부 제스처명을 TCP 통신용 대문자로 변환
+            tcp_gesture = TCP_GESTURE_NAMES.get(gesture) or gesture.upper()
+            event = {
+                "type": "event",
+                "event": "MARSHALING_GESTURE_DETECTED",
+                "result": tcp_gesture,
+                "confidence": confidence
+            }
+            payload = dumps_json(event)
         
-        # RedWing GUI Server로 전송
+        # RedWing GUI Server로 전송 (바이너리 프로토콜 사용 시 고정 길이 프레임)
         if self.redwing_connected:
-            self._send_to_redwing(event)
+            if self.binary_protocol and gesture_idx >= 0:
+                self._send_payload_to_redwing(encode_binary_gesture_event(gesture_idx, confidence))
+            else:
+                self._send_payload_to_redwing(payload)
         
         # 연결된 클라이언트들에게도 전송
-        self._broadcast_to_clients(event)
+        self._broadcast_payload(payload)
         
         self.logger.info(f"🎯 제스처 이벤트 송신: {tcp_gesture} (신뢰도: {confidence:.2f})")
 
+    def _now_iso(self) -> str:
+        """현재 시각 ISO 문자열 (1ms 이내 재호출은 캐시 반환)"""
+        now_ns = time.time_ns()
+        cached_ns, cached_iso = self.timestamp_cache  # 튜플 단위 교체로 스레드 간 일관성 유지
+        if 0 <= now_ns - cached_ns < 1_000_000:
+            return cached_iso
+        
+        iso = datetime.fromtimestamp(now_ns / 1e9).isoformat()
+        self.timestamp_cache = (now_ns, iso)
+        return iso
+
     def start_server(self):
         """독립적 서버 시작"""
         try:
             self.is_running = True
+            self.stop_event.clear()
             
             # PDS 명령 수신 서버 시작
             self._start_command_server()
@@ -298,12 +1292,39 @@ class IndependentPDSServer:
         """서버 중지"""
         self.is_running = False
         self.marshaling_active = False
+        self.stop_event.set()
+        with self.marshaling_cv:
+            self.marshaling_cv.notify_all()
+        try:
+            self.redwing_queue.put_nowait(None)  # writer 작업 깨우기
+        except queue.Full:
+            pass
+        try:
+            self._frame_q.put_nowait(None)  # 자세 워커 깨우기 (가득 차 있으면 1초 타임아웃으로 종료)
+        except queue.Full:
+            pass
+        
+        # RedWing 소켓을 닫아 수신 대기 중인 풀 작업 해제
+        redwing_socket = self.redwing_socket
+        self.redwing_connected = False
+        self.redwing_socket = None
+        if redwing_socket:
+            try:
+                redwing_socket.shutdown(socket.SHUT_RDWR)
+                redwing_socket.close()
+            except OSError:
+                pass
+        self.redwing_pool.shutdown(wait=False)
         
         # 카메라 해제
         if self.camera_cap:
             self.camera_cap.release()
             self.camera_cap = None
         
+        # 명령 수신 이벤트 루프 중지
+        if self.command_loop and self.command_loop.is_running():
+            self.command_loop.call_soon_threadsafe(self.command_loop.stop)
+        
         # OpenCV 윈도우 해제
         try:
             cv2.destroyAllWindows()
@@ -321,13 +1342,12 @@ class IndependentPDSServer:
         self.marshaling_active = True
         self.logger.info("🎯 마샬링 시작")
         
+        # 대기 중인 GUI 루프 깨우기
+        with self.marshaling_cv:
+            self.marshaling_cv.notify_all()
+        
         # 제스처 확신도 상태 리셋
-        self.gesture_confirmation = {
-            'current_gesture': None,
-            'confirmation_count': 0,
-            'required_confirmations': 30,
-            'confidence_threshold': 0.9,
-        }
+        self.gesture_conf.reset()
         
         return True
 
@@ -345,29 +1365,134 @@ class IndependentPDSServer:
         """통합 GUI 스레드 시작"""
         import threading
         
+        # 대기/오류 화면은 내용이 고정이므로 한 번만 렌더링
+        self.standby_frame = self._render_standby_frame()
+        self.camera_error_frame = self._render_camera_error_frame()
+        
+        # 자세 추정 워커 스레드 시작 (실시간 카메라 모드)
+        if self.pose_worker_enabled:
+            pose_thread = threading.Thread(target=self._pose_worker, daemon=True)
+            pose_thread.start()
+        
         # 통합 GUI 관리 스레드 시작
         gui_thread = threading.Thread(target=self._unified_gui_loop, daemon=True)
         gui_thread.start()
         self.logger.info("✅ 통합 GUI 스레드 시작")
 
+    @staticmethod
+    def _put_latest(q: queue.Queue, item):
+        """1칸 큐에 최신 항목만 남김 (대기 중인 이전 항목은 버리고 반환, 생산자는 한 스레드)"""
+        try:
+            stale = q.get_nowait()
+        except queue.Empty:
+            stale = None
+        q.put_nowait(item)
+        return stale
+
+    def _submit_pose_frame(self, frame):
+        """프레임을 재사용 버퍼에 RGB로 변환해 자세 워커에 전달 (처리 안 된 이전 프레임은 버림)
+        
+        카메라 슬롯은 다음 read()에서 재사용되므로 워커에는 별도 버퍼를 넘긴다.
+        MediaPipe 입력용 축소/BGR→RGB 변환이 곧 복사 역할을 하므로 추가 복사는 없다.
+        """
+        width, height = self.pose_detector.pose_input_size(frame.shape)
+        try:
+            rgb_frame = self._free_rgb_q.get_nowait()
+        except queue.Empty:
+            rgb_frame = None
+        if rgb_frame is None or rgb_frame.shape[:2] != (height, width):
+            rgb_frame = np.empty((height, width, 3), dtype=np.uint8)
+        rgb_frame.flags.writeable = True
+        self.pose_detector.to_pose_input(frame, dst=rgb_frame)
+        
+        stale = self._put_latest(self._frame_q, rgb_frame)
+        if stale is not None:
+            self._free_rgb_q.put_nowait(stale)
+
+    def _pose_worker(self):
+        """MediaPipe 자세 추정 전용 스레드 (최신 프레임만 처리하고 결과도 최신 것만 유지)"""
+        self.logger.info("🦴 자세 추정 워커 시작")
+        while self.is_running:
+            try:
+                rgb_frame = self._frame_q.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            if rgb_frame is None:
+                break
+            
+            try:
+                result = self.pose_detector.extract_pose_landmarks_rgb(rgb_frame)
+            except Exception as e:
+                self.logger.error(f"자세 추정 워커 오류: {e}")
+                continue
+            finally:
+                self._free_rgb_q.put_nowait(rgb_frame)
+            
+            self._put_latest(self._result_q, result)
+        self.logger.info("자세 추정 워커 종료")
+
+    @staticmethod
+    def _render_standby_frame():
+        """대기 화면 렌더링"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        cv2.putText(frame, "PDS MARSHALING SYSTEM", (120, 150), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
+        cv2.putText(frame, "STATUS: STANDBY", (200, 220), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 255), 2)
+        cv2.putText(frame, "Waiting for MARSHALING_START", (130, 300), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 1)
+        return frame
+
+    @staticmethod
+    def _render_camera_error_frame():
+        """카메라 오류 화면 렌더링"""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        cv2.putText(frame, "CAMERA ERROR", (200, 240), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
+        return frame
+
     def _start_command_server(self):
-        """PDS 명령 수신 서버 시작"""
+        """PDS 명령 수신 서버 시작 (모든 클라이언트를 단일 asyncio 루프 스레드에서 처리)"""
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        configure_tcp_socket(self.server_socket)  # 수락된 소켓에 상속되는 플랫폼용
         self.server_socket.bind((self.host, self.port))
         self.server_socket.listen(SERVER_CONFIG['max_clients'])
+        self.server_socket.setblocking(False)
         
         self.logger.info(f"PDS 명령 수신 서버 시작: {self.host}:{self.port}")
         
-        # 명령 수신 스레드
-        command_thread = threading.Thread(target=self._handle_commands, daemon=True)
+        # 명령 수신 이벤트 루프 스레드
+        self.command_loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        command_thread = threading.Thread(target=self._run_command_loop, daemon=True)
         command_thread.start()
 
+    def _run_command_loop(self):
+        """명령 수신 이벤트 루프 실행 (stop_server 호출 시 종료)"""
+        loop = self.command_loop
+        asyncio.set_event_loop(loop)
+        
+        try:
+            self.command_server = loop.run_until_complete(loop.create_server(
+                lambda: CommandClientProtocol(self, SERVER_CONFIG['buffer_size']),
+                sock=self.server_socket, backlog=SERVER_CONFIG['max_clients']))
+            loop.run_forever()
+        except Exception as e:
+            if self.is_running:
+                self.logger.error(f"명령 수신 루프 오류: {e}")
+        finally:
+            if self.command_server:
+                self.command_server.close()
+            for transport in tuple(self.clients):
+                transport.close()
+            self.clients.clear()
+            loop.close()
+
     def _start_redwing_connection(self):
         """RedWing GUI Server 연결 시작"""
         if SERVER_CONFIG.get('auto_connect_redwing', True):
-            redwing_thread = threading.Thread(target=self._connect_to_redwing, daemon=True)
-            redwing_thread.start()
+            self.redwing_pool.submit(self._redwing_writer_loop)
+            self.redwing_pool.submit(self._connect_to_redwing)
 
     def _connect_to_redwing(self):
         """RedWing GUI Server에 연결"""
@@ -375,8 +1500,12 @@ class IndependentPDSServer:
         retry_delay = NETWORK_CONFIG['redwing_connect_delay']
         
         for attempt in range(max_retries):
+            if not self.is_running:
+                return
+            
             try:
                 self.redwing_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                configure_tcp_socket(self.redwing_socket)
                 self.redwing_socket.settimeout(NETWORK_CONFIG['connection_timeout'])
                 self.redwing_socket.connect((self.redwing_host, self.redwing_port))
                 
@@ -397,13 +1526,8 @@ class IndependentPDSServer:
                     }
                 })
                 
-                # 연결 유지 스레드 시작
-                heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
-                heartbeat_thread.start()
-                
-                # RedWing 메시지 수신 스레드 시작
-                redwing_message_thread = threading.Thread(target=self._handle_redwing_messages, daemon=True)
-                redwing_message_thread.start()
+                # 메시지 수신 + 하트비트 작업 시작 (연결당 하나)
+                self.redwing_pool.submit(self._redwing_io_loop)
                 
                 break
                 
@@ -417,193 +1541,216 @@ class IndependentPDSServer:
                     self.redwing_socket = None
                 
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    if self.stop_event.wait(retry_delay):
+                        return
                 else:
                     self.logger.error("RedWing GUI Server 연결 포기 - 독립적 모드로 계속 실행")
                     self.redwing_connected = False
 
-    def _heartbeat_loop(self):
-        """RedWing 연결 유지"""
-        while self.is_running and self.redwing_connected:
-            try:
-                time.sleep(NETWORK_CONFIG['heartbeat_interval'])
+    def _redwing_io_loop(self):
+        """RedWing 연결 하나의 메시지 수신과 하트비트를 selectors로 함께 처리"""
+        redwing_socket = self.redwing_socket
+        if not redwing_socket:
+            return
+        
+        buffer = bytearray()  # 완전한 한 줄이 모일 때까지 디코딩하지 않음
+        recv_view = memoryview(bytearray(SERVER_CONFIG['buffer_size']))  # 수신 작업마다 하나씩 재사용
+        heartbeat_interval = NETWORK_CONFIG['heartbeat_interval']
+        next_heartbeat = time.monotonic() + heartbeat_interval
+        
+        selector = selectors.DefaultSelector()
+        selector.register(redwing_socket, selectors.EVENT_READ)
+        
+        self.logger.info("🔄 RedWing 송수신 루프 시작")
+        
+        try:
+            while self.is_running and self.redwing_connected and self.redwing_socket is redwing_socket:
+                # 다음 하트비트 시각까지만 수신 대기
+                events = selector.select(max(0.0, next_heartbeat - time.monotonic()))
+                
+                if events:
+                    # RedWing으로부터 메시지 수신
+                    nbytes = redwing_socket.recv_into(recv_view)
+                    if not nbytes:
+                        self.logger.warning("RedWing 연결이 종료됨")
+                        break
+                    
+                    scan_start = len(buffer)
+                    buffer.extend(recv_view[:nbytes])
+                    
+                    # 개행 문자로 메시지 분할 (새로 받은 구간만 탐색, 처리한 줄은 한 번에 제거)
+                    start = 0
+                    idx = buffer.find(b'\n', scan_start)
+                    while idx >= 0:
+                        message = buffer[start:idx].decode('utf-8').strip()
+                        if message:
+                            self.logger.info(f"📨 RedWing 메시지 수신: {message}")
+                            self._process_redwing_message(message)
+                        start = idx + 1
+                        idx = buffer.find(b'\n', start)
+                    
+                    if start:
+                        del buffer[:start]
                 
-                if self.redwing_socket and self.redwing_connected:
+                # 하트비트 (수신 처리량과 무관하게 일정 주기 유지)
+                now = time.monotonic()
+                if now >= next_heartbeat:
+                    next_heartbeat = now + heartbeat_interval
                     heartbeat = {
                         "type": "heartbeat",
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": self._now_iso(),
                         "status": "active" if self.marshaling_active else "standby"
                     }
                     self._send_to_redwing(heartbeat)
-                
-            except Exception as e:
-                self.logger.warning(f"하트비트 전송 실패: {e}")
-                self.redwing_connected = False
-                # 재연결 시도
-                if NETWORK_CONFIG.get('reconnect_on_failure', True):
-                    self._connect_to_redwing()
-                break
-
-    def _handle_commands(self):
-        """명령 처리 스레드"""
-        while self.is_running:
-            try:
-                client_socket, address = self.server_socket.accept()
-                self.logger.info(f"클라이언트 연결: {address}")
-                
-                self.clients.append(client_socket)
-                
-                # 클라이언트 처리 스레드
-                client_thread = threading.Thread(
-                    target=self._handle_client, 
-                    args=(client_socket, address),
-                    daemon=True
-                )
-                client_thread.start()
-                
-            except Exception as e:
-                if self.is_running:
-                    self.logger.error(f"클라이언트 연결 처리 오류: {e}")
+                    
+        except Exception as e:
+            if self.is_running and self.redwing_connected:
+                self.logger.error(f"RedWing 송수신 오류: {e}")
+        finally:
+            selector.close()
+        
+        self._drop_redwing_connection(redwing_socket)
+        self.logger.info("RedWing 송수신 루프 종료")
 
-    def _handle_client(self, client_socket, address):
-        """개별 클라이언트 처리"""
-        buffer = ""
+    def _drop_redwing_connection(self, redwing_socket):
+        """끊긴 RedWing 소켓 정리 후 재연결을 풀에 예약 (이 소켓이 아직 현재 연결일 때만, 재귀 호출 없음)"""
+        with self.redwing_state_lock:
+            if self.redwing_socket is not redwing_socket:
+                return  # 이미 다른 작업이 정리했거나 새 연결로 교체됨
+            self.redwing_connected = False
+            self.redwing_socket = None
         
         try:
-            while self.is_running:
-                data = client_socket.recv(SERVER_CONFIG['buffer_size']).decode('utf-8')
-                if not data:
+            redwing_socket.close()
+        except OSError:
+            pass
+        
+        if self.is_running and NETWORK_CONFIG.get('reconnect_on_failure', True):
+            self.redwing_pool.submit(self._connect_to_redwing)
+
+    def _redwing_writer_loop(self):
+        """RedWing 송신 큐를 비우는 단일 writer (송신 스레드는 소켓 I/O나 재연결을 기다리지 않음)"""
+        while self.is_running:
+            payload = self.redwing_queue.get()
+            if payload is None or not self.is_running:
+                break
+            
+            # 그사이 쌓인 메시지를 함께 꺼내 한 번의 시스템 콜로 전송
+            payloads = [payload]
+            stop = False
+            while len(payloads) < MAX_SEND_BATCH:
+                try:
+                    payload = self.redwing_queue.get_nowait()
+                except queue.Empty:
                     break
-                
-                buffer += data
-                
-                # 개행 문자로 메시지 분할
-                while '\n' in buffer:
-                    message, buffer = buffer.split('\n', 1)
-                    if message.strip():
-                        self._process_command(message.strip(), client_socket)
-                        
-        except Exception as e:
-            self.logger.error(f"클라이언트 처리 오류 {address}: {e}")
-        finally:
-            client_socket.close()
-            if client_socket in self.clients:
-                self.clients.remove(client_socket)
-            self.logger.info(f"클라이언트 연결 종료: {address}")
+                if payload is None:
+                    stop = True
+                    break
+                payloads.append(payload)
+            
+            # 연결 끊김 중에는 버림
+            redwing_socket = self.redwing_socket
+            if redwing_socket and self.redwing_connected:
+                try:
+                    send_json_lines(redwing_socket, payloads)
+                except Exception as e:
+                    self.logger.error(f"RedWing 송신 오류: {e}")
+                    self._drop_redwing_connection(redwing_socket)
+            
+            if stop:
+                break
 
-    def _process_command(self, message: str, client_socket):
-        """명령 처리"""
+    def _process_command(self, message: bytes, client_transport: asyncio.Transport):
+        """명령 처리 (UTF-8 바이트 메시지를 직접 파싱)"""
         try:
-            command_data = json.loads(message)
-            command_type = command_data.get('type')
-            command = command_data.get('command')
+            command_type, command = parse_command(message)
             
-            self.logger.info(f"명령 수신: {command_data}")
+            self.logger.info(f"명령 수신: type={command_type}, command={command}")
             
             if command_type == 'command':
                 if command == 'MARSHALING_START':
                     self._start_marshaling()
-                    self._send_response(client_socket, "MARSHALING_RECOGNITION_ACTIVATED")
+                    self._send_response(client_transport, "MARSHALING_RECOGNITION_ACTIVATED")
                 elif command == 'MARSHALING_STOP':
                     self._stop_marshaling()
-                    self._send_response(client_socket, "MARSHALING_RECOGNITION_DEACTIVATED")
+                    self._send_response(client_transport, "MARSHALING_RECOGNITION_DEACTIVATED")
                 elif command == 'STATUS':
-                    self._send_status(client_socket)
+                    self._send_status(client_transport)
                 else:
                     self.logger.warning(f"알 수 없는 명령: {command}")
-                    self._send_response(client_socket, "UNKNOWN_COMMAND")
+                    self._send_response(client_transport, "UNKNOWN_COMMAND")
                     
         except json.JSONDecodeError as e:
             self.logger.error(f"JSON 파싱 오류: {e}")
-            self._send_response(client_socket, "INVALID_JSON")
+            self._send_response(client_transport, "INVALID_JSON")
         except Exception as e:
             self.logger.error(f"명령 처리 오류: {e}")
-            self._send_response(client_socket, "PROCESSING_ERROR")
+            self._send_response(client_transport, "PROCESSING_ERROR")
 
-    def _send_response(self, client_socket, response_text: str):
+    def _send_response(self, client_transport: asyncio.Transport, response_text: str):
         """클라이언트에게 응답 전송"""
         try:
-            response = {
-                "type": "response",
-                "response": response_text,
-                "timestamp": datetime.now().isoformat()
-            }
-            message = json.dumps(response) + '\n'
-            client_socket.send(message.encode('utf-8'))
+            # 고정 부분은 캐시된 바이트를 쓰고 timestamp만 매번 채움 (조각을 이어붙이지 않고 벡터 쓰기)
+            client_transport.writelines((encode_response_prefix(response_text),
+                                         self._now_iso().encode('ascii'), b'"}\n'))
         except Exception as e:
             self.logger.error(f"응답 전송 오류: {e}")
 
-    def _send_status(self, client_socket):
-        """상태 정보 전송"""
-        status = {
-            "type": "status",
+    def _build_status_template(self, status_type: str) -> Dict:
+        """상태 응답 dict 골격 생성 (고정 필드만 채움)"""
+        return {
+            "type": status_type,
             "server_info": {
                 "host": self.host,
                 "port": self.port,
-                "running": self.is_running,
-                "marshaling_active": self.marshaling_active,
-                "redwing_connected": self.redwing_connected,
-                "connected_clients": len(self.clients)
+                "running": False,
+                "marshaling_active": False,
+                "redwing_connected": False,
+                "connected_clients": 0
             },
             "gesture_info": {
-                "last_gesture": self.last_gesture,
-                "confirmation_count": self.gesture_confirmation['confirmation_count'],
-                "confidence_threshold": self.gesture_confirmation['confidence_threshold']
+                "last_gesture": None,
+                "confirmation_count": 0,
+                "confidence_threshold": 0.0
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": None
         }
+
+    def _fill_status(self, status: Dict) -> Dict:
+        """상태 골격의 가변 필드만 현재 값으로 갱신"""
+        server_info = status["server_info"]
+        server_info["running"] = self.is_running
+        server_info["marshaling_active"] = self.marshaling_active
+        server_info["redwing_connected"] = self.redwing_connected
+        server_info["connected_clients"] = len(self.clients)
+        
+        confirmation = self.gesture_conf
+        gesture_info = status["gesture_info"]
+        gesture_info["last_gesture"] = self.last_gesture
+        gesture_info["confirmation_count"] = confirmation.confirmation_count
+        gesture_info["confidence_threshold"] = confirmation.confidence_threshold
+        
+        status["timestamp"] = self._now_iso()
+        return status
+
+    def _send_status(self, client_transport: asyncio.Transport):
+        """상태 정보 전송"""
+        status = self._fill_status(self.status_template)
         
         try:
-            message = json.dumps(status) + '\n'
-            client_socket.send(message.encode('utf-8'))
+            client_transport.writelines((dumps_json(status), b'\n'))
         except Exception as e:
             self.logger.error(f"상태 전송 오류: {e}")
 
-    def _handle_redwing_messages(self):
-        """RedWing GUI Server로부터 메시지 수신 처리"""
-        buffer = ""
-        
-        self.logger.info("🔄 RedWing 메시지 수신 스레드 시작")
-        
-        while self.is_running and self.redwing_connected:
-            try:
-                if not self.redwing_socket:
-                    break
-                
-                # RedWing으로부터 메시지 수신
-                data = self.redwing_socket.recv(SERVER_CONFIG['buffer_size']).decode('utf-8')
-                if not data:
-                    self.logger.warning("RedWing 연결이 종료됨")
-                    break
-                
-                buffer += data
-                
-                # 개행 문자로 메시지 분할
-                while '\n' in buffer:
-                    message, buffer = buffer.split('\n', 1)
-                    if message.strip():
-                        self.logger.info(f"📨 RedWing 메시지 수신: {message.strip()}")
-                        self._process_redwing_message(message.strip())
-                        
-            except Exception as e:
-                if self.is_running and self.redwing_connected:
-                    self.logger.error(f"RedWing 메시지 수신 오류: {e}")
-                break
-        
-        self.redwing_connected = False
-        self.logger.info("RedWing 메시지 수신 스레드 종료")
-
     def _process_redwing_message(self, message: str):
         """RedWing으로부터 받은 메시지 처리"""
         try:
-            message_data = json.loads(message)
-            message_type = message_data.get('type')
+            message_type, command = parse_command(message)
             
-            self.logger.info(f"📡 RedWing 메시지 처리: {message_data}")
+            self.logger.info(f"📡 RedWing 메시지 처리: type={message_type}, command={command}")
             
             if message_type == 'command':
-                command = message_data.get('command')
-                
+
                 if command == 'MARSHALING_START':
                     self.logger.info("🎯 RedWing으로부터 마샬링 시작 명령 수신")
                     self._start_marshaling()
@@ -626,43 +1773,25 @@ class IndependentPDSServer:
 
     def _send_status_to_redwing(self):
         """RedWing에 상태 정보 전송"""
-        status = {
-            "type": "status_response",
-            "server_info": {
-                "host": self.host,
-                "port": self.port,
-                "running": self.is_running,
-                "marshaling_active": self.marshaling_active,
-                "redwing_connected": self.redwing_connected,
-                "connected_clients": len(self.clients)
-            },
-            "gesture_info": {
-                "last_gesture": self.last_gesture,
-                "confirmation_count": self.gesture_confirmation['confirmation_count'],
-                "confidence_threshold": self.gesture_confirmation['confidence_threshold']
-            },
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        self._send_to_redwing(status)
+        self._send_to_redwing(self._fill_status(self.redwing_status_template))
 
     def _send_to_redwing(self, data: Dict):
         """RedWing GUI Server에 데이터 송신"""
         if not self.redwing_socket or not self.redwing_connected:
             return False
         
+        return self._send_payload_to_redwing(dumps_json(data))
+
+    def _send_payload_to_redwing(self, payload: bytes):
+        """직렬화된 JSON 본문(개행 제외)을 RedWing 송신 큐에 넣음 (가득 차면 버림)"""
+        if not self.redwing_socket or not self.redwing_connected:
+            return False
+        
         try:
-            message = json.dumps(data, ensure_ascii=False) + '\n'
-            self.redwing_socket.send(message.encode('utf-8'))
+            self.redwing_queue.put_nowait(payload)
             return True
-            
-        except Exception as e:
-            self.logger.error(f"RedWing 송신 오류: {e}")
-            self.redwing_connected = False
-            self.redwing_socket = None
-            # 재연결 시도
-            if NETWORK_CONFIG.get('reconnect_on_failure', True):
-                self._connect_to_redwing()
+        except queue.Full:
+            self.logger.warning("⚠️ RedWing 송신 큐 가득 참 - 메시지 버림")
             return False
 
     def _broadcast_to_clients(self, data: Dict):
@@ -670,19 +1799,37 @@ class IndependentPDSServer:
         if not self.clients:
             return
         
-        message = json.dumps(data, ensure_ascii=False) + '\n'
+        self._broadcast_payload(dumps_json(data))
+
+    def _broadcast_payload(self, payload: bytes):
+        """직렬화된 JSON 본문(개행 제외)을 모든 클라이언트에 브로드캐스트"""
+        if not self.clients:
+            return
         
-        for client in list(self.clients):  # 리스트 복사로 안전하게 순회
+        # 클라이언트 transport는 명령 루프 스레드에서만 다룸 (GUI 스레드에서 호출됨)
+        if self.command_loop and self.command_loop.is_running():
+            self.command_loop.call_soon_threadsafe(self._write_to_clients, payload)
+
+    def _write_to_clients(self, payload: bytes):
+        """명령 루프 스레드에서 모든 클라이언트에 프레임 기록 (본문과 개행을 벡터 쓰기)"""
+        frame = (payload, b'\n')
+        dead = []
+        
+        # connection_lost는 다음 루프 반복에서 호출되므로 순회 중 집합이 바뀌지 않음 (스냅샷 복사 불필요)
+        for client in self.clients:
+            if client.is_closing():
+                continue  # connection_lost에서 목록 정리
             try:
-                client.send(message.encode('utf-8'))
+                client.writelines(frame)
             except Exception as e:
                 self.logger.warning(f"클라이언트 브로드캐스트 실패: {e}")
-                if client in self.clients:
-                    self.clients.remove(client)
-                try:
-                    client.close()
-                except:
-                    pass
+                dead.append(client)
+        
+        # 실패한 클라이언트는 순회가 끝난 뒤 한 번에 제거
+        if dead:
+            self.clients.difference_update(dead)
+            for client in dead:
+                client.close()
 
     def _prepare_demo_videos(self):
         """데모 영상 준비 - concatenated_demo 파일 사용"""
@@ -713,15 +1860,29 @@ class IndependentPDSServer:
         # 세그먼트 정보 로드
         with open(segments_file, 'r', encoding='utf-8') as f:
             self.demo_segments = json.load(f)
+        self._build_ground_truth_table()
         
         self.demo_videos = [{'path': str(latest_demo), 'segments': self.demo_segments}]
         self.logger.info(f"🎬 데모 영상 준비 완료: {latest_demo.name}")
         self.logger.info(f"📊 세그먼트 수: {len(self.demo_segments)}개")
+        
+        # 디코딩 캐시는 백그라운드에서 생성 (완성 전까지는 VideoCapture로 직접 재생)
+        if (DEMO_VIDEO_CONFIG.get('preload_frames', False)
+                and not PreloadedVideoCapture.is_cache_fresh(str(latest_demo))):
+            self.demo_cache_thread = threading.Thread(
+                target=self._build_demo_cache, args=(str(latest_demo),), daemon=True)
+            self.demo_cache_thread.start()
+    
+    def _build_demo_cache(self, video_path: str):
+        """데모 영상 디코딩 캐시 생성 스레드 (실패해도 직접 재생은 계속 가능)"""
+        try:
+            PreloadedVideoCapture.build_cache(
+                video_path, DEMO_VIDEO_CONFIG.get('preload_max_bytes', 1024 ** 3))
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ 데모 영상 디코딩 캐시 생성 실패: {e}")
 
     def _initialize_demo_video(self):
         """데모 영상 초기화"""
-        import cv2
-        
         # 데모 영상 준비
         if not self.demo_videos:
             self._prepare_demo_videos()
@@ -730,9 +1891,18 @@ class IndependentPDSServer:
             self.logger.error("❌ 데모 영상 파일이 없습니다")
             return None
         
-        # 데모 영상 파일 열기
+        # 데모 영상 파일 열기 (완성된 디코딩 캐시가 있으면 memmap에서 재생)
         demo_video = self.demo_videos[0]
-        cap = cv2.VideoCapture(demo_video['path'])
+        use_reader = DEMO_VIDEO_CONFIG.get('reader_thread', True)
+        cap = None
+        if DEMO_VIDEO_CONFIG.get('preload_frames', False):
+            try:
+                # 읽기 스레드가 자체 슬롯으로 복사하므로 그때는 매핑된 행을 그대로 넘김 (이중 복사 방지)
+                cap = PreloadedVideoCapture.open(demo_video['path'], copy_frames=not use_reader)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"⚠️ 데모 영상 디코딩 캐시 사용 실패, 직접 재생: {e}")
+        if cap is None:
+            cap = cv2.VideoCapture(demo_video['path'])
         
         if not cap.isOpened():
             self.logger.error(f"❌ 데모 영상 열기 실패: {demo_video['path']}")
@@ -740,18 +1910,139 @@ class IndependentPDSServer:
         
         self.current_frame_idx = 0
         self.logger.info(f"🎬 데모 영상 시작: {demo_video['path']}")
+        if use_reader:
+            # 디코딩은 읽기 스레드가 미리 수행, GUI 루프는 큐에서 꺼내기만 함
+            return DemoFrameReader(cap, DEMO_VIDEO_CONFIG.get('reader_queue_size', 2)).start()
         return cap
 
+    def _build_ground_truth_table(self):
+        """세그먼트를 한 번 훑어 프레임별 정답 테이블 생성 (매 프레임 구간 검색 대신 인덱싱)"""
+        self.demo_gt_names = sorted({segment['gesture'] for segment in self.demo_segments})
+        name_to_id = {name: i for i, name in enumerate(self.demo_gt_names)}
+        
+        num_frames = max((segment['end_frame'] + 1 for segment in self.demo_segments), default=0)
+        self.demo_gt_table = np.full(num_frames, -1, dtype=np.int8)
+        
+        # 구간이 겹치면 앞 세그먼트가 우선이므로 뒤에서부터 채움
+        for segment in reversed(self.demo_segments):
+            self.demo_gt_table[segment['start_frame']:segment['end_frame'] + 1] = name_to_id[segment['gesture']]
+
     def _get_current_ground_truth(self):
         """현재 프레임의 ground truth 제스처 반환"""
-        if not self.demo_segments:
+        if not 0 <= self.current_frame_idx < len(self.demo_gt_table):
+            return None
+        
+        gt_id = self.demo_gt_table[self.current_frame_idx]
+        return self.demo_gt_names[gt_id] if gt_id >= 0 else None
+
+    def _get_overlay_layout(self, width: int, height: int) -> Dict:
+        """해상도별 오버레이 좌표 (해상도가 바뀔 때만 재계산)"""
+        if self.overlay_layout_size != (width, height):
+            center_x = width // 2
+            self.overlay_layout = {
+                # 반투명 패널 행 범위 (cv2.rectangle은 끝점 포함이라 상단은 0~120행, 겹치는 행은 상단 패널로)
+                'top_panel_rows': slice(0, 121),
+                'bottom_panel_rows': slice(max(121, height - 80), height),
+                'pred_box': ((width - 350, 10), (width - 10, 50)),
+                'pred_text': (width - 340, 35),
+                'bar_bg': ((width - 350, 60), (width - 50, 85)),
+                'bar_origin': (width - 350, 60),
+                'bar_bottom': 85,
+                'conf_text': (width - 340, 100),
+                'status_box': ((center_x - 100, 10), (center_x + 100, 50)),
+                'status_text': (center_x - 80, 35),
+                'system_text': (10, height - 50),
+                'confirm_text': (center_x - 100, height - 50),
+            }
+            # 매 프레임 동일한 글자는 한 번만 래스터화해 패치로 보관
+            self.overlay_layout['live_label'] = self._render_static_patch(width, height, self._draw_live_label)
+            self.overlay_layout['model_label'] = self._render_static_patch(width, height, self._draw_model_label)
+            self.overlay_layout_size = (width, height)
+        return self.overlay_layout
+
+    def _draw_live_label(self, canvas):
+        """실시간 카메라 모드 표시 (정적)"""
+        cv2.rectangle(canvas, (10, 10), (300, 50), (0, 255, 0), 3)
+        cv2.putText(canvas, 'LIVE CAMERA MODE', (20, 35), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+
+    def _draw_model_label(self, canvas):
+        """모델 정보 (정적, 하단 오른쪽)"""
+        height, width = canvas.shape[:2]
+        text_color = self.colors['text']
+        cv2.putText(canvas, "TCN Gesture Model", (width - 200, height - 50), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, text_color, 2)
+        cv2.putText(canvas, "Real-time Recognition", (width - 200, height - 25), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, text_color, 1)
+
+    @staticmethod
+    def _render_static_patch(width: int, height: int, draw: Callable):
+        """정적 요소를 빈 캔버스에 한 번 그려 (영역, 패치, 마스크)로 보관 (그려진 픽셀이 없으면 None)"""
+        canvas = np.zeros((height, width, 3), dtype=np.uint8)
+        draw(canvas)
+        mask = canvas.any(axis=2)
+        ys, xs = np.nonzero(mask)
+        if len(ys) == 0:
+            return None
+        
+        region = (slice(ys.min(), ys.max() + 1), slice(xs.min(), xs.max() + 1))
+        return region, canvas[region].copy(), mask[region][:, :, None]
+
+    @staticmethod
+    def _blit_static_patch(frame, static_patch):
+        """캐시된 정적 패치를 마스크 위치에만 복사"""
+        if static_patch is None:
+            return
+        region, patch, mask = static_patch
+        np.copyto(frame[region], patch, where=mask)
+
+    def _render_skeleton_patch(self, width: int, height: int, pose_landmarks):
+        """재사용 캔버스에 스켈레톤을 그려 (영역, 패치, 마스크)로 반환 (랜드마크 범위만 검사)"""
+        if self.skeleton_canvas is None or self.skeleton_canvas.shape[:2] != (height, width):
+            self.skeleton_canvas = np.zeros((height, width, 3), dtype=np.uint8)
+            self.skeleton_cache = None
+        canvas = self.skeleton_canvas
+        
+        # 직전에 그린 영역만 지움
+        if self.skeleton_cache is not None and self.skeleton_cache[2] is not None:
+            canvas[self.skeleton_cache[2][0]] = 0
+        
+        # 그려질 수 있는 범위: 화면 안 랜드마크의 경계 상자 + 원/테두리 두께 여유
+        landmarks = pose_landmarks.landmark
+        xs = [min(max(lm.x, 0.0), 1.0) for lm in landmarks]
+        ys = [min(max(lm.y, 0.0), 1.0) for lm in landmarks]
+        pad = 16
+        x0, x1 = max(0, int(min(xs) * width) - pad), min(width, int(max(xs) * width) + pad + 1)
+        y0, y1 = max(0, int(min(ys) * height) - pad), min(height, int(max(ys) * height) + pad + 1)
+        if x0 >= x1 or y0 >= y1:
             return None
         
-        for segment in self.demo_segments:
-            if segment['start_frame'] <= self.current_frame_idx <= segment['end_frame']:
-                return segment['gesture']
+        # 스켈레톤을 더 굵고 눈에 띄게
+        self.pose_detector.mp_drawing.draw_landmarks(
+            canvas,
+            pose_landmarks,
+            self.pose_detector.mp_pose.POSE_CONNECTIONS,
+            landmark_drawing_spec=self.landmark_drawing_spec,
+            connection_drawing_spec=self.connection_drawing_spec
+        )
+        
+        region = (slice(y0, y1), slice(x0, x1))
+        mask = canvas[region].any(axis=2)
+        return region, canvas[region].copy(), mask[:, :, None]
+
+    def _draw_skeleton(self, frame, pose_results, frame_count: int):
+        """스켈레톤은 N프레임마다 (새 자세 결과가 있을 때만) 다시 그리고, 그 사이에는 캐시된 패치를 복사"""
+        if not (pose_results and pose_results.pose_landmarks):
+            return
+        
+        height, width = frame.shape[:2]
+        cache = self.skeleton_cache
+        if (cache is None or cache[1] != (width, height)
+                or (cache[0] is not pose_results and frame_count % self.skeleton_draw_interval == 0)):
+            patch = self._render_skeleton_patch(width, height, pose_results.pose_landmarks)
+            self.skeleton_cache = (pose_results, (width, height), patch)
         
-        return None
+        self._blit_static_patch(frame, self.skeleton_cache[2])
 
     def _draw_enhanced_gui_overlay_rotated(self, frame, gesture, confidence, debug_info, frame_count):
         """회전된 프레임에 맞는 오버레이 (create_visual_demo.py 스타일)"""
@@ -759,60 +2050,46 @@ class IndependentPDSServer:
             return frame
         
         height, width = frame.shape[:2]  # 이미 회전된 프레임의 크기
+        layout = self._get_overlay_layout(width, height)
+        colors = self.colors
+        text_color = colors['text']
+        draw_text = self.text_sprites.draw
         
         # 현재 ground truth 가져오기
         gt_gesture = self._get_current_ground_truth() if self.demo_mode else None
         
-        # 반투명 오버레이 패널 생성
-        overlay = frame.copy()
-        
-        # 상단 정보 패널 (반투명 검은 배경)
-        cv2.rectangle(overlay, (0, 0), (width, 120), self.colors['background'], -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
-        
-        # 하단 정보 패널
-        cv2.rectangle(overlay, (0, height-80), (width, height), self.colors['background'], -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        # 반투명 검은 패널: 검은색과 0.7:0.3 블렌딩은 밝기 0.3배와 같으므로 패널 행만 제자리에서 스케일
+        # (전체 프레임 복사/블렌딩 없음, 상단 패널은 기존처럼 두 번 블렌딩된 0.3 × 0.3 밝기 유지)
+        top_panel = frame[layout['top_panel_rows']]
+        cv2.convertScaleAbs(top_panel, dst=top_panel, alpha=0.09)
+        bottom_panel = frame[layout['bottom_panel_rows']]
+        cv2.convertScaleAbs(bottom_panel, dst=bottom_panel, alpha=0.3)
         
         # 자세 스켈레톤 그리기 (회전된 좌표계에서)
-        pose_results = debug_info.get('pose_results')
-        if pose_results and pose_results.pose_landmarks:
-            # 스켈레톤을 더 굵고 눈에 띄게
-            self.pose_detector.mp_drawing.draw_landmarks(
-                frame, 
-                pose_results.pose_landmarks, 
-                self.pose_detector.mp_pose.POSE_CONNECTIONS,
-                landmark_drawing_spec=self.pose_detector.mp_drawing.DrawingSpec(
-                    color=self.colors['skeleton'], thickness=4, circle_radius=6),
-                connection_drawing_spec=self.pose_detector.mp_drawing.DrawingSpec(
-                    color=self.colors['skeleton'], thickness=3)
-            )
+        self._draw_skeleton(frame, debug_info.pose_results, frame_count)
         
         # Ground Truth (왼쪽 상단)
         if gt_gesture:
-            gt_color = self.colors.get(gt_gesture, self.colors['text'])
+            gt_color = colors.get(gt_gesture, text_color)
             cv2.rectangle(frame, (10, 10), (300, 50), gt_color, 3)
-            cv2.putText(frame, f'GROUND TRUTH: {gt_gesture.upper()}', (20, 35), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, gt_color, 2)
+            draw_text(frame, ((f'GROUND TRUTH: {gt_gesture.upper()}', True),), (20, 35), 0.8, gt_color, 2)
         else:
-            # 실시간 카메라 모드
-            cv2.rectangle(frame, (10, 10), (300, 50), (0, 255, 0), 3)
-            cv2.putText(frame, 'LIVE CAMERA MODE', (20, 35), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+            # 실시간 카메라 모드 (캐시된 패치)
+            self._blit_static_patch(frame, layout['live_label'])
         
         # AI 예측 (오른쪽 상단)
         if gesture and confidence > 0:
-            pred_color = self.colors.get(gesture, self.colors['text'])
-            cv2.rectangle(frame, (width-350, 10), (width-10, 50), pred_color, 3)
-            cv2.putText(frame, f'AI PREDICTION: {gesture.upper()}', (width-340, 35), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, pred_color, 2)
+            pred_color = colors.get(gesture, text_color)
+            cv2.rectangle(frame, *layout['pred_box'], pred_color, 3)
+            draw_text(frame, ((f'AI PREDICTION: {gesture.upper()}', True),), layout['pred_text'], 0.8, pred_color, 2)
             
             # 신뢰도 바 (오른쪽 상단 아래)
+            bar_x, bar_y = layout['bar_origin']
             bar_width = int(300 * confidence)
-            cv2.rectangle(frame, (width-350, 60), (width-50, 85), (64, 64, 64), -1)
-            cv2.rectangle(frame, (width-350, 60), (width-350+bar_width, 85), pred_color, -1)
-            cv2.putText(frame, f'Confidence: {confidence:.1%}', (width-340, 100), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors['text'], 2)
+            cv2.rectangle(frame, *layout['bar_bg'], (64, 64, 64), -1)
+            cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, layout['bar_bottom']), pred_color, -1)
+            draw_text(frame, (('Confidence: ', True), (f'{confidence:.1%}', False)), layout['conf_text'], 
+                      0.6, text_color, 2)
         
         # 정확성 표시 (중앙 상단) - 데모 모드에서만
         if self.demo_mode and gesture and gt_gesture:
@@ -820,77 +2097,130 @@ class IndependentPDSServer:
             status_color = (0, 255, 0) if is_correct else (0, 0, 255)
             status_text = "CORRECT" if is_correct else "WRONG"
             
-            cv2.rectangle(frame, (width//2-100, 10), (width//2+100, 50), status_color, 3)
-            cv2.putText(frame, status_text, (width//2-80, 35), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, status_color, 2)
+            cv2.rectangle(frame, *layout['status_box'], status_color, 3)
+            draw_text(frame, ((status_text, True),), layout['status_text'], 0.8, status_color, 2)
         
         # 시스템 상태 (하단 왼쪽)
         if self.demo_mode:
-            total_frames = int(self.camera_cap.get(cv2.CAP_PROP_FRAME_COUNT)) if self.camera_cap else 1
+            total_frames = self.total_frames
             progress = (self.current_frame_idx / total_frames) * 100 if total_frames > 0 else 0
-            status_text = f"Frame: {self.current_frame_idx}/{total_frames} ({progress:.1f}%)"
+            status_segments = [("Frame: ", True), (f"{self.current_frame_idx}/{total_frames} ({progress:.1f}%)", False)]
         else:
-            status_text = f"Frame: {frame_count} | PDS Server Active"
+            status_segments = [("Frame: ", True), (str(frame_count), False), (" | PDS Server Active", True)]
         
         if self.redwing_connected:
-            status_text += " | RedWing Connected"
+            status_segments.append((" | RedWing Connected", True))
         
-        cv2.putText(frame, status_text, (10, height-50), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors['text'], 2)
+        draw_text(frame, status_segments, layout['system_text'], 0.6, text_color, 2)
         
         # 제스처 확신도 정보 (하단 중앙)
-        conf_text = f"Confirmations: {self.gesture_confirmation['confirmation_count']}/{self.gesture_confirmation['required_confirmations']}"
-        cv2.putText(frame, conf_text, (width//2-100, height-50), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors['text'], 2)
+        confirmation = self.gesture_conf
+        conf_count = f"{confirmation.confirmation_count}/{confirmation.required_confirmations}"
+        draw_text(frame, (("Confirmations: ", True), (conf_count, False)), layout['confirm_text'], 
+                  0.6, text_color, 2)
         
-        # 모델 정보 (하단 오른쪽)
-        cv2.putText(frame, "TCN Gesture Model", (width-200, height-50), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors['text'], 2)
-        cv2.putText(frame, "Real-time Recognition", (width-200, height-25), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, self.colors['text'], 1)
+        # 모델 정보 (하단 오른쪽, 캐시된 패치)
+        self._blit_static_patch(frame, layout['model_label'])
         
         return frame
 
-    def _process_improved_gesture_confirmation(self, gesture: str, confidence: float, debug_info: Dict):
+    def _process_improved_gesture_confirmation(self, gesture: str, confidence: float, debug_info: GestureDebugInfo):
         """간단한 제스처 확신도 처리"""
-        current_time = time.time()
+        # 마샬링 중지 후 남은 프레임은 이벤트를 낼 수 없으므로 바로 종료
+        if not self.marshaling_active:
+            return
+        
+        confirmation = self.gesture_conf
         
         # 제스처 확신도 카운팅
-        if self.gesture_confirmation['current_gesture'] == gesture:
-            self.gesture_confirmation['confirmation_count'] += 1
+        if confirmation.current_gesture != gesture:
+            # 새로운 제스처 - 카운트 리셋 (1프레임으로는 확정될 수 없으면 바로 종료)
+            confirmation.current_gesture = gesture
+            confirmation.confirmation_count = 1
+            if confirmation.required_confirmations > 1:
+                return
+            count = 1
         else:
-            # 새로운 제스처 - 카운트 리셋
-            self.gesture_confirmation['current_gesture'] = gesture
-            self.gesture_confirmation['confirmation_count'] = 1
+            count = confirmation.confirmation_count + 1
+            confirmation.confirmation_count = count
         
-        # 필요한 확신 횟수에 도달했는지 확인
-        if self.gesture_confirmation['confirmation_count'] >= self.gesture_confirmation['required_confirmations']:
+        # 필요한 확신 횟수 미달이면 시계 조회/쿨다운 계산 없이 종료
+        if count < confirmation.required_confirmations:
+            return
+        
+        # 쿨다운 체크 (단조 시계 정수 연산)
+        current_ns = time.monotonic_ns()
+        if (self.last_gesture != gesture or 
+            current_ns - self.last_gesture_time_ns > self.gesture_cooldown_ns):
             
-            # 쿨다운 체크
-            if (self.last_gesture != gesture or 
-                current_time - self.last_gesture_time > self.gesture_cooldown):
-                
-                self._send_improved_gesture_event(gesture, confidence, debug_info)
-                self.last_gesture = gesture
-                self.last_gesture_time = current_time
-                
-                # 확신도 카운트 리셋
-                self.gesture_confirmation['confirmation_count'] = 0
-                
-                self.logger.info(f"✅ 확인된 제스처 이벤트: {gesture} (신뢰도: {confidence:.2f})")
+            self._send_improved_gesture_event(gesture, confidence, debug_info, GESTURE_INDEX.get(gesture, -1))
+            self.last_gesture = gesture
+            self.last_gesture_time_ns = current_ns
+            
+            # 확신도 카운트 리셋
+            confirmation.confirmation_count = 0
+            
+            self.logger.info("✅ 확인된 제스처 이벤트: %s (신뢰도: %.2f)", gesture, confidence)
+
+    def _fit_display(self, frame):
+        """최대 1280x720에 맞게 축소 (출력 크기와 버퍼는 입력 해상도가 바뀔 때만 다시 계산)"""
+        h, w = frame.shape[:2]
+        if self.display_size is None or self.display_size[0] != (w, h):
+            out_size = None
+            if w > 1280 or h > 720:
+                scale = min(1280/w, 720/h)
+                out_size = (int(w * scale), int(h * scale))
+                self.display_resize_buf = np.empty((out_size[1], out_size[0], 3), dtype=np.uint8)
+            self.display_size = ((w, h), out_size)
+        
+        out_size = self.display_size[1]
+        if out_size is None:
+            return frame
+        return cv2.resize(frame, out_size, dst=self.display_resize_buf, interpolation=cv2.INTER_AREA)
+
+    def _configure_gesture_loop_thread(self):
+        """제스처 인식 루프 스레드의 CPU 고정/우선순위/GC 설정 (Linux 전용, 실패 시 무시)"""
+        cpu = SERVER_CONFIG.get('gesture_loop_cpu')
+        if cpu is not None and hasattr(os, 'sched_setaffinity'):
+            try:
+                # pid 0 = 호출한 스레드에만 적용
+                os.sched_setaffinity(0, {cpu})
+                self.logger.info(f"📌 제스처 인식 루프 CPU {cpu} 고정")
+            except OSError as e:
+                self.logger.warning(f"CPU 고정 실패: {e}")
+        
+        nice = SERVER_CONFIG.get('gesture_loop_nice', 0)
+        if nice and hasattr(os, 'nice'):
+            try:
+                os.nice(nice)
+                self.logger.info(f"⏫ 제스처 인식 루프 nice {nice} 적용")
+            except OSError as e:
+                self.logger.warning(f"우선순위 변경 실패 (root 권한 필요): {e}")
+        
+        # 초기화 중 생성된 모델/MediaPipe 객체를 GC 추적 대상에서 제외해 프레임 중 전체 수집 비용 감소
+        gc.freeze()
 
     def _unified_gui_loop(self):
         """단일 스레드에서 모든 GUI 관리 (create_visual_demo.py 방식)"""
-        import time
+        self._configure_gesture_loop_thread()
         
         window_name = 'PDS Marshaling System'
-        cv2.namedWindow(window_name, cv2.WINDOW_AUTOSIZE)
-        cv2.moveWindow(window_name, 100, 100)
+        if self.debug_display:
+            cv2.namedWindow(window_name, cv2.WINDOW_AUTOSIZE)
+            cv2.moveWindow(window_name, 100, 100)
         
         # 카메라는 필요할 때만 초기화
         camera_cap = None
         frame_count = 0
         
+        # 대기 화면 재표시 주기 (대기 중에는 화면 갱신 대신 키 입력 대기로 시간을 보냄)
+        standby_redraw_interval = SERVER_CONFIG.get('standby_redraw_interval', 5.0)
+        standby_drawn_at = None
+        wait_ms = 0  # 0이면 대기 없이 키 입력만 확인
+        
+        # 자세 워커의 새 결과가 없는 프레임은 직전 인식 결과를 그대로 표시
+        gesture, confidence, debug_info = None, 0.0, self.pose_detector.debug_info
+        
         self.logger.info("🎯 통합 GUI 루프 시작 (create_visual_demo.py 방식)")
         
         while self.is_running:
@@ -903,49 +2233,68 @@ class IndependentPDSServer:
                         camera_cap = None
                         self.logger.info("📹 카메라 해제 (대기 모드)")
                     
-                    # 대기 화면 표시
-                    frame = np.zeros((480, 640, 3), dtype=np.uint8)
-                    cv2.putText(frame, "PDS MARSHALING SYSTEM", (120, 150), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
-                    cv2.putText(frame, "STATUS: STANDBY", (200, 220), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 255), 2)
-                    cv2.putText(frame, "Waiting for MARSHALING_START", (130, 300), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 1)
+                    if not self.debug_display:
+                        # 헤드리스: 마샬링 시작/서버 종료 신호까지 블록 (1초는 안전용 타임아웃)
+                        with self.marshaling_cv:
+                            self.marshaling_cv.wait_for(
+                                lambda: self.marshaling_active or not self.is_running, timeout=1.0)
+                        continue
                     
-                    cv2.imshow(window_name, frame)
-                    time.sleep(0.5)  # 대기 모드에서는 느리게 업데이트
+                    # 대기 화면은 고정이므로 가끔만 다시 표시 (키 입력은 아래 waitKey가 대기하며 처리)
+                    now = time.monotonic()
+                    if standby_drawn_at is None or now - standby_drawn_at >= standby_redraw_interval:
+                        cv2.imshow(window_name, self.standby_frame)
+                        standby_drawn_at = now
+                    wait_ms = 200
                     
                 else:
                     # === 카메라/데모 영상 피드 모드 ===
+                    standby_drawn_at = None
+                    wait_ms = 0
                     if not camera_cap:
                         # 카메라 또는 데모 영상 초기화
                         camera_cap = self._initialize_camera()
                         if not camera_cap:
                             self.logger.error("❌ 카메라/데모 영상 초기화 실패")
                             # 에러 화면 표시
-                            frame = np.zeros((480, 640, 3), dtype=np.uint8)
-                            cv2.putText(frame, "CAMERA ERROR", (200, 240), 
-                                       cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 255), 2)
-                            cv2.imshow(window_name, frame)
+                            if self.debug_display:
+                                cv2.imshow(window_name, self.camera_error_frame)
                             time.sleep(1.0)
                             continue
                         else:
                             self.logger.info("📹 카메라/데모 영상 초기화 성공")
                             frame_count = 0
+                            if self.demo_mode:
+                                # 진행률 표시용 총 프레임 수는 매 프레임 조회하지 않고 캐시
+                                self.total_frames = int(camera_cap.get(cv2.CAP_PROP_FRAME_COUNT)) or 1
+                            gesture, confidence = None, 0.0
+                            try:
+                                self._result_q.get_nowait()  # 이전 세션의 자세 결과 버림
+                            except queue.Empty:
+                                pass
                             self.camera_cap = camera_cap  # 클래스 변수에도 저장
                     
                     # 프레임 읽기
                     ret, frame = camera_cap.read()
+                    if ret is None:
+                        # 데모 읽기 스레드 디코딩 지연 - 영상 끝이 아니므로 프레임 번호 유지
+                        continue
                     if not ret or frame is None:
                         if self.demo_mode:
                             # 🎬 데모 영상이 끝나면 처음부터 다시 시작
                             self.logger.info("🎬 데모 영상 끝 - 처음부터 다시 시작")
-                            camera_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
                             self.current_frame_idx = 0
+                            if not camera_cap.set(cv2.CAP_PROP_POS_FRAMES, 0):
+                                # 되감기 불가 (읽기 스레드 중지 등) → 다음 반복에서 다시 초기화
+                                camera_cap.release()
+                                camera_cap = None
+                                self.camera_cap = None
                             continue
                         else:
                             self.logger.warning("⚠️ 카메라 프레임 읽기 실패")
+                            camera_cap.release()
                             camera_cap = None
+                            self.camera_cap = None
                             continue
                     
                     frame_count += 1
@@ -954,56 +2303,68 @@ class IndependentPDSServer:
                     
                     # 🎯 create_visual_demo.py와 동일한 제스처 인식 처리
                     try:
-                        processed_frame, gesture, confidence, debug_info = self.pose_detector.process_frame(frame)
-                        display_frame = processed_frame if processed_frame is not None else frame
+                        new_pose = True
+                        if self.pose_worker_enabled:
+                            # MediaPipe는 워커가 수행, 이 루프는 완료된 최신 결과만 꺼냄 (블록 없음)
+                            self._submit_pose_frame(frame)
+                            try:
+                                pose_data, pose_results = self._result_q.get_nowait()
+                            except queue.Empty:
+                                new_pose = False
+                            else:
+                                _, gesture, confidence, debug_info = self.pose_detector.process_pose(
+                                    frame, pose_data, pose_results)
+                            processed_frame = frame
+                        else:
+                            processed_frame, gesture, confidence, debug_info = self.pose_detector.process_frame(frame)
                         
-                        # 제스처 확신도 검증
-                        if gesture and confidence > self.gesture_confirmation['confidence_threshold']:
+                        # 제스처 확신도 검증 (연속 프레임 카운트는 새 자세 결과에서만 증가)
+                        if new_pose and gesture and confidence > self.gesture_conf.confidence_threshold:
                             self._process_improved_gesture_confirmation(gesture, confidence, debug_info)
                         
-                        # 🔄 GUI 표시용 회전 (90도 시계방향)
-                        display_frame = self._auto_rotate_frame(display_frame)
-                        
-                        # 🎨 회전된 프레임에 맞는 오버레이 적용
-                        display_frame = self._draw_enhanced_gui_overlay_rotated(
-                            display_frame, gesture, confidence, debug_info, frame_count)
-                        
-                        # 화면에 맞게 크기 조정 (최대 1280x720)
-                        h, w = display_frame.shape[:2]
-                        if w > 1280 or h > 720:
-                            scale = min(1280/w, 720/h)
-                            new_w, new_h = int(w * scale), int(h * scale)
-                            display_frame = cv2.resize(display_frame, (new_w, new_h))
+                        # 화면 표시는 N프레임마다 한 번만 (인식은 매 프레임 수행)
+                        if self.debug_display and frame_count % self.display_every_n_frames == 0:
+                            display_frame = processed_frame if processed_frame is not None else frame
+                            
+                            # 🔄 GUI 표시용 회전 (90도 시계방향)
+                            display_frame = self._auto_rotate_frame(display_frame)
+                            
+                            # 🎨 회전된 프레임에 맞는 오버레이 적용
+                            display_frame = self._draw_enhanced_gui_overlay_rotated(
+                                display_frame, gesture, confidence, debug_info, frame_count)
+                            
+                            # 화면에 맞게 크기 조정 (최대 1280x720)
+                            cv2.imshow(window_name, self._fit_display(display_frame))
                         
-                        cv2.imshow(window_name, display_frame)
-                        
-                        # 데모 모드에서 정확도 로깅
+                        # 데모 모드에서 정확도 로깅 (매 프레임 경로이므로 로그 레벨이 꺼져 있으면 포맷하지 않도록 % 형식 사용)
                         if self.demo_mode and gesture:
                             gt_gesture = self._get_current_ground_truth()
                             if gt_gesture:
                                 if gesture == gt_gesture:
-                                    self.logger.info(f"✅ 제스처 일치: {gesture} (신뢰도: {confidence:.2f})")
+                                    self.logger.info("✅ 제스처 일치: %s (신뢰도: %.2f)", gesture, confidence)
                                 else:
-                                    self.logger.warning(f"🚨 제스처 불일치: 예상({gt_gesture}) vs 인식({gesture}) (신뢰도: {confidence:.2f})")
+                                    self.logger.warning("🚨 제스처 불일치: 예상(%s) vs 인식(%s) (신뢰도: %.2f)",
+                                                        gt_gesture, gesture, confidence)
                         
                     except Exception as e:
                         self.logger.error(f"제스처 처리 오류: {e}")
-                        # 오류 시 원본 프레임 표시 (회전 및 크기 조정)
-                        cv2.putText(frame, "PROCESSING ERROR", (10, 60), 
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-                        
-                        # GUI 표시용 회전 및 크기 조정
-                        error_frame = self._auto_rotate_frame(frame)
-                        h, w = error_frame.shape[:2]
-                        if w > 1280 or h > 720:
-                            scale = min(1280/w, 720/h)
-                            new_w, new_h = int(w * scale), int(h * scale)
-                            error_frame = cv2.resize(error_frame, (new_w, new_h))
-                        
-                        cv2.imshow(window_name, error_frame)
+                        if self.debug_display:
+                            # 오류 시 원본 프레임 표시 (회전 및 크기 조정)
+                            cv2.putText(frame, "PROCESSING ERROR", (10, 60), 
+                                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+                            
+                            # GUI 표시용 회전 및 크기 조정
+                            error_frame = self._auto_rotate_frame(frame)
+                            cv2.imshow(window_name, self._fit_display(error_frame))
                 
-                # 키 입력 처리
-                key = cv2.waitKey(1) & 0xFF
+                # 키 입력 처리 (GUI 창이 있을 때만)
+                if not self.debug_display:
+                    continue
+                if wait_ms == 0:
+                    # 피드 모드: 매 프레임 1ms씩 자지 않고 창 이벤트 처리 + 키 확인만
+                    key = (cv2.pollKey() if POLL_KEY_AVAILABLE else cv2.waitKey(1)) & 0xFF
+                else:
+                    key = cv2.waitKey(wait_ms) & 0xFF
                 if key == ord('q'):
                     self.logger.info("사용자가 'q' 키로 종료 요청")
                     self.stop_server()
@@ -1023,7 +2384,8 @@ class IndependentPDSServer:
         # 정리
         if camera_cap:
             camera_cap.release()
-        cv2.destroyAllWindows()
+        if self.debug_display:
+            cv2.destroyAllWindows()
         self.logger.info("통합 GUI 루프 종료")
 
 if __name__ == "__main__":
@@ -1063,10 +2425,14 @@ if __name__ == "__main__":
         print("\n💡 스페이스바를 눌러 마샬링을 시작하세요!")
         print("Ctrl+C로 종료")
         
-        # 서버 유지
-        while True:
-            time.sleep(1)
-            
+        # 서버 유지 (SIGINT/SIGTERM 또는 'q' 키의 stop_server 호출 시 깨어남, 주기적 wakeup 없음)
+        signal.signal(signal.SIGINT, lambda *_: server.stop_event.set())
+        signal.signal(signal.SIGTERM, lambda *_: server.stop_event.set())
+        server.stop_event.wait()
+        
     except KeyboardInterrupt:
+        pass
+    
+    if server.is_running:
         print("\n서버 종료 중...")
-        server.stop_server() 
\ No newline at end of file
+        server.stop_server()
\ No newline at end of file
@@ -44,6 +44,11 @@ def train_model():
     model = model_manager.create_model()
     logger.info(f"모델 생성 완료: {model_manager.get_model_info()}")
     
+    # 혼합 정밀도(bf16) 및 그래프 컴파일 - 저장은 컴파일 전 원본 모델로 수행
+    use_amp = use_bf16_autocast(device)
+    train_net = compile_model(model, device)
+    logger.info(f"bf16 autocast: {use_amp}, torch.compile: {train_net is not model}")
+    
     # 손실 함수 및 옵티마이저
     criterion = nn.CrossEntropyLoss()
     optimizer = optim.Adam(model.parameters(), lr=TRAINING_CONFIG['learning_rate'])
@@ -66,10 +71,10 @@ def train_model():
         logger.info(f"\n=== Epoch {epoch+1}/{TRAINING_CONFIG['epochs']} ===")
         
         # 학습
-        train_loss, train_acc = train_epoch(model, train_loader, criterion, optimizer, device)
+        train_loss, train_acc = train_epoch(train_net, train_loader, criterion, optimizer, device, use_amp)
         
         # 검증
-        val_loss, val_acc, val_metrics = validate_epoch(model, test_loader, criterion, device)
+        val_loss, val_acc, val_metrics = validate_epoch(train_net, test_loader, criterion, device, use_amp)
         
         # 스케줄러 업데이트
         scheduler.step(val_loss)
@@ -102,7 +107,7 @@ def train_model():
     logger.info(f"\n학습 완료! 최고 정확도: {best_accuracy:.4f}")
     
     # 최종 평가
-    final_metrics = evaluate_model(model, test_loader, device)
+    final_metrics = evaluate_model(train_net, test_loader, device, use_amp)
     logger.info(f"최종 평가 정확도: {final_metrics['overall_accuracy']:.4f}")
     
     # 클래스별 정확도 출력
@@ -112,9 +117,32 @@ def train_model():
     
     metrics_tracker.save_metrics(final_metrics)
     
+    # 서버 추론용 ONNX 내보내기 (최고 성능 체크포인트 기준)
+    try:
+        onnx_path = model_manager.export_onnx()
+        logger.info(f"ONNX 모델 내보내기: {onnx_path}")
+    except Exception as e:
+        logger.warning(f"ONNX 내보내기 실패 (PyTorch 체크포인트는 유지): {e}")
+    
     return model, metrics_tracker
 
-def train_epoch(model, train_loader, criterion, optimizer, device):
+def use_bf16_autocast(device) -> bool:
+    """bf16 autocast 사용 여부 (Ampere 이상 CUDA에서만, bf16은 GradScaler 불필요)"""
+    return (TRAINING_CONFIG.get('mixed_precision', True)
+            and device.type == 'cuda'
+            and torch.cuda.is_bf16_supported())
+
+def compile_model(model, device):
+    """torch.compile 적용 (지원되지 않으면 원본 모델 반환)
+    
+    기본 모드 사용: 'reduce-overhead'는 CUDA 그래프를 쓰므로 train/eval 전환, 마지막 배치 크기 변화,
+    inference_mode 검증과 같은 모듈을 공유하면 재기록/오류가 발생함
+    """
+    if not TRAINING_CONFIG.get('compile_model', True) or device.type != 'cuda' or not hasattr(torch, 'compile'):
+        return model
+    return torch.compile(model)
+
+def train_epoch(model, train_loader, criterion, optimizer, device, use_amp: bool = False):
     """한 에포크 학습"""
     model.train()
     total_loss = 0.0
@@ -122,11 +150,12 @@ def train_epoch(model, train_loader, criterion, optimizer, device):
     total = 0
     
     for batch_idx, (data, target) in enumerate(train_loader):
-        data, target = data.to(device), target.to(device)
+        data, target = data.to(device, non_blocking=True), target.to(device, non_blocking=True)
         
-        optimizer.zero_grad()
-        output = model(data)
-        loss = criterion(output, target)
+        optimizer.zero_grad(set_to_none=True)
+        with torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=use_amp):
+            output = model(data)
+            loss = criterion(output, target)
         loss.backward()
         optimizer.step()
         
@@ -143,35 +172,38 @@ def train_epoch(model, train_loader, criterion, optimizer, device):
     
     return avg_loss, accuracy
 
-def validate_epoch(model, test_loader, criterion, device):
+def accumulate_class_counts(pred, target, class_correct, class_total):
+    """클래스별 정답/전체 수를 scatter_add로 누적 (샘플 단위 루프 없음)"""
+    class_correct.scatter_add_(0, target, pred.eq(target).long())
+    class_total.scatter_add_(0, target, torch.ones_like(target))
+
+def validate_epoch(model, test_loader, criterion, device, use_amp: bool = False):
     """한 에포크 검증"""
     model.eval()
-    total_loss = 0.0
-    correct = 0
-    total = 0
     
-    # 클래스별 정확도 추적
-    class_correct = [0] * len(GESTURE_CLASSES)
-    class_total = [0] * len(GESTURE_CLASSES)
+    # 손실/정확도를 디바이스 텐서로 누적 (배치마다 .item() 동기화 없음)
+    total_loss = torch.zeros((), device=device)
+    class_correct = torch.zeros(len(GESTURE_CLASSES), dtype=torch.long, device=device)
+    class_total = torch.zeros(len(GESTURE_CLASSES), dtype=torch.long, device=device)
     
-    with torch.no_grad():
+    with torch.inference_mode():
         for data, target in test_loader:
-            data, target = data.to(device), target.to(device)
-            output = model(data)
-            loss = criterion(output, target)
+            data, target = data.to(device, non_blocking=True), target.to(device, non_blocking=True)
+            with torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=use_amp):
+                output = model(data)
+                loss = criterion(output, target)
             
-            total_loss += loss.item()
+            total_loss += loss.float()
             pred = output.argmax(dim=1)
-            correct += pred.eq(target).sum().item()
-            total += target.size(0)
-            
-            # 클래스별 정확도
-            for i in range(target.size(0)):
-                label = target[i].item()
-                class_correct[label] += (pred[i] == target[i]).item()
-                class_total[label] += 1
+            accumulate_class_counts(pred, target, class_correct, class_total)
+    
+    # 에포크 끝에서 한 번만 CPU로 전송
+    class_correct = class_correct.cpu().tolist()
+    class_total = class_total.cpu().tolist()
+    correct = sum(class_correct)
+    total = sum(class_total)
     
-    avg_loss = total_loss / len(test_loader)
+    avg_loss = total_loss.item() / len(test_loader)
     accuracy = correct / total
     
     # 클래스별 정확도 계산
@@ -183,29 +215,26 @@ def validate_epoch(model, test_loader, criterion, device):
     
     return avg_loss, accuracy, class_accuracies
 
-def evaluate_model(model, test_loader, device):
+def evaluate_model(model, test_loader, device, use_amp: bool = False):
     """최종 모델 평가"""
     model.eval()
-    correct = 0
-    total = 0
     
-    # 클래스별 정확도 추적
-    class_correct = [0] * len(GESTURE_CLASSES)
-    class_total = [0] * len(GESTURE_CLASSES)
+    # 클래스별 정확도 추적 (디바이스 텐서로 누적)
+    class_correct = torch.zeros(len(GESTURE_CLASSES), dtype=torch.long, device=device)
+    class_total = torch.zeros(len(GESTURE_CLASSES), dtype=torch.long, device=device)
     
-    with torch.no_grad():
+    with torch.inference_mode():
         for data, target in test_loader:
-            data, target = data.to(device), target.to(device)
-            output = model(data)
+            data, target = data.to(device, non_blocking=True), target.to(device, non_blocking=True)
+            with torch.autocast(device_type=device.type, dtype=torch.bfloat16, enabled=use_amp):
+                output = model(data)
             pred = output.argmax(dim=1)
-            correct += pred.eq(target).sum().item()
-            total += target.size(0)
-            
-            # 클래스별 정확도
-            for i in range(target.size(0)):
-                label = target[i].item()
-                class_correct[label] += (pred[i] == target[i]).item()
-                class_total[label] += 1
+            accumulate_class_counts(pred, target, class_correct, class_total)
+    
+    class_correct = class_correct.cpu().tolist()
+    class_total = class_total.cpu().tolist()
+    correct = sum(class_correct)
+    total = sum(class_total)
     
     overall_accuracy = correct / total
     
@@ -94,22 +94,36 @@ class MetricsTracker:
         print(f"메트릭 저장 완료: {metrics_file}")
 
 def evaluate_model(model, test_loader, device):
-    """모델 평가"""
+    """모델 평가
+    
+    test_loader는 pin_memory=True (워커 사용 시 persistent_workers=True)로 만들어야
+    non_blocking 전송이 연산과 겹쳐 실행됨 (dataset.create_dataloaders 참고)
+    """
     from sklearn.metrics import classification_report, confusion_matrix
     from config import GESTURE_CLASSES
     
     model.eval()
-    all_preds = []
-    all_labels = []
     
-    with torch.no_grad():
+    # 예측/정답은 미리 할당한 배열에 배치 단위로 채움 (numpy 스칼라 리스트를 만들지 않음)
+    num_samples = len(test_loader.dataset)
+    all_preds = np.empty(num_samples, dtype=np.int64)
+    all_labels = np.empty(num_samples, dtype=np.int64)
+    offset = 0
+    
+    with torch.inference_mode():
         for data, target in test_loader:
-            data, target = data.to(device), target.to(device)
+            data, target = data.to(device, non_blocking=True), target.to(device, non_blocking=True)
             output = model(data)
             pred = output.argmax(dim=1)
             
-            all_preds.extend(pred.cpu().numpy())
-            all_labels.extend(target.cpu().numpy())
+            batch_size = target.size(0)
+            all_preds[offset:offset + batch_size] = pred.cpu().numpy()
+            all_labels[offset:offset + batch_size] = target.cpu().numpy()
+            offset += batch_size
+    
+    # drop_last 등으로 데이터셋보다 적게 나온 경우 채운 부분만 사용
+    all_preds = all_preds[:offset]
+    all_labels = all_labels[:offset]
     
     # 분류 리포트
     target_names = [GESTURE_CLASSES[i] for i in range(len(GESTURE_CLASSES))]
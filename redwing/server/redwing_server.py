@@ -5,6 +5,7 @@ GUI를 서버로 전환하여 여러 클라이언트들이 연결할 수 있도
 """
 
 import socket
+import struct
 import threading
 import json
 import time
@@ -13,6 +14,12 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from queue import Queue
 
+# PDS 바이너리 이벤트 프레임: 매직(0x01) | 본문 길이(1바이트) | 본문 (JSON 줄은 '{'로 시작)
+BINARY_FRAME_MAGIC = 0x01
+BINARY_EVENT_GESTURE = 1
+GESTURE_EVENT_STRUCT = struct.Struct('!BBf')  # (이벤트 종류, 제스처 클래스 인덱스, 신뢰도)
+BINARY_GESTURE_NAMES = ['STOP', 'MOVE_FORWARD', 'TURN_LEFT', 'TURN_RIGHT']  # PDS GESTURE_CLASSES 순서
+
 class RedWingGUIServer:
     """RedWing GUI 서버 - 클라이언트들이 연결할 수 있는 중앙 서버"""
     
@@ -121,34 +128,76 @@ class RedWingGUIServer:
         """개별 클라이언트 처리"""
         client_socket = client_info['socket']
         address = client_info['address']
-        buffer = ""
+        buffer = bytearray()  # 완전한 프레임이 모일 때까지 바이트로 보관 (멀티바이트 문자 분할 안전)
         
         try:
             # PDS 서버가 아닌 경우에만 환영 메시지 전송
             # (PDS는 시스템 메시지로 등록하므로 welcome 불필요)
             
             while self.is_running:
-                data = client_socket.recv(4096).decode('utf-8')
+                data = client_socket.recv(4096)
                 if not data:
                     break
                 
                 buffer += data
                 
-                # 메시지 분할 처리
-                while '\n' in buffer:
-                    message, buffer = buffer.split('\n', 1)
-                    if message.strip():
-                        self._process_client_message(client_info, message.strip())
+                # 메시지 분할 처리 (JSON 줄 또는 바이너리 프레임)
+                for message in self._split_frames(buffer):
+                    self._process_client_message(client_info, message)
                         
         except Exception as e:
             self.logger.error(f"클라이언트 처리 오류 {address}: {e}")
         finally:
             self._disconnect_client(client_info)
     
-    def _process_client_message(self, client_info: Dict, message: str):
-        """클라이언트 메시지 처리"""
+    def _split_frames(self, buffer: bytearray) -> List[Any]:
+        """버퍼에서 완전한 메시지를 꺼냄 (JSON 줄은 문자열, 바이너리 프레임은 디코딩된 dict)"""
+        messages = []
+        start = 0
+        while start < len(buffer):
+            if buffer[start] == BINARY_FRAME_MAGIC:
+                if len(buffer) - start < 2:
+                    break
+                end = start + 2 + buffer[start + 1]
+                if len(buffer) < end:
+                    break
+                event = self._decode_binary_frame(bytes(buffer[start + 2:end]))
+                if event is not None:
+                    messages.append(event)
+                start = end  # 뒤따르는 개행은 빈 줄로 처리되어 무시됨
+            else:
+                newline = buffer.find(b'\n', start)
+                if newline < 0:
+                    break
+                message = buffer[start:newline].decode('utf-8').strip()
+                if message:
+                    messages.append(message)
+                start = newline + 1
+        del buffer[:start]
+        return messages
+    
+    def _decode_binary_frame(self, body: bytes) -> Optional[Dict]:
+        """PDS 바이너리 제스처 이벤트를 JSON 이벤트와 같은 dict로 변환"""
+        if len(body) != GESTURE_EVENT_STRUCT.size:
+            self.logger.warning(f"알 수 없는 바이너리 프레임 길이: {len(body)}")
+            return None
+        
+        event_type, gesture_idx, confidence = GESTURE_EVENT_STRUCT.unpack(body)
+        if event_type != BINARY_EVENT_GESTURE or gesture_idx >= len(BINARY_GESTURE_NAMES):
+            self.logger.warning(f"알 수 없는 바이너리 이벤트: type={event_type}, gesture={gesture_idx}")
+            return None
+        
+        return {
+            "type": "event",
+            "event": "MARSHALING_GESTURE_DETECTED",
+            "result": BINARY_GESTURE_NAMES[gesture_idx],
+            "confidence": confidence
+        }
+    
+    def _process_client_message(self, client_info: Dict, message):
+        """클라이언트 메시지 처리 (JSON 문자열 또는 바이너리 프레임에서 디코딩된 dict)"""
         try:
-            data = json.loads(message)
+            data = message if isinstance(message, dict) else json.loads(message)
             msg_type = data.get('type')
             
             self.logger.info(f"📨 클라이언트 메시지: {client_info['address']} - {msg_type}")
@@ -442,19 +491,26 @@ class RedWingGUIServer:
             return False
         
         try:
-            message = json.dumps(data) + '\n'
-            self.main_server_socket.send(message.encode('utf-8'))
+            message = (json.dumps(data) + '\n').encode('utf-8')
+            self.main_server_socket.sendall(message)
             return True
         except Exception as e:
             self.logger.error(f"Main Server 전달 오류: {e}")
             self.main_server_connected = False
             return False
     
+    def _encode_message(self, data: Dict) -> bytes:
+        """개행으로 끝나는 JSON 프레임으로 인코딩"""
+        return (json.dumps(data, ensure_ascii=False) + '\n').encode('utf-8')
+    
     def _send_to_client(self, client_socket, data: Dict):
         """특정 클라이언트에게 메시지 전송"""
+        return self._send_message_to_client(client_socket, self._encode_message(data))
+    
+    def _send_message_to_client(self, client_socket, message: bytes):
+        """인코딩된 프레임 전송 (sendall로 부분 전송 없이 한 줄 전체를 보냄)"""
         try:
-            message = json.dumps(data, ensure_ascii=False) + '\n'
-            client_socket.send(message.encode('utf-8'))
+            client_socket.sendall(message)
             return True
         except Exception as e:
             self.logger.error(f"클라이언트 전송 오류: {e}")
@@ -462,19 +518,21 @@ class RedWingGUIServer:
     
     def _broadcast_to_clients(self, data: Dict):
         """모든 클라이언트에게 브로드캐스트"""
+        message = self._encode_message(data)  # 수신자마다 다시 인코딩하지 않음
         with self.client_lock:
             for client_info in list(self.clients):
-                if not self._send_to_client(client_info['socket'], data):
+                if not self._send_message_to_client(client_info['socket'], message):
                     # 전송 실패한 클라이언트 제거
                     self._disconnect_client(client_info)
     
     def _broadcast_to_non_pds_clients(self, data: Dict):
         """PDS가 아닌 클라이언트들에게만 브로드캐스트"""
+        message = self._encode_message(data)
         with self.client_lock:
             for client_info in list(self.clients):
                 # PDS 서버가 아닌 클라이언트에게만 전송
                 if client_info.get('client_type') != 'pds_server':
-                    if not self._send_to_client(client_info['socket'], data):
+                    if not self._send_message_to_client(client_info['socket'], message):
                         # 전송 실패한 클라이언트 제거
                         self._disconnect_client(client_info)
     